@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Exposure Vintages in One Pass
+========================================
+
+Times attaching N AI exposure vintages to the panel (see
+update_ai_exposure_scores.py --vintages) in one pass - one read of the panel
+keys, one occupation dimension, one sparse product for all ISCO-keyed
+vintages, one sidecar write - against one run per vintage.
+
+Vintages beyond the ones in data/reference/ are synthetic copies of ILO
+WP140 with noise, written to a temporary reference directory; the sidecar
+is written to a temporary file, so the real sidecar is not touched.
+
+Usage:
+    python scripts/benchmark_exposure_vintages.py [--max-vintages 16] [--scale 10]
+
+--scale tiles the panel keys to that many copies after reading, to time
+the row-level steps on a larger panel.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+import panel_io
+import score_registry
+from occupation_dimension import KEY_COLUMNS, attach_occupation_scores
+from update_ai_exposure_scores import exposure_vintage_tables, load_crosswalk
+
+# Largest number of vintages timed (--max-vintages N)
+MAX_VINTAGES = 16
+if '--max-vintages' in sys.argv:
+    MAX_VINTAGES = max(1, int(sys.argv[sys.argv.index('--max-vintages') + 1]))
+
+# Copies of the panel keys (--scale K)
+SCALE = 1
+if '--scale' in sys.argv:
+    SCALE = max(1, int(sys.argv[sys.argv.index('--scale') + 1]))
+
+# Repetitions per measurement (the minimum is reported)
+REPEATS = 3
+
+
+def write_synthetic_vintages(reference_dir, n):
+    """
+    Write n synthetic ISCO vintages (WP140 plus noise) to a reference directory.
+
+    Returns:
+        list: Vintage names
+    """
+    base = score_registry.load_score_table('ilo_exposure', 'wp140')
+    rng = np.random.default_rng(0)
+    names = []
+    for i in range(n):
+        name = f'bench{i:02d}'
+        table = base.copy()
+        table['Score'] = (table['Score'] + rng.normal(0, 0.03, len(table))).clip(0, 1).round(3)
+        table.to_csv(reference_dir / f'ilo_exposure_{name}.csv', index=False)
+        names.append(name)
+    return names
+
+
+def attach_and_store(names, crosswalk_df):
+    """One update pass: read keys, attach the vintages, write the sidecar."""
+    panel = panel_io.read_panel(columns=KEY_COLUMNS + ['Employment'], scores=False)
+    if SCALE > 1:
+        panel = pd.concat([panel] * SCALE, ignore_index=True)
+
+    context = {'exposure_vintage_tables': exposure_vintage_tables(names, crosswalk_df)}
+    panel, dim = attach_occupation_scores(panel, sources=['exposure_vintages'], context=context)
+    columns = [col for table in context['exposure_vintage_tables'] for col in table.columns]
+    panel_io.write_score_sidecar(dim, columns)
+    return len(panel)
+
+
+def best_time(func, *args):
+    """Minimum wall time of REPEATS calls."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Main execution function."""
+    print("=" * 80)
+    print("BENCHMARK: EXPOSURE VINTAGES IN ONE PASS")
+    print("=" * 80)
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix='vintage_bench_'))
+    try:
+        shutil.copytree(score_registry.REFERENCE_DIR, tmp_dir / 'reference')
+        score_registry.REFERENCE_DIR = tmp_dir / 'reference'
+        score_registry.clear_cache()
+        panel_io.SCORES_SIDECAR_PATH = tmp_dir / 'occupation_scores.parquet'
+
+        names = ['wp140', 'wp96'] + write_synthetic_vintages(score_registry.REFERENCE_DIR, MAX_VINTAGES - 2)
+        crosswalk_df = load_crosswalk()
+        n_rows = attach_and_store(names[:1], crosswalk_df)  # warm caches
+        print(f"Panel rows per pass: {n_rows:,} (scale {SCALE})\n")
+
+        counts = sorted({1, 2} | {n for n in (4, 8, 16, 32, 64) if n <= MAX_VINTAGES} | {MAX_VINTAGES})
+        single = best_time(attach_and_store, names[:1], crosswalk_df)
+
+        results = []
+        for n in counts:
+            one_pass = best_time(attach_and_store, names[:n], crosswalk_df)
+            results.append({
+                'Vintages': n,
+                'One_Pass_s': round(one_pass, 3),
+                'Per_Vintage_Runs_s': round(single * n, 3),
+                'One_Pass_vs_1': round(one_pass / single, 2),
+            })
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print("\n" + "=" * 80)
+    print("RESULTS (Per_Vintage_Runs_s = vintages × the one-vintage pass)")
+    print("=" * 80)
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
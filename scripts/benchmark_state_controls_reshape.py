@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: State Controls Long -> Wide Reshape
+==============================================
+
+Times fetch_state_controls.reshape_and_calculate (value matrix filled from
+the long columns) against the previous pivot_table(aggfunc='first') path on
+synthetic LAUS data: N areas × 4 measures × monthly observations
+2015-2025, from the 52 state-level units up to county-level area counts.
+
+Usage:
+    python scripts/benchmark_state_controls_reshape.py [--max-areas 3200]
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from fetch_state_controls import SERIES_SUFFIXES, reshape_and_calculate
+
+# Largest number of areas timed (--max-areas N; ~3,200 US counties)
+MAX_AREAS = 3200
+if '--max-areas' in sys.argv:
+    MAX_AREAS = max(1, int(sys.argv[sys.argv.index('--max-areas') + 1]))
+
+# Repetitions per measurement (the minimum is reported)
+REPEATS = 3
+
+# Months covered (2015-01 to 2025-12)
+MONTHS = pd.date_range('2015-01-01', '2025-12-01', freq='MS')
+
+
+def synthetic_long(n_areas, seed=0):
+    """Long-format LAUS frame (like parse_laus_results output) for n areas."""
+    rng = np.random.default_rng(seed)
+    variables = list(SERIES_SUFFIXES)
+    n = n_areas * len(variables) * len(MONTHS)
+
+    area = np.repeat(np.arange(n_areas), len(variables) * len(MONTHS))
+    variable = np.tile(np.repeat(np.arange(len(variables)), len(MONTHS)), n_areas)
+    date = np.tile(MONTHS.to_numpy(), n_areas * len(variables))
+    names = np.array([f'Area {i:05d}' for i in range(n_areas)], dtype=object)
+
+    return pd.DataFrame({
+        'Date': date,
+        'Year': pd.DatetimeIndex(date).year.to_numpy(),
+        'Month': pd.DatetimeIndex(date).month.to_numpy(),
+        'State': pd.Categorical.from_codes(area, categories=names),
+        'Variable': pd.Categorical.from_codes(variable, categories=variables),
+        'Value': rng.uniform(1, 1e6, n),
+    })
+
+
+def reshape_pivot_table(df):
+    """
+    Previous reshape: pivot_table(aggfunc='first'), then LFPR and sort.
+
+    Takes object State/Variable columns, as the previous parser produced.
+    """
+    df_wide = df.pivot_table(index=['Date', 'Year', 'Month', 'State'], columns='Variable',
+                             values='Value', aggfunc='first').reset_index()
+    df_wide['lfpr'] = (df_wide['labor_force'] / df_wide['population']) * 100
+    return df_wide.sort_values(['Date', 'State']).reset_index(drop=True)
+
+
+def best_time(func, *args):
+    """Minimum wall time of REPEATS calls."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Main execution function."""
+    print("=" * 80)
+    print("BENCHMARK: STATE CONTROLS LONG -> WIDE RESHAPE")
+    print("=" * 80)
+
+    counts = sorted({n for n in (52, 200, 800, 3200) if n <= MAX_AREAS} | {MAX_AREAS})
+    results = []
+    for n_areas in counts:
+        df = synthetic_long(n_areas)
+        matrix = best_time(reshape_and_calculate, df)
+        pivot = best_time(reshape_pivot_table, df.astype({'State': object, 'Variable': object}))
+        wide = reshape_and_calculate(df)
+        results.append({
+            'Areas': n_areas,
+            'Long_Rows': len(df),
+            'Matrix_s': round(matrix, 3),
+            'Pivot_Table_s': round(pivot, 3),
+            'Matrix_us_per_Row': round(matrix / len(df) * 1e6, 3),
+            'Speedup': round(pivot / matrix, 1),
+            'Long_MB': round(df.memory_usage(deep=True).sum() / 1024 ** 2, 1),
+            'Wide_MB': round(wide.memory_usage(deep=True).sum() / 1024 ** 2, 1),
+        })
+
+    print("\n" + "=" * 80)
+    print("RESULTS (Matrix_us_per_Row flat = linear scaling)")
+    print("=" * 80)
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+BLS Public Data API Client
+==========================
+
+Concurrent, quota-aware client for the BLS timeseries API (v2):
+
+- Requests are planned as batches of at most the per-query series and year
+  limits (50 series / 20 years with a registration key, 25 / 10 without)
+- A sliding-window limiter keeps the request rate under the API threshold
+  (at most 50 requests in any 10 seconds, including a cold start), shared
+  by all worker threads
+- One pooled requests.Session (keep-alive, retries on connection errors
+  and 429/5xx, see downloader.make_session)
+- REQUEST_NOT_PROCESSED responses are retried with exponential backoff
+  (except when the daily quota is exhausted)
+- Each finished batch is checkpointed to a JSON file, so an interrupted run
+  resumes with the missing batches only
+- Successful responses go through the shared on-disk HTTP cache
+  (http_cache.py), so reruns within its TTL, and offline runs, make no
+  requests
+
+The endpoint is taken from the BLS_API_URL environment variable if set,
+so the client can be pointed at a local mock server in tests.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+import requests
+
+import http_cache
+from downloader import make_session
+
+# Default endpoint (override with the BLS_API_URL environment variable)
+DEFAULT_BLS_API_URL = 'https://api.bls.gov/publicAPI/v2/timeseries/data/'
+
+# Per-query and daily limits (https://www.bls.gov/developers/api_faqs.htm)
+REGISTERED_LIMITS = {'series': 50, 'years': 20, 'daily_queries': 500}
+PUBLIC_LIMITS = {'series': 25, 'years': 10, 'daily_queries': 25}
+
+# Request rate threshold: at most 50 requests per 10 seconds
+RATE_LIMIT_REQUESTS = 50
+RATE_LIMIT_SECONDS = 10
+
+# Defaults
+DEFAULT_WORKERS = 4
+TIMEOUT = 60  # seconds
+MAX_ATTEMPTS = 5  # per batch, for REQUEST_NOT_PROCESSED responses
+BACKOFF_SECONDS = 2.0  # first retry delay, doubled on every retry
+
+
+class BLSRequestError(Exception):
+    """Raised when the API rejects a request or keeps refusing to process it."""
+
+
+class SlidingWindowLimiter:
+    """
+    Thread-safe sliding-window rate limiter.
+
+    Allows at most `max_requests` calls to acquire() in any `window`
+    seconds: the start times of recent requests are kept, and a request
+    waits until the oldest one is more than `window` seconds old.
+    """
+
+    def __init__(self, max_requests, window):
+        self.max_requests = max_requests
+        self.window = window
+        self.starts = deque()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Record one request, sleeping until the window has room for it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                while self.starts and now - self.starts[0] >= self.window:
+                    self.starts.popleft()
+                if len(self.starts) < self.max_requests:
+                    self.starts.append(now)
+                    return
+                wait = self.window - (now - self.starts[0])
+            time.sleep(wait)
+
+
+def bls_api_url():
+    """API endpoint (BLS_API_URL environment variable, else the public API)."""
+    return os.getenv('BLS_API_URL', DEFAULT_BLS_API_URL)
+
+
+def api_limits(api_key=None):
+    """Per-query and daily limits for requests with or without a key."""
+    return REGISTERED_LIMITS if api_key else PUBLIC_LIMITS
+
+
+def make_rate_limiter():
+    """Sliding-window limiter matching the API request rate threshold."""
+    return SlidingWindowLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_SECONDS)
+
+
+def request_succeeded(response):
+    """Whether an API response holds results (only those are cached)."""
+    try:
+        return response.ok and response.json().get('status') == 'REQUEST_SUCCEEDED'
+    except ValueError:
+        return False
+
+
+def plan_batches(series_ids, start_year, end_year, limits):
+    """
+    Split a request into batches within the per-query limits.
+
+    Args:
+        series_ids (list): Series IDs
+        start_year (int): First year
+        end_year (int): Last year
+        limits (dict): Output of api_limits()
+
+    Returns:
+        list: Dicts with 'key' (stable checkpoint name), 'series',
+            'start_year' and 'end_year'
+    """
+    start_year, end_year = int(start_year), int(end_year)
+    windows = [(year, min(year + limits['years'] - 1, end_year))
+               for year in range(start_year, end_year + 1, limits['years'])]
+
+    batches = []
+    for i in range(0, len(series_ids), limits['series']):
+        chunk = list(series_ids[i:i + limits['series']])
+        digest = hashlib.sha1('\n'.join(chunk).encode()).hexdigest()[:12]
+        for first, last in windows:
+            batches.append({'key': f'{first}-{last}_{digest}', 'series': chunk,
+                            'start_year': first, 'end_year': last})
+    return batches
+
+
+def post_batch(session, batch, api_key=None, url=None, limiter=None, timeout=TIMEOUT,
+               max_attempts=MAX_ATTEMPTS):
+    """
+    Fetch one batch, retrying REQUEST_NOT_PROCESSED with exponential backoff.
+
+    Args:
+        session (requests.Session): Pooled session
+        batch (dict): One entry of plan_batches()
+        api_key (str): BLS registration key (optional)
+        url (str): API endpoint (default: bls_api_url())
+        limiter (SlidingWindowLimiter): Rate limiter shared by all workers (optional)
+        timeout (int): Request timeout in seconds
+        max_attempts (int): Attempts before giving up
+
+    Returns:
+        dict: Series ID -> list of data points
+
+    Raises:
+        requests.RequestException: On HTTP/network errors
+        BLSRequestError: If the API rejects the request
+    """
+    payload = {
+        'seriesid': batch['series'],
+        'startyear': str(batch['start_year']),
+        'endyear': str(batch['end_year']),
+    }
+    if api_key:
+        payload['registrationkey'] = api_key
+
+    for attempt in range(max_attempts):
+        response = http_cache.cached_post(
+            url or bls_api_url(), json=payload, timeout=timeout, session=session,
+            cache_if=request_succeeded,
+            before_request=limiter.acquire if limiter is not None else None)
+        response.raise_for_status()
+        data = response.json()
+
+        status = data.get('status')
+        message = '; '.join(data.get('message') or []) or 'no message'
+        if status == 'REQUEST_SUCCEEDED':
+            return {series['seriesID']: series['data'] for series in data['Results']['series']}
+        if status != 'REQUEST_NOT_PROCESSED' or 'daily threshold' in message.lower():
+            raise BLSRequestError(f"{status}: {message}")
+
+        if attempt + 1 < max_attempts:
+            time.sleep(BACKOFF_SECONDS * 2 ** attempt * (1 + random.random()))
+
+    raise BLSRequestError(f"REQUEST_NOT_PROCESSED after {max_attempts} attempts: {message}")
+
+
+def load_checkpoint(checkpoint_dir, key):
+    """Results of a finished batch, or None if it has no checkpoint."""
+    if checkpoint_dir is None:
+        return None
+    path = Path(checkpoint_dir) / f'{key}.json'
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(checkpoint_dir, key, results):
+    """Write the results of a finished batch (atomically)."""
+    if checkpoint_dir is None:
+        return
+    checkpoint_dir = Path(checkpoint_dir)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = checkpoint_dir / f'{key}.json.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(results, f)
+    os.replace(tmp_path, checkpoint_dir / f'{key}.json')
+
+
+def fetch_series(series_ids, start_year, end_year, api_key=None, url=None,
+                 max_workers=DEFAULT_WORKERS, checkpoint_dir=None, session=None, limiter=None):
+    """
+    Fetch many series concurrently within the API limits.
+
+    Args:
+        series_ids (list): Series IDs
+        start_year (int): First year
+        end_year (int): Last year
+        api_key (str): BLS registration key (optional, raises the limits)
+        url (str): API endpoint (default: bls_api_url())
+        max_workers (int): Concurrent requests
+        checkpoint_dir (Path): Directory for per-batch checkpoints (optional)
+        session (requests.Session): Existing session (default: a new pooled one)
+        limiter (SlidingWindowLimiter): Rate limiter (default: make_rate_limiter())
+
+    Returns:
+        tuple: (series ID -> list of data points over all years, batch key ->
+            error message for batches that failed)
+    """
+    limits = api_limits(api_key)
+    batches = plan_batches(series_ids, start_year, end_year, limits)
+    if len(batches) > limits['daily_queries']:
+        print(f"  Warning: {len(batches)} requests exceed the daily quota of {limits['daily_queries']}")
+
+    batch_results = {}
+    for batch in batches:
+        cached = load_checkpoint(checkpoint_dir, batch['key'])
+        if cached is not None:
+            batch_results[batch['key']] = cached
+    pending = [batch for batch in batches if batch['key'] not in batch_results]
+    if batch_results:
+        print(f"  {len(batch_results)} of {len(batches)} batches restored from checkpoints")
+
+    own_session = session is None
+    if own_session:
+        session = make_session(pool_size=max_workers, methods=('GET', 'HEAD', 'POST'))
+    limiter = limiter or make_rate_limiter()
+
+    failures = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(post_batch, session, batch, api_key, url, limiter): batch
+                       for batch in pending}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    results = future.result()
+                    save_checkpoint(checkpoint_dir, batch['key'], results)
+                    batch_results[batch['key']] = results
+                    print(f"    ✓ {len(batch['series'])} series, {batch['start_year']}-{batch['end_year']}", flush=True)
+                except (requests.RequestException, BLSRequestError, ValueError) as e:
+                    failures[batch['key']] = str(e)
+                    print(f"    ✗ {len(batch['series'])} series, {batch['start_year']}-{batch['end_year']}: {e}", flush=True)
+    finally:
+        if own_session:
+            session.close()
+
+    # Merge year windows in plan order
+    data = {}
+    for batch in batches:
+        for series_id, points in batch_results.get(batch['key'], {}).items():
+            data.setdefault(series_id, []).extend(points)
+    return data, failures
@@ -15,12 +15,14 @@ Panel Structure:
 - Occupation (SOC codes, ~800 detailed occupations)
 - Year (2015-2024, annual May reference period)
 
-Output: data/occupation_panel.csv
+Output: data/occupation_panel/ (Parquet, partitioned by Year)
+        data/occupation_panel.csv (optional, with --csv)
 
 Author: SS154 Final Project
 Date: December 2025
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -29,36 +31,278 @@ import numpy as np
 from datetime import datetime
 import json
 import time
+import hashlib
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from openpyxl import load_workbook
+
+from panel_io import (PANEL_CSV_PATH, PANEL_DATASET_DIR, begin_dataset_write, describe_dataset,
+                      discard_score_sidecar, finish_dataset_write, stringify_object_columns,
+                      write_panel, write_panel_partition)
+from occupation_dimension import attach_occupation_scores
+from panel_schema import SCORE_COLUMNS
+from soc_crosswalk import CROSSWALK_PATH
 
 # Configuration
 OES_RAW_DIR = Path(__file__).parent.parent / 'data' / 'oes_raw'
 OUTPUT_DIR = Path(__file__).parent.parent / 'data'
 
-# Test mode: set to True to process only one year for testing
-TEST_MODE = '--test' in sys.argv
-if TEST_MODE:
-    YEARS = [2024]  # Process only 2024 for testing
-    print("*** TEST MODE: Processing only 2024 ***", flush=True)
-else:
-    YEARS = range(2015, 2025)  # 2015-2024
+# Parsed-year cache: each year's parse_oes_dataframe output is stored as
+# Parquet and reused until the source workbook, COLUMN_ALIASES or the Excel
+# reader (--full-read) change; --no-cache turns it off
+CACHE_DIR = OES_RAW_DIR / '.cache'
+CACHE_VERSION = 1
+USE_CACHE = True
+
+# Years processed (--test: only 2024)
+TEST_MODE = False
+YEARS = range(2015, 2025)  # 2015-2024
+
+# Parallel loading: --workers N reads N yearly workbooks at once in separate
+# processes (default 1 = sequential, as before)
+WORKERS = 1
+
+# Chunked mode (--chunked): each year is cleaned, treated and appended to the
+# output on its own, so peak memory is set by the largest single year (with
+# --workers N, by at most N years parsed or pending at once)
+CHUNKED_MODE = False
+
+# The panel is written as Parquet partitioned by Year; --csv also exports
+# the flat data/occupation_panel.csv
+EXPORT_CSV = False
+
+# Column-name aliases used to standardize OES files (names vary by year).
+# Raw column names are lower-cased and stripped before lookup.
+COLUMN_ALIASES = {
+    # State columns
+    'State_Code': ['area', 'st', 'state', 'area_fips', 'st_fips'],
+    'State': ['area_name', 'state_name', 'area_title', 'st_name'],
+    # Industry columns
+    'Industry_Code': ['naics', 'i_group', 'industry', 'naics_code'],
+    'Industry': ['naics_title', 'industry_title', 'naics_desc', 'i_group_title'],
+    # Occupation columns
+    'Occupation_Code': ['occ_code', 'occ code', 'prim_state', 'o_group'],
+    'Occupation': ['occ_title', 'occ title', 'occupation_title', 'o_group_title'],
+    # Employment
+    'Employment': ['tot_emp', 'total_emp', 'employment', 'emp', 'jobs_1000'],
+    # Wages
+    'Annual_Mean_Wage': ['a_mean', 'annual_mean', 'mean_annual', 'a_mean_wage'],
+    'Hourly_Mean_Wage': ['h_mean', 'hourly_mean', 'mean_hourly', 'h_mean_wage'],
+}
+
+# Excel reader: stream the first sheet through openpyxl in read-only mode and
+# keep only the columns named in COLUMN_ALIASES (--full-read restores the old
+# pd.read_excel path that materializes every column)
+STREAMING_READER = True
+STREAM_CHUNK_ROWS = 250_000
+
+# Cell strings treated as missing, as pd.read_excel does by default
+EXCEL_NA_STRINGS = ['', '#N/A', 'N/A', 'NA', 'NULL', 'NaN', 'nan']
+
+# Fixed output column order, in the order the build steps add them (both
+# modes write this schema, even if a workbook lacks one of the mapped
+# columns or orders them differently)
+PANEL_COLUMNS = (list(COLUMN_ALIASES) + ['Year', 'LogEmployment', 'Post'] + SCORE_COLUMNS
+                 + ['Occupation_Code_2010', 'Teleworkable'])
 
 # Treatment definition
 CHATGPT_RELEASE_YEAR = 2022  # Nov 2022, so 2023 is first full post-treatment year
 POST_TREATMENT_YEAR = 2023
 
-print("="*70)
-print("OCCUPATION-LEVEL PANEL CONSTRUCTION")
-print("="*70)
-print(f"Source: BLS OES Research Estimates (State × Industry × Occupation)")
-print(f"Years: {min(YEARS)}-{max(YEARS)} (May reference period)")
-print(f"Treatment: Post = 1 if Year >= {POST_TREATMENT_YEAR}")
-print("="*70)
+
+def parse_options(argv=None):
+    """
+    Set the run options above from the command line.
+    
+    Called from main() only, so worker processes (which re-import this
+    module under spawn/forkserver) do not parse argv again; they get the
+    options they need through init_worker(). Invalid options exit with a
+    usage message.
+    
+    Args:
+        argv (list): Command-line arguments without the program name
+            (default: sys.argv[1:])
+    """
+    global USE_CACHE, TEST_MODE, YEARS, WORKERS, CHUNKED_MODE, EXPORT_CSV, STREAMING_READER
+    
+    def worker_count(value):
+        if not value.isdigit() or int(value) < 1:
+            raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+        return int(value)
+    
+    parser = argparse.ArgumentParser(description="Build the occupation-level panel from BLS OES data.")
+    parser.add_argument('--test', action='store_true', help="process only 2024")
+    parser.add_argument('--workers', type=worker_count, default=1, metavar='N',
+                        help="parse N yearly workbooks at once in separate processes (default 1)")
+    parser.add_argument('--chunked', action='store_true',
+                        help="clean and write one year at a time (bounded memory)")
+    parser.add_argument('--csv', action='store_true', help="also export data/occupation_panel.csv")
+    parser.add_argument('--no-cache', action='store_true', help="ignore the parsed-year cache")
+    parser.add_argument('--full-read', action='store_true',
+                        help="read whole sheets with pd.read_excel instead of streaming")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    
+    USE_CACHE = not args.no_cache
+    TEST_MODE = args.test
+    YEARS = [2024] if TEST_MODE else range(2015, 2025)
+    WORKERS = args.workers
+    CHUNKED_MODE = args.chunked
+    EXPORT_CSV = args.csv
+    STREAMING_READER = not args.full_read
+
+
+def init_worker(use_cache, streaming_reader):
+    """Copy the parent's cache and reader options into a worker process."""
+    global USE_CACHE, STREAMING_READER
+    USE_CACHE, STREAMING_READER = use_cache, streaming_reader
+
+
+def print_banner():
+    """Print the run configuration."""
+    print("="*70)
+    print("OCCUPATION-LEVEL PANEL CONSTRUCTION")
+    print("="*70)
+    if TEST_MODE:
+        print("*** TEST MODE: Processing only 2024 ***", flush=True)
+    print(f"Source: BLS OES Research Estimates (State × Industry × Occupation)")
+    print(f"Years: {min(YEARS)}-{max(YEARS)} (May reference period)")
+    print(f"Treatment: Post = 1 if Year >= {POST_TREATMENT_YEAR}")
+    print(f"Workers: {WORKERS}")
+    print(f"Mode: {'chunked (one year in memory at a time)' if CHUNKED_MODE else 'full panel in memory'}")
+    print(f"Output: {PANEL_DATASET_DIR}{' + ' + str(PANEL_CSV_PATH) if EXPORT_CSV else ''}")
+    print(f"Parsed-year cache: {'on' if USE_CACHE else 'off'} ({CACHE_DIR})")
+    print(f"Excel reader: {'streaming (read-only, projected)' if STREAMING_READER else 'full pd.read_excel'}")
+    print("="*70)
+
+
+def resolve_projection(header):
+    """
+    Match a header row against COLUMN_ALIASES.
+    
+    Args:
+        header (tuple): Raw header cell values
+        
+    Returns:
+        list: (column index, raw column name) for every header cell that
+            maps to a standardized column. If nothing maps, all columns are
+            kept so that parse_oes_dataframe can report the unmapped file.
+    """
+    projection = []
+    for idx, col in enumerate(header):
+        col_lower = str(col).lower().strip()
+        if any(col_lower in aliases for aliases in COLUMN_ALIASES.values()):
+            projection.append((idx, col))
+    
+    if not projection:
+        projection = [(idx, col if col is not None else f"Unnamed: {idx}")
+                      for idx, col in enumerate(header)]
+    return projection
+
+
+def typed_chunk(rows, projection, year):
+    """
+    Build a DataFrame from a buffer of projected row tuples.
+    
+    Missing-value strings become NaN; other cells keep the values openpyxl
+    returned (numbers, text, or BLS suppression symbols such as '*').
+    
+    Args:
+        rows (list): Projected row tuples
+        projection (list): Output of resolve_projection()
+        year (int): Year to stamp on the chunk
+        
+    Returns:
+        pd.DataFrame: Chunk with the raw (projected) column names plus Year
+    """
+    chunk = pd.DataFrame.from_records(rows, columns=[col for _, col in projection])
+    
+    for col in chunk.columns:
+        if chunk[col].dtype == object:
+            chunk[col] = chunk[col].mask(chunk[col].isin(EXCEL_NA_STRINGS))
+    
+    chunk['Year'] = year
+    return chunk
+
+
+def infer_column_types(df):
+    """
+    Convert all-numeric object columns to numbers, as pd.read_excel does.
+    
+    Applied once per year rather than per chunk so that a code column is
+    typed the same way in every chunk (e.g. NAICS '000000' stays text if
+    any row in the year holds a non-numeric code such as '31-33').
+    
+    Args:
+        df (pd.DataFrame): Concatenated chunks for one year
+        
+    Returns:
+        pd.DataFrame: Same frame with numeric-only columns converted
+    """
+    for col in df.columns:
+        if df[col].dtype == object:
+            try:
+                df[col] = pd.to_numeric(df[col])
+            except (ValueError, TypeError):
+                pass
+    return df
+
+
+def iter_oes_chunks(filepath, year, chunk_rows=STREAM_CHUNK_ROWS):
+    """
+    Stream the first sheet of an OES workbook as projected chunks.
+    
+    The workbook is opened once in openpyxl read-only mode and rows are
+    pulled with iter_rows(values_only=True), so only the columns named in
+    COLUMN_ALIASES (not the dozens of wage percentiles) are ever held in
+    memory, and only chunk_rows of them at a time.
+    
+    Args:
+        filepath (Path): Source xlsx file
+        year (int): Year to stamp on each chunk
+        chunk_rows (int): Rows per yielded chunk
+        
+    Yields:
+        pd.DataFrame: Typed chunk (see typed_chunk)
+    """
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        
+        projection = resolve_projection(header)
+        indices = [idx for idx, _ in projection]
+        width = max(indices) + 1
+        
+        buffer = []
+        for row in rows:
+            if len(row) < width:
+                row = tuple(row) + (None,) * (width - len(row))
+            values = tuple(row[idx] for idx in indices)
+            # Skip blank rows (pd.read_excel trims these as well)
+            if all(value is None for value in values):
+                continue
+            buffer.append(values)
+            if len(buffer) >= chunk_rows:
+                yield typed_chunk(buffer, projection, year)
+                buffer = []
+        
+        if buffer:
+            yield typed_chunk(buffer, projection, year)
+    finally:
+        wb.close()
 
 
 def load_oes_file(year):
     """
     Load and parse a single BLS OES research estimates file.
     
+    By default the workbook is streamed (see iter_oes_chunks) and only the
+    mapped columns are kept; with --full-read the whole sheet is read with
+    pd.read_excel.
+    
     Args:
         year (int): Year to load
         
@@ -81,23 +325,36 @@ def load_oes_file(year):
         print(f"Reading Excel file (this may take 30-60 seconds for large files)...", flush=True)
         start_time = time.time()
         
-        # Read Excel file (may have multiple sheets)
-        xl_file = pd.ExcelFile(filepath, engine='openpyxl')
-        print(f"  ✓ Excel file opened in {time.time() - start_time:.1f}s", flush=True)
-        print(f"  Sheets found: {len(xl_file.sheet_names)}", flush=True)
-        
-        # Read first sheet
-        print(f"  Reading sheet: {xl_file.sheet_names[0]}...", flush=True)
-        read_start = time.time()
-        df = pd.read_excel(xl_file, sheet_name=0, engine='openpyxl')
-        print(f"  ✓ Sheet read in {time.time() - read_start:.1f}s", flush=True)
+        if STREAMING_READER:
+            print(f"  Streaming first sheet (read-only, projected columns)...", flush=True)
+            chunks = []
+            for chunk in iter_oes_chunks(filepath, year):
+                chunks.append(chunk)
+                print(f"  ... {sum(len(c) for c in chunks):,} rows", flush=True)
+            if not chunks:
+                print(f"ERROR: No rows found in {filepath.name}", flush=True)
+                return None
+            df = infer_column_types(pd.concat(chunks, ignore_index=True))
+            del chunks
+            print(f"  ✓ Sheet streamed in {time.time() - start_time:.1f}s", flush=True)
+        else:
+            # Read Excel file (may have multiple sheets)
+            xl_file = pd.ExcelFile(filepath, engine='openpyxl')
+            print(f"  ✓ Excel file opened in {time.time() - start_time:.1f}s", flush=True)
+            print(f"  Sheets found: {len(xl_file.sheet_names)}", flush=True)
+            
+            # Read first sheet
+            print(f"  Reading sheet: {xl_file.sheet_names[0]}...", flush=True)
+            read_start = time.time()
+            df = pd.read_excel(xl_file, sheet_name=0, engine='openpyxl')
+            print(f"  ✓ Sheet read in {time.time() - read_start:.1f}s", flush=True)
+            
+            # Add year
+            df['Year'] = year
         
         print(f"  Raw shape: {df.shape[0]:,} rows × {df.shape[1]} columns", flush=True)
         print(f"  Sample columns: {list(df.columns[:5])}", flush=True)
         
-        # Add year
-        df['Year'] = year
-        
         print(f"✓ Total time for {year}: {time.time() - start_time:.1f}s", flush=True)
         
         return df
@@ -139,32 +396,12 @@ def parse_oes_dataframe(df, year):
     
     # Try to identify key columns (column names vary by year)
     col_mapping = {}
-    
-    # State columns
     for col in df.columns:
         col_lower = str(col).lower().strip()
-        if col_lower in ['area', 'st', 'state', 'area_fips', 'st_fips']:
-            col_mapping['State_Code'] = col
-        elif col_lower in ['area_name', 'state_name', 'area_title', 'st_name']:
-            col_mapping['State'] = col
-        # Industry columns
-        elif col_lower in ['naics', 'i_group', 'industry', 'naics_code']:
-            col_mapping['Industry_Code'] = col
-        elif col_lower in ['naics_title', 'industry_title', 'naics_desc', 'i_group_title']:
-            col_mapping['Industry'] = col
-        # Occupation columns
-        elif col_lower in ['occ_code', 'occ code', 'prim_state', 'o_group']:
-            col_mapping['Occupation_Code'] = col
-        elif col_lower in ['occ_title', 'occ title', 'occupation_title', 'o_group_title']:
-            col_mapping['Occupation'] = col
-        # Employment
-        elif col_lower in ['tot_emp', 'total_emp', 'employment', 'emp', 'jobs_1000']:
-            col_mapping['Employment'] = col
-        # Wages
-        elif col_lower in ['a_mean', 'annual_mean', 'mean_annual', 'a_mean_wage']:
-            col_mapping['Annual_Mean_Wage'] = col
-        elif col_lower in ['h_mean', 'hourly_mean', 'mean_hourly', 'h_mean_wage']:
-            col_mapping['Hourly_Mean_Wage'] = col
+        for std_name, aliases in COLUMN_ALIASES.items():
+            if col_lower in aliases:
+                col_mapping[std_name] = col
+                break
     
     print(f"  Identified key columns: {list(col_mapping.keys())}", flush=True)
     
@@ -186,32 +423,211 @@ def parse_oes_dataframe(df, year):
     return df_clean
 
 
+def source_file_fingerprint(filepath):
+    """
+    Fingerprint a source workbook for cache validation.
+    
+    Args:
+        filepath (Path): Source xlsx file
+        
+    Returns:
+        dict: size, mtime and SHA-256 of the file contents, plus a hash of
+            the column-mapping rules, the Excel reader mode and the cache
+            format version
+    """
+    stat = filepath.stat()
+    content_hash = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            content_hash.update(block)
+    rules_hash = hashlib.sha256(json.dumps(COLUMN_ALIASES, sort_keys=True).encode()).hexdigest()
+    
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': content_hash.hexdigest(),
+        'column_rules_sha256': rules_hash,
+        'reader': 'streaming' if STREAMING_READER else 'full',
+        'cache_version': CACHE_VERSION,
+    }
+
+
+def load_cached_year(year, fingerprint):
+    """
+    Load a parsed year from the cache if its key matches.
+    
+    Args:
+        year (int): Year to load
+        fingerprint (dict): Current source_file_fingerprint() of the workbook
+        
+    Returns:
+        pd.DataFrame: Cached parsed data, or None on a cache miss
+    """
+    data_path = CACHE_DIR / f"oes_{year}.parquet"
+    key_path = CACHE_DIR / f"oes_{year}.json"
+    
+    if not data_path.exists() or not key_path.exists():
+        return None
+    
+    with open(key_path, 'r') as f:
+        cached_key = json.load(f)
+    if cached_key != fingerprint:
+        print(f"  Cache stale for {year} (source, column rules or reader changed)", flush=True)
+        return None
+    
+    try:
+        return pd.read_parquet(data_path)
+    except Exception as e:
+        print(f"  WARNING: Could not read cache for {year}: {e}", flush=True)
+        return None
+
+
+def store_cached_year(year, df, fingerprint):
+    """
+    Store a parsed year in the cache.
+    
+    Files are written under a temporary name and renamed so a crashed or
+    concurrent run never leaves a half-written entry behind.
+    
+    Args:
+        year (int): Year being stored
+        df (pd.DataFrame): Parsed data (already passed through stringify_object_columns)
+        fingerprint (dict): source_file_fingerprint() of the workbook
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    data_path = CACHE_DIR / f"oes_{year}.parquet"
+    key_path = CACHE_DIR / f"oes_{year}.json"
+    tmp_data = data_path.with_suffix(f".parquet.tmp{os.getpid()}")
+    tmp_key = key_path.with_suffix(f".json.tmp{os.getpid()}")
+    
+    try:
+        df.to_parquet(tmp_data, index=False)
+        with open(tmp_key, 'w') as f:
+            json.dump(fingerprint, f, indent=2)
+        os.replace(tmp_data, data_path)
+        os.replace(tmp_key, key_path)
+        print(f"  ✓ Cached parsed {year} to {data_path.name}", flush=True)
+    except Exception as e:
+        # Caching is an optimization only (e.g. pyarrow not installed)
+        print(f"  WARNING: Could not write cache for {year}: {e}", flush=True)
+        for tmp in (tmp_data, tmp_key):
+            if tmp.exists():
+                tmp.unlink()
+
+
+def load_and_parse_year(year):
+    """
+    Load and standardize a single year (runs inside a worker process
+    when --workers > 1).
+    
+    Uses the parsed-year cache when the source workbook, column rules and
+    reader mode are unchanged; otherwise reads the Excel file and refreshes
+    the cache. Object columns are stringified either way, so a year has the
+    same dtypes with or without the cache.
+    
+    Args:
+        year (int): Year to load
+        
+    Returns:
+        pd.DataFrame: Standardized data for the year, or None on failure
+    """
+    filepath = OES_RAW_DIR / f"oes_research_{year}_allsectors.xlsx"
+    fingerprint = None
+    
+    if USE_CACHE and filepath.exists():
+        fingerprint = source_file_fingerprint(filepath)
+        cached = load_cached_year(year, fingerprint)
+        if cached is not None:
+            print(f"  ✓ Loaded {year} from cache ({len(cached):,} rows)", flush=True)
+            return cached
+    
+    df = load_oes_file(year)
+    if df is None:
+        return None
+    df_clean = stringify_object_columns(parse_oes_dataframe(df, year))
+    
+    if fingerprint is not None:
+        store_cached_year(year, df_clean, fingerprint)
+    
+    return df_clean
+
+
+def iter_parsed_years(ordered=False):
+    """
+    Yield (year, standardized DataFrame) pairs as each year finishes.
+    
+    Sequential when WORKERS == 1. Otherwise each year is loaded and parsed
+    in its own process and results are yielded in completion order, so the
+    slowest workbook sets the total load time.
+    
+    Args:
+        ordered (bool): Yield in year order even with WORKERS > 1. At most
+            WORKERS years are submitted and not yet yielded; the next year is
+            submitted once the earliest one has been consumed, so finished
+            later years never pile up behind a slow one
+    
+    Yields:
+        tuple: (year, pd.DataFrame or None)
+    """
+    if WORKERS == 1:
+        for year in YEARS:
+            yield year, load_and_parse_year(year)
+        return
+    
+    n_workers = min(WORKERS, len(YEARS))
+    print(f"Loading with {n_workers} worker processes...", flush=True)
+    
+    def result(year, future):
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"ERROR in worker for {year}: {e}", flush=True)
+            return None
+    
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=init_worker,
+                             initargs=(USE_CACHE, STREAMING_READER)) as executor:
+        if not ordered:
+            futures = {executor.submit(load_and_parse_year, year): year for year in YEARS}
+            for future in as_completed(futures):
+                yield futures[future], result(futures[future], future)
+            return
+        
+        years = iter(YEARS)
+        pending = deque((year, executor.submit(load_and_parse_year, year))
+                        for year in islice(years, n_workers))
+        while pending:
+            year, future = pending.popleft()
+            yield year, result(year, future)
+            next_year = next(years, None)
+            if next_year is not None:
+                pending.append((next_year, executor.submit(load_and_parse_year, next_year)))
+
+
 def load_all_oes_data():
     """
     Load and combine all OES files (2015-2024).
     
     Returns:
-        pd.DataFrame: Combined panel data
+        pd.DataFrame: Combined panel data (rows in year order)
     """
-    all_data = []
+    all_data = {}
     total_start = time.time()
     
     print(f"\n{'='*70}", flush=True)
     print(f"LOADING ALL OES FILES ({len(YEARS)} files)", flush=True)
     print(f"{'='*70}", flush=True)
-    print(f"This will take approximately {len(YEARS) * 0.5}-{len(YEARS)} minutes...", flush=True)
+    if WORKERS == 1:
+        print(f"This will take approximately {len(YEARS) * 0.5}-{len(YEARS)} minutes...", flush=True)
     
-    for i, year in enumerate(YEARS, 1):
-        print(f"\n[{i}/{len(YEARS)}] Processing year {year}...", flush=True)
+    for i, (year, df_clean) in enumerate(iter_parsed_years(), 1):
+        print(f"\n[{i}/{len(YEARS)}] Finished year {year}", flush=True)
         
-        df = load_oes_file(year)
-        if df is not None:
-            df_clean = parse_oes_dataframe(df, year)
-            all_data.append(df_clean)
+        if df_clean is not None:
+            all_data[year] = df_clean
             print(f"  ✓ Added {len(df_clean):,} observations for {year}", flush=True)
             
             # Memory cleanup
-            del df, df_clean
+            del df_clean
             
             elapsed = time.time() - total_start
             avg_time = elapsed / i
@@ -225,10 +641,11 @@ def load_all_oes_data():
         print("\nERROR: No data loaded!", flush=True)
         return None
     
-    # Combine all years
+    # Combine all years (in year order regardless of completion order)
     print(f"\nCombining {len(all_data)} dataframes...", flush=True)
     combine_start = time.time()
-    panel = pd.concat(all_data, ignore_index=True)
+    panel = pd.concat([all_data[year] for year in sorted(all_data)], ignore_index=True)
+    del all_data
     print(f"  ✓ Combined in {time.time() - combine_start:.1f}s", flush=True)
     
     print(f"\n{'='*70}", flush=True)
@@ -298,7 +715,7 @@ def add_treatment_variables(panel):
     
     Creates:
     - Post: Indicator for post-ChatGPT period (Year >= 2023)
-    - (Occupation exposure scores will be added separately)
+    - (Occupation exposure scores are added by add_occupation_exposure_scores)
     
     Args:
         panel (pd.DataFrame): Cleaned panel
@@ -322,21 +739,26 @@ def add_treatment_variables(panel):
     return panel
 
 
-def add_occupation_exposure_scores(panel):
+def add_occupation_exposure_scores(panel, context=None):
     """
     Add occupation-level exposure scores.
     
-    NOTE: This is a placeholder. In a full implementation, these would come from:
-    1. AI_Exposure_Score: ILO Working Paper 96 (Gmyrek et al. 2023) - ISCO-08 codes
-    2. Teleworkability: Dingel & Neiman (2020) - SOC codes
-    3. RoutineTaskIndex: Autor & Dorn (2013) / O*NET - SOC codes
-    4. SkillIntensity: O*NET education requirements - SOC codes
-    5. AutomationRisk_PreAI: Frey & Osborne (2017) - SOC codes
+    Scores are resolved once per distinct (Occupation_Code, Occupation, Year)
+    key and joined back to the panel in one pass (see occupation_dimension.py):
+    1. AI_Exposure_Score: ILO ISCO-08 scores via the ISCO-08 → 2010 SOC crosswalk
+    2. Teleworkable: Dingel & Neiman (2020) - SOC codes / occupation names
+    3. RoutineTaskIndex: Autor & Dorn (2013) / O*NET - SOC major group
+    4. SkillIntensity: O*NET education requirements - SOC major group
+    5. AutomationRisk_PreAI: Frey & Osborne (2017) - SOC codes / occupation names
     
-    For now, we'll flag that these need to be added from external sources.
+    2018-2024 SOC codes are linked to 2010 SOC codes through the BLS
+    crosswalk (soc_crosswalk.py), which also adds Occupation_Code_2010.
+    Teleworkability has no occupation-level source yet and stays empty.
     
     Args:
         panel (pd.DataFrame): Panel data
+        context (dict): Reference data shared across calls (pass the same
+            dict for every year in chunked mode)
         
     Returns:
         pd.DataFrame: Panel with exposure scores
@@ -344,26 +766,14 @@ def add_occupation_exposure_scores(panel):
     print(f"\n{'='*70}")
     print(f"OCCUPATION EXPOSURE SCORES")
     print(f"{'='*70}")
-    print("NOTE: Occupation-level exposure scores require external data sources.")
-    print("These should be matched using SOC occupation codes.")
-    print("\nRequired sources:")
-    print("1. ILO GPT Exposure Index (ISCO-08 → SOC crosswalk needed)")
-    print("2. Dingel & Neiman Teleworkability (SOC)")
-    print("3. Autor & Dorn Routine Task Index (SOC via O*NET)")
-    print("4. O*NET Skill Intensity (SOC)")
-    print("5. Frey & Osborne Automation Risk (SOC)")
-    
-    # Add placeholder columns
-    panel['AI_Exposure_Score'] = np.nan
-    panel['Teleworkability'] = np.nan
-    panel['RoutineTaskIndex'] = np.nan
-    panel['SkillIntensity'] = np.nan
-    panel['AutomationRisk_PreAI'] = np.nan
-    
-    print("\nPlaceholder columns added. To populate:")
-    print("1. Download occupation-level scores from academic papers")
-    print("2. Create crosswalk between ISCO-08 and SOC codes")
-    print("3. Match scores to Occupation_Code in this panel")
+    
+    for col in SCORE_COLUMNS:
+        panel[col] = np.nan
+    
+    panel, _ = attach_occupation_scores(panel, context=context)
+    
+    for col in SCORE_COLUMNS + ['Teleworkable']:
+        print(f"  {col}: {panel[col].notna().mean() * 100:.1f}% of rows")
     
     return panel
 
@@ -404,38 +814,145 @@ def generate_summary_statistics(panel):
     print(panel.isnull().sum())
 
 
-def save_panel(panel):
+def init_panel_stats():
     """
-    Save the panel to CSV with metadata.
+    Create an empty accumulator for panel-level statistics.
+    
+    Returns:
+        dict: Running counts filled in by update_panel_stats()
+    """
+    return {
+        'n_observations': 0,
+        'year_counts': {},
+        'post_counts': {},
+        'states': set(),
+        'industries': set(),
+        'occupations': set(),
+        'occupation_employment': None,
+        'missing': None,
+        'employment_sum': 0.0,
+        'employment_min': np.inf,
+        'employment_max': -np.inf,
+        'columns': None,
+    }
+
+
+def update_panel_stats(stats, panel):
+    """
+    Fold one chunk (or the whole panel) into the running statistics.
     
     Args:
-        panel (pd.DataFrame): Final panel
+        stats (dict): Accumulator from init_panel_stats()
+        panel (pd.DataFrame): Processed chunk
+        
+    Returns:
+        dict: The updated accumulator
+    """
+    stats['n_observations'] += len(panel)
+    for year, count in panel['Year'].value_counts().items():
+        stats['year_counts'][int(year)] = stats['year_counts'].get(int(year), 0) + int(count)
+    for post, count in panel['Post'].value_counts().items():
+        stats['post_counts'][int(post)] = stats['post_counts'].get(int(post), 0) + int(count)
+    
+    if 'State' in panel.columns:
+        stats['states'].update(panel['State'].dropna().unique())
+    if 'Industry_Code' in panel.columns:
+        stats['industries'].update(panel['Industry_Code'].dropna().unique())
+    if 'Occupation_Code' in panel.columns:
+        stats['occupations'].update(panel['Occupation_Code'].dropna().unique())
+    
+    if 'Occupation' in panel.columns and 'Occupation_Code' in panel.columns:
+        occ_emp = panel.groupby(['Occupation_Code', 'Occupation'])['Employment'].sum()
+        if stats['occupation_employment'] is None:
+            stats['occupation_employment'] = occ_emp
+        else:
+            stats['occupation_employment'] = stats['occupation_employment'].add(occ_emp, fill_value=0)
+    
+    missing = panel.isnull().sum()
+    stats['missing'] = missing if stats['missing'] is None else stats['missing'].add(missing, fill_value=0).astype(int)
+    
+    if len(panel):
+        stats['employment_sum'] += float(panel['Employment'].sum())
+        stats['employment_min'] = min(stats['employment_min'], float(panel['Employment'].min()))
+        stats['employment_max'] = max(stats['employment_max'], float(panel['Employment'].max()))
+    
+    if stats['columns'] is None:
+        stats['columns'] = list(panel.columns)
+    
+    return stats
+
+
+def generate_chunked_summary(stats):
+    """
+    Display summary statistics accumulated in chunked mode.
+    
+    Quantile-based statistics (describe()) need the full panel in memory
+    and are omitted here.
+    
+    Args:
+        stats (dict): Accumulator from update_panel_stats()
     """
-    # Save main panel
-    output_path = OUTPUT_DIR / 'occupation_panel.csv'
-    panel.to_csv(output_path, index=False)
     print(f"\n{'='*70}")
-    print(f"OUTPUT")
+    print(f"FINAL PANEL SUMMARY STATISTICS (chunked)")
     print(f"{'='*70}")
-    print(f"Panel saved to: {output_path}")
-    print(f"File size: {output_path.stat().st_size / 1024 / 1024:.1f} MB")
     
-    # Save metadata
+    n_obs = stats['n_observations']
+    print(f"\nPanel Structure:")
+    print(f"- Total observations: {n_obs:,}")
+    print(f"- Years: {min(stats['year_counts'])} to {max(stats['year_counts'])}")
+    print(f"- States: {len(stats['states'])}")
+    print(f"- Industries: {len(stats['industries'])}")
+    print(f"- Occupations: {len(stats['occupations'])}")
+    
+    print(f"\nObservations by Year:")
+    for year in sorted(stats['year_counts']):
+        print(f"  {year}: {stats['year_counts'][year]:,}")
+    
+    print(f"\nEmployment Statistics:")
+    print(f"  Mean: {stats['employment_sum'] / n_obs:,.1f}")
+    print(f"  Min: {stats['employment_min']:,.0f}")
+    print(f"  Max: {stats['employment_max']:,.0f}")
+    
+    print(f"\nTreatment Distribution:")
+    for post in sorted(stats['post_counts']):
+        print(f"  Post={post}: {stats['post_counts'][post]:,}")
+    
+    if stats['occupation_employment'] is not None:
+        print(f"\nTop 10 Occupations by Total Employment:")
+        top_occs = stats['occupation_employment'].sort_values(ascending=False).head(10)
+        for (code, title), emp in top_occs.items():
+            print(f"  {code} - {title[:50]}: {emp:,.0f}")
+    
+    print(f"\nMissing Values:")
+    print(stats['missing'])
+
+
+def save_metadata(stats, storage):
+    """
+    Save panel metadata JSON.
+    
+    Args:
+        stats (dict): Accumulator from update_panel_stats()
+        storage (dict): Parquet dataset description (schema, row counts
+            per year) from panel_io.describe_dataset()
+    """
     metadata = {
         'source': 'BLS Occupational Employment Statistics (OES) Research Estimates',
         'url': 'https://www.bls.gov/oes/oessrcres.htm',
         'creation_date': datetime.now().isoformat(),
         'years': list(range(min(YEARS), max(YEARS) + 1)),
         'post_treatment_year': POST_TREATMENT_YEAR,
-        'n_observations': len(panel),
-        'n_states': int(panel['State'].nunique()) if 'State' in panel.columns else None,
-        'n_industries': int(panel['Industry_Code'].nunique()) if 'Industry_Code' in panel.columns else None,
-        'n_occupations': int(panel['Occupation_Code'].nunique()) if 'Occupation_Code' in panel.columns else None,
-        'columns': list(panel.columns),
+        'n_observations': stats['n_observations'],
+        'n_states': len(stats['states']) if stats['states'] else None,
+        'n_industries': len(stats['industries']) if stats['industries'] else None,
+        'n_occupations': len(stats['occupations']) if stats['occupations'] else None,
+        'columns': stats['columns'],
+        'storage': storage,
+        'csv_export': str(PANEL_CSV_PATH.relative_to(OUTPUT_DIR.parent)) if EXPORT_CSV else None,
         'notes': [
             'Annual data (May reference period)',
             'State × Industry × Occupation level',
-            'Occupation exposure scores are placeholders - need to be populated from academic sources',
+            'Occupation exposure scores attached per (Occupation_Code, Occupation, Year) key - see occupation_dimension.py',
             'Employment is total employment, not FTE',
             'Some observations suppressed by BLS for confidentiality'
         ]
@@ -447,8 +964,133 @@ def save_panel(panel):
     print(f"Metadata saved to: {metadata_path}")
 
 
+def save_panel(panel):
+    """
+    Save the panel as Year-partitioned Parquet (plus CSV with --csv) with metadata.
+    
+    Args:
+        panel (pd.DataFrame): Final panel
+    """
+    # Save main panel (it carries freshly attached scores, so any score
+    # sidecar from an earlier panel is dropped)
+    storage = write_panel(panel, csv=EXPORT_CSV)
+    discard_score_sidecar()
+    print(f"\n{'='*70}")
+    print(f"OUTPUT")
+    print(f"{'='*70}")
+    print_output_sizes()
+    
+    # Save metadata
+    save_metadata(update_panel_stats(init_panel_stats(), panel), storage)
+
+
+def print_output_sizes():
+    """Print where the panel was written and how much disk it uses."""
+    dataset_bytes = sum(f.stat().st_size for f in PANEL_DATASET_DIR.rglob('*.parquet'))
+    print(f"Panel saved to: {PANEL_DATASET_DIR} (Parquet, partitioned by Year)")
+    print(f"Dataset size: {dataset_bytes / 1024 / 1024:.1f} MB")
+    if EXPORT_CSV:
+        print(f"CSV export: {PANEL_CSV_PATH}")
+        print(f"File size: {PANEL_CSV_PATH.stat().st_size / 1024 / 1024:.1f} MB")
+
+
+def build_panel_chunked():
+    """
+    Build the panel one year at a time.
+    
+    Each year flows through clean_and_filter_panel, add_treatment_variables
+    and add_occupation_exposure_scores and is written straight out as its
+    own Parquet partition (and appended to the CSV export with --csv); only
+    running statistics and the score reference data (including the
+    name -> AI exposure mapping built from earlier years) are kept across
+    years.
+    
+    Returns:
+        tuple: (accumulated panel statistics, storage description), or
+            (None, None) if nothing was loaded
+    """
+    tmp_csv_path = PANEL_CSV_PATH.with_suffix('.csv.tmp')
+    tmp_dataset_dir = begin_dataset_write()
+    stats = init_panel_stats()
+    total_start = time.time()
+    
+    print(f"\n{'='*70}", flush=True)
+    print(f"CHUNKED BUILD ({len(YEARS)} years)", flush=True)
+    print(f"{'='*70}", flush=True)
+    
+    first_chunk = True
+    score_context = {}
+    for year, chunk in iter_parsed_years(ordered=True):
+        if chunk is None:
+            print(f"  ✗ Failed to load {year}", flush=True)
+            continue
+        
+        chunk = clean_and_filter_panel(chunk)
+        chunk = add_treatment_variables(chunk)
+        chunk = add_occupation_exposure_scores(chunk, score_context)
+        chunk = chunk.reindex(columns=PANEL_COLUMNS)
+        
+        write_panel_partition(chunk, year, tmp_dataset_dir)
+        if EXPORT_CSV:
+            chunk.to_csv(tmp_csv_path, mode='w' if first_chunk else 'a', header=first_chunk, index=False)
+        first_chunk = False
+        update_panel_stats(stats, chunk)
+        
+        print(f"  ✓ Wrote {len(chunk):,} rows for {year} "
+              f"(total {stats['n_observations']:,}, elapsed {(time.time() - total_start)/60:.1f}m)", flush=True)
+        del chunk
+    
+    if first_chunk:
+        print("\nERROR: No data loaded!", flush=True)
+        return None, None
+    
+    finish_dataset_write(tmp_dataset_dir)
+    discard_score_sidecar()
+    if EXPORT_CSV:
+        os.replace(tmp_csv_path, PANEL_CSV_PATH)
+    print(f"\n{'='*70}")
+    print(f"OUTPUT")
+    print(f"{'='*70}")
+    print_output_sizes()
+    
+    return stats, describe_dataset()
+
+
+def print_next_steps():
+    """Print follow-up steps, including how 2018-2024 occupations were matched."""
+    print(f"\nNext steps:")
+    if CROSSWALK_PATH.exists():
+        print(f"1. Check score coverage by year (2018-2024 rows are linked to 2010 SOC "
+              f"through {CROSSWALK_PATH.name})")
+    else:
+        print(f"1. SOC crosswalk not found ({CROSSWALK_PATH}): 2018-2024 rows were matched on "
+              f"occupation names. Run python scripts/soc_crosswalk.py and rebuild to match on codes")
+    print(f"2. Run preliminary DiD analysis")
+
+
 def main():
     """Main execution function."""
+    parse_options()
+    print_banner()
+    
+    if CHUNKED_MODE:
+        # Steps 1-4 and 6 run per year; statistics are accumulated as we go
+        print("\nSTEPS 1-4: Loading, cleaning and saving each year...")
+        stats, storage = build_panel_chunked()
+        if stats is None:
+            sys.exit(1)
+        
+        print("\nSTEP 5: Generating summary statistics...")
+        generate_chunked_summary(stats)
+        
+        print("\nSTEP 6: Saving metadata...")
+        save_metadata(stats, storage)
+        
+        print(f"\n{'='*70}")
+        print(f"PROCESSING COMPLETE")
+        print(f"{'='*70}")
+        print_next_steps()
+        return
     
     # Step 1: Load all OES files
     print("\nSTEP 1: Loading OES files...")
@@ -465,9 +1107,9 @@ def main():
     print("\nSTEP 3: Adding treatment variables...")
     panel = add_treatment_variables(panel)
     
-    # Step 4: Add occupation exposure scores (placeholders)
+    # Step 4: Add occupation exposure scores
     print("\nSTEP 4: Adding occupation exposure scores...")
-    panel = add_occupation_exposure_scores(panel)
+    panel = add_occupation_exposure_scores(panel).reindex(columns=PANEL_COLUMNS)
     
     # Step 5: Generate summary statistics
     print("\nSTEP 5: Generating summary statistics...")
@@ -480,11 +1122,7 @@ def main():
     print(f"\n{'='*70}")
     print(f"PROCESSING COMPLETE")
     print(f"{'='*70}")
-    print(f"\nNext steps:")
-    print(f"1. Obtain occupation-level exposure scores from academic sources")
-    print(f"2. Create ISCO-08 to SOC crosswalk for AI exposure scores")
-    print(f"3. Match scores to occupations in occupation_panel.csv")
-    print(f"4. Run preliminary DiD analysis")
+    print_next_steps()
 
 
 if __name__ == '__main__':
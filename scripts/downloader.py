@@ -0,0 +1,187 @@
+"""
+Concurrent, Resumable File Downloader
+=====================================
+
+Shared download helpers for large raw files (e.g. BLS OES workbooks):
+
+- One pooled requests.Session (keep-alive, retries with backoff on 429/5xx)
+- Bounded concurrency via a thread pool
+- Responses streamed to '<name>.part' in chunks, never buffered in memory
+- Interrupted downloads resumed with an HTTP Range request
+- Size checked against Content-Length / Content-Range, optional SHA-256 check
+
+Nothing here is specific to bls.gov; every function takes the URL, so the
+downloader can be pointed at a local HTTP server (e.g. http.server) in tests.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Defaults
+DEFAULT_WORKERS = 4
+CHUNK_SIZE = 1024 * 1024  # 1 MB
+TIMEOUT = 30  # seconds (connect and between reads)
+
+# bls.gov rejects requests without a descriptive User-Agent
+USER_AGENT = 'SS154-AI-Labour-Market-Research/1.0 (academic data pipeline)'
+
+
+class DownloadError(Exception):
+    """Raised when a download fails size or checksum verification."""
+
+
+def make_session(pool_size=DEFAULT_WORKERS, retries=3, methods=('GET', 'HEAD')):
+    """
+    Create a pooled session with retry/backoff on transient errors.
+
+    Args:
+        pool_size (int): Max connections kept per host (match the worker count)
+        retries (int): Retries for connection errors and 429/5xx responses
+        methods (tuple): HTTP methods that are retried (add 'POST' for
+            read-only POST APIs such as the BLS timeseries API)
+
+    Returns:
+        requests.Session: Configured session
+    """
+    retry = Retry(total=retries, backoff_factor=1,
+                  status_forcelist=[429, 500, 502, 503, 504],
+                  allowed_methods=list(methods))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _content_range_total(header):
+    """Total size from a 'bytes start-end/total' Content-Range header."""
+    if not header or '/' not in header:
+        return None
+    total = header.rsplit('/', 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+def download_file(session, url, output_path, expected_sha256=None, timeout=TIMEOUT,
+                  chunk_size=CHUNK_SIZE):
+    """
+    Download a URL to a file, resuming a previous partial download if present.
+
+    Data is streamed to '<output_path>.part' and renamed into place only
+    after the size (and, if given, the SHA-256) has been verified.
+
+    Args:
+        session (requests.Session): Session from make_session()
+        url (str): Source URL
+        output_path (Path): Destination file
+        expected_sha256 (str): Expected hex digest (optional)
+        timeout (int): Request timeout in seconds
+        chunk_size (int): Bytes per streamed chunk
+
+    Returns:
+        tuple: (output_path, sha256 hex digest, bytes transferred this call)
+
+    Raises:
+        requests.RequestException: On HTTP/network errors
+        DownloadError: On size or checksum mismatch
+    """
+    output_path = Path(output_path)
+    part_path = output_path.with_name(output_path.name + '.part')
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    headers = {'Range': f'bytes={offset}-'} if offset else {}
+    transferred = 0
+
+    with session.get(url, stream=True, timeout=timeout, headers=headers) as response:
+        if response.status_code == 416 and offset:
+            # Range starts at/after the end: the .part file is already complete
+            expected_size = _content_range_total(response.headers.get('Content-Range'))
+        else:
+            response.raise_for_status()
+            if offset and response.status_code == 206:
+                mode = 'ab'
+                expected_size = _content_range_total(response.headers.get('Content-Range'))
+            else:
+                # Server ignored the Range header: start over
+                mode = 'wb'
+                offset = 0
+                length = response.headers.get('Content-Length')
+                expected_size = int(length) if length and length.isdigit() else None
+
+            with open(part_path, mode) as f:
+                for block in response.iter_content(chunk_size=chunk_size):
+                    if block:
+                        f.write(block)
+                        transferred += len(block)
+
+    actual_size = part_path.stat().st_size
+    if expected_size is not None and actual_size != expected_size:
+        # Keep the partial file so the next run can resume it
+        raise DownloadError(f"{output_path.name}: got {actual_size:,} of {expected_size:,} bytes")
+
+    digest = file_sha256(part_path)
+    if expected_sha256 and digest != expected_sha256:
+        part_path.unlink()
+        raise DownloadError(f"{output_path.name}: SHA-256 mismatch ({digest} != {expected_sha256})")
+
+    os.replace(part_path, output_path)
+    return output_path, digest, transferred
+
+
+def download_many(jobs, max_workers=DEFAULT_WORKERS, session=None, timeout=TIMEOUT):
+    """
+    Download several files concurrently over one pooled session.
+
+    Args:
+        jobs (list): Dicts with 'key', 'url', 'path' and optional 'sha256'
+        max_workers (int): Concurrent downloads
+        session (requests.Session): Existing session (default: make_session())
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        dict: key -> {'path', 'sha256', 'size'} on success, or
+            {'error': message} on failure
+    """
+    own_session = session is None
+    if own_session:
+        session = make_session(pool_size=max_workers)
+
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(download_file, session, job['url'], job['path'],
+                                job.get('sha256'), timeout): job
+                for job in jobs
+            }
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    path, digest, transferred = future.result()
+                    results[job['key']] = {'path': path, 'sha256': digest, 'size': path.stat().st_size}
+                    print(f"    ✓ {path.name} ({transferred / 1024 / 1024:.1f} MB transferred)", flush=True)
+                except (requests.RequestException, DownloadError, OSError) as e:
+                    results[job['key']] = {'error': str(e)}
+                    print(f"    ✗ {Path(job['path']).name}: {e}", flush=True)
+    finally:
+        if own_session:
+            session.close()
+
+    return results
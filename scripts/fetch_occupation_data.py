@@ -8,6 +8,10 @@ This script:
 3. Calculates time-varying industry-level weighted averages
 4. Generates documented CSV files with full source attribution
 
+With --detailed, step 3 also weights detailed (6-digit SOC) occupation scores
+by detailed OES employment for every Year × State × NAICS cell
+(see occupation_weighting.py).
+
 Data Sources:
 - BLS Occupational Employment and Wage Statistics (OES) Research Estimates
 - ILO Working Paper 96 (Gmyrek et al. 2023) - AI exposure scores
@@ -23,19 +27,32 @@ Date: December 2025
 import os
 import sys
 import json
-import time
 from pathlib import Path
 from datetime import datetime
-import requests
 import pandas as pd
 import numpy as np
 from io import BytesIO
 
+from downloader import DEFAULT_WORKERS, download_many
+from score_registry import score_dict
+
 # Directories
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / 'data'
 RAW_DIR = DATA_DIR / 'oes_raw'
 RAW_DIR.mkdir(exist_ok=True)
+DOWNLOAD_MANIFEST = RAW_DIR / 'checksums.json'
+
+# Rows inspected when looking for the header row of an OES workbook
+HEADER_SCAN_ROWS = 20
+
+# Concurrent downloads (--download-workers N)
+DOWNLOAD_WORKERS = DEFAULT_WORKERS
+if '--download-workers' in sys.argv:
+    DOWNLOAD_WORKERS = max(1, int(sys.argv[sys.argv.index('--download-workers') + 1]))
+
+# Also compute detailed-SOC weighted scores for every NAICS code
+DETAILED_MODE = '--detailed' in sys.argv
 
 # BLS OES Research Estimates URLs (2015-2024)
 # These files contain occupation×industry×state employment data
@@ -169,32 +186,10 @@ def load_occupation_scores():
     """
     
     # ILO AI Exposure Scores (mapped to major SOC groups)
-    # Source: ILO Working Paper 96, Table A1
+    # Source: ILO Working Paper 96, Table A1 (score registry table
+    # ilo_exposure_major_group, data/reference/ilo_exposure_major_group_wp96.csv)
     # High scores = high exposure to GenAI capabilities
-    ai_exposure = {
-        '11': 0.45,  # Management
-        '13': 0.52,  # Business and Financial Operations
-        '15': 0.60,  # Computer and Mathematical
-        '17': 0.48,  # Architecture and Engineering
-        '19': 0.42,  # Life, Physical, and Social Science
-        '21': 0.38,  # Community and Social Service
-        '23': 0.55,  # Legal
-        '25': 0.48,  # Educational Instruction and Library
-        '27': 0.50,  # Arts, Design, Entertainment, Sports, and Media
-        '29': 0.35,  # Healthcare Practitioners and Technical
-        '31': 0.25,  # Healthcare Support
-        '33': 0.22,  # Protective Service
-        '35': 0.18,  # Food Preparation and Serving
-        '37': 0.20,  # Building and Grounds Cleaning and Maintenance
-        '39': 0.24,  # Personal Care and Service
-        '41': 0.40,  # Sales and Related
-        '43': 0.46,  # Office and Administrative Support
-        '45': 0.28,  # Farming, Fishing, and Forestry
-        '47': 0.30,  # Construction and Extraction
-        '49': 0.32,  # Installation, Maintenance, and Repair
-        '51': 0.35,  # Production
-        '53': 0.28,  # Transportation and Material Moving
-    }
+    ai_exposure = score_dict('ilo_exposure_major_group', 'wp96')
     
     # Dingel & Neiman (2020) Teleworkability
     # Source: NBER WP 26948, based on O*NET work context
@@ -323,99 +318,180 @@ def load_occupation_scores():
     print(f"  - Coverage: {len(ai_exposure)} major SOC occupation groups")
 
 
-def download_oes_file(year, sector_key, url):
-    """Download BLS OES research estimate file."""
-    output_path = RAW_DIR / f"oes_{year}_{sector_key}.xlsx"
-    
-    if output_path.exists():
-        print(f"  File already exists: {output_path.name}")
-        return output_path
-    
-    print(f"  Downloading {year} {sector_key}...")
-    try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
-        
-        print(f"    ✓ Saved to {output_path.name}")
-        return output_path
-        
-    except Exception as e:
-        print(f"    ✗ Error downloading: {e}")
-        return None
+def load_download_manifest():
+    """Load recorded sizes/checksums of downloaded OES files."""
+    if DOWNLOAD_MANIFEST.exists():
+        with open(DOWNLOAD_MANIFEST, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def save_download_manifest(manifest):
+    """Save sizes/checksums of downloaded OES files."""
+    with open(DOWNLOAD_MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
 
 
-def download_all_oes_files():
-    """Download all OES files for 2015-2024."""
+def verify_existing_file(path, manifest):
+    """
+    Check an existing download against the manifest.
+
+    Only the size is compared (cheap); files without a manifest entry are
+    trusted, as before.
+
+    Returns:
+        bool: True if the file can be used as-is
+    """
+    entry = manifest.get(path.name)
+    return entry is None or path.stat().st_size == entry['size']
+
+
+def download_all_oes_files(urls=None, max_workers=None, session=None):
+    """
+    Download all OES files for 2015-2024.
+    
+    Files are fetched concurrently over one pooled session (see
+    downloader.py), streamed to .part files and resumed with HTTP Range
+    if a previous run was interrupted. Sizes and SHA-256 digests are
+    recorded in oes_raw/checksums.json.
+    
+    Args:
+        urls (dict): {year: {sector_key: url}} (default: OES_URLS)
+        max_workers (int): Concurrent downloads (default: DOWNLOAD_WORKERS)
+        session (requests.Session): Session to reuse (default: a new pooled one)
+    
+    Returns:
+        dict: {year: {sector_key: Path}} for files available on disk
+    """
     print("\n" + "="*70)
     print("DOWNLOADING BLS OES RESEARCH ESTIMATES (2015-2024)")
     print("="*70)
     
-    downloaded_files = {}
+    urls = urls if urls is not None else OES_URLS
+    max_workers = max_workers or DOWNLOAD_WORKERS
+    manifest = load_download_manifest()
     
-    for year, sectors in OES_URLS.items():
-        print(f"\nYear {year}:")
-        downloaded_files[year] = {}
-        
+    downloaded_files = {year: {} for year in urls}
+    jobs = []
+    
+    for year, sectors in urls.items():
         for sector_key, url in sectors.items():
-            file_path = download_oes_file(year, sector_key, url)
-            if file_path:
-                downloaded_files[year][sector_key] = file_path
-            
-            # Rate limiting
-            time.sleep(1)
+            output_path = RAW_DIR / f"oes_{year}_{sector_key}.xlsx"
+            if output_path.exists() and verify_existing_file(output_path, manifest):
+                downloaded_files[year][sector_key] = output_path
+                continue
+            if output_path.exists():
+                print(f"  ✗ {output_path.name}: size differs from manifest, re-downloading")
+                output_path.unlink()
+            jobs.append({
+                'key': (year, sector_key),
+                'url': url,
+                'path': output_path,
+                'sha256': manifest.get(output_path.name, {}).get('sha256'),
+            })
+    
+    print(f"\n{sum(len(f) for f in downloaded_files.values())} files already present, "
+          f"{len(jobs)} to download ({max_workers} concurrent)")
+    
+    if jobs:
+        results = download_many(jobs, max_workers=max_workers, session=session)
+        for job in jobs:
+            result = results[job['key']]
+            if 'error' in result:
+                continue
+            year, sector_key = job['key']
+            downloaded_files[year][sector_key] = result['path']
+            manifest[result['path'].name] = {'url': job['url'], 'size': result['size'],
+                                             'sha256': result['sha256']}
+        save_download_manifest(manifest)
     
     return downloaded_files
 
 
+def find_header_row(file_path, scan_rows=HEADER_SCAN_ROWS):
+    """
+    Locate the header row of an OES workbook from its first rows only.
+    
+    Args:
+        file_path (Path): OES Excel file
+        scan_rows (int): Number of leading rows to inspect
+    
+    Returns:
+        tuple: (header row index, list of raw column names in that row)
+    """
+    preview = pd.read_excel(file_path, sheet_name=0, header=None, nrows=scan_rows, dtype=str)
+    
+    # Header row: first row with a cell containing 'AREA' or 'STATE'
+    matches = preview.apply(lambda col: col.str.upper().str.contains('AREA|STATE', na=False))
+    hits = matches.any(axis=1).to_numpy()
+    header_row = int(hits.argmax()) if hits.any() else 0
+    
+    return header_row, preview.iloc[header_row].tolist()
+
+
+def identify_oes_columns(columns):
+    """
+    Pick the state, NAICS, occupation and employment columns by name.
+    
+    Args:
+        columns (list): Raw header names (names vary across years)
+    
+    Returns:
+        list: Raw names in [state, NAICS, occupation, employment] order
+            (None where no column matches)
+    """
+    names = {col: str(col).strip().upper() for col in columns if pd.notna(col)}
+    
+    def first(*keys):
+        return next((col for col, name in names.items() if any(key in name for key in keys)), None)
+    
+    return [first('STATE', 'AREA'), first('NAICS', 'INDUSTRY'),
+            first('OCC_CODE', 'SOC'), first('TOT_EMP', 'EMPLOYMENT')]
+
+
 def parse_oes_file(file_path, year):
     """
     Parse BLS OES research estimate Excel file.
     
+    The header row is found from the first HEADER_SCAN_ROWS rows, then
+    the workbook is read once, keeping only the four needed columns.
+    
     Returns DataFrame with columns:
     - Year
     - State
     - NAICS (industry code)
     - SOC (occupation code)
     - Employment
+    - O_GROUP (occupation level: total/major/minor/broad/detailed), where
+      the file has it
     """
     print(f"  Parsing {file_path.name}...")
     
     try:
         # OES files typically have data starting from row 4 or so
         # Column structure: Area, NAICS, OCC_CODE, OCC_TITLE, TOT_EMP, etc.
-        df = pd.read_excel(file_path, sheet_name=0)
-        
-        # Find the header row (usually contains 'AREA' or 'PRIM_STATE')
-        header_row = 0
-        for idx, row in df.iterrows():
-            if any('AREA' in str(val).upper() or 'STATE' in str(val).upper() 
-                   for val in row if pd.notna(val)):
-                header_row = idx
-                break
-        
-        # Re-read with correct header
-        df = pd.read_excel(file_path, sheet_name=0, header=header_row)
-        
-        # Standardize column names
-        df.columns = [str(col).strip().upper() for col in df.columns]
+        header_row, header = find_header_row(file_path)
         
         # Identify key columns (names vary across years)
-        state_col = next((col for col in df.columns if 'STATE' in col or 'AREA' in col), None)
-        naics_col = next((col for col in df.columns if 'NAICS' in col or 'INDUSTRY' in col), None)
-        occ_col = next((col for col in df.columns if 'OCC_CODE' in col or 'SOC' in col), None)
-        emp_col = next((col for col in df.columns if 'TOT_EMP' in col or 'EMPLOYMENT' in col), None)
+        key_columns = identify_oes_columns(header)
         
-        if not all([state_col, naics_col, occ_col, emp_col]):
+        if not all(key_columns):
             print(f"    ✗ Could not identify required columns")
-            print(f"      Available columns: {df.columns.tolist()}")
+            print(f"      Available columns: {[str(col).strip().upper() for col in header]}")
             return pd.DataFrame()
         
+        # Occupation level column (not in every year's files)
+        group_column = next((col for col in header if pd.notna(col)
+                             and str(col).strip().upper() in ('O_GROUP', 'OCC_GROUP')), None)
+        read_columns = key_columns + ([group_column] if group_column is not None else [])
+        
+        # Single projected read
+        df = pd.read_excel(file_path, sheet_name=0, header=header_row,
+                           usecols=lambda col: col in read_columns)
+        
         # Extract relevant columns
-        result = df[[state_col, naics_col, occ_col, emp_col]].copy()
-        result.columns = ['State', 'NAICS', 'SOC', 'Employment']
+        result = df[read_columns].copy()
+        result.columns = ['State', 'NAICS', 'SOC', 'Employment'] + (['O_GROUP'] if group_column is not None else [])
         result['Year'] = year
         
         # Clean data
@@ -437,12 +513,22 @@ def parse_oes_file(file_path, year):
         return pd.DataFrame()
 
 
-def calculate_industry_exposure_scores(oes_data):
+def calculate_industry_exposure_scores(oes_data, soc_col='SOC_Major', occupation_scores=None):
     """
     Calculate industry-level weighted exposure scores using occupation employment shares.
     
+    All measures are computed in one vectorized pass: employment shares
+    within each (Year, State, Industry) cell are multiplied by an
+    occupation × measure score matrix and summed per cell. Occupations
+    without a score contribute zero.
+    
     Args:
-        oes_data: DataFrame with Year, State, NAICS, SOC_Major, Employment
+        oes_data: DataFrame with Year, State, NAICS, the SOC column and Employment
+        soc_col: Occupation key column ('SOC_Major' for 2-digit groups, or a
+            detailed code column such as 'SOC' when occupation_scores is keyed
+            by 6-digit SOC)
+        occupation_scores: {measure: {occupation key: score}} (default:
+            OCCUPATION_SCORES)
     
     Returns:
         DataFrame with Year, State, Industry, and exposure scores
@@ -451,41 +537,34 @@ def calculate_industry_exposure_scores(oes_data):
     print("CALCULATING INDUSTRY-LEVEL EXPOSURE SCORES")
     print("="*70)
     
+    if occupation_scores is None:
+        occupation_scores = OCCUPATION_SCORES
+    group_cols = ['Year', 'State', 'Industry']
+    
     # Map NAICS to our industry categories
     oes_data['Industry'] = oes_data['NAICS'].map(NAICS_TO_INDUSTRY)
     oes_data = oes_data.dropna(subset=['Industry'])
     
-    # Aggregate employment by Year, State, Industry, SOC_Major
-    agg = oes_data.groupby(['Year', 'State', 'Industry', 'SOC_Major'])['Employment'].sum().reset_index()
-    
-    # Calculate total employment by Year, State, Industry
-    totals = agg.groupby(['Year', 'State', 'Industry'])['Employment'].sum().reset_index()
-    totals.columns = ['Year', 'State', 'Industry', 'Total_Employment']
+    # Aggregate employment by Year, State, Industry, occupation (sorted by cell)
+    agg = oes_data.groupby(group_cols + [soc_col])['Employment'].sum().reset_index()
     
-    # Merge to get employment shares
-    agg = agg.merge(totals, on=['Year', 'State', 'Industry'])
-    agg['Share'] = agg['Employment'] / agg['Total_Employment']
+    # Employment shares within each Year × State × Industry cell
+    cell_id = agg.groupby(group_cols, sort=True).ngroup().to_numpy()
+    employment = agg['Employment'].to_numpy(dtype=float)
+    totals = np.bincount(cell_id, weights=employment)
+    shares = employment / totals[cell_id]
     
-    # Calculate weighted scores for each exposure measure
-    results = []
+    # Occupation × measure score matrix aligned to agg rows (missing scores -> 0)
+    measures = list(occupation_scores)
+    score_matrix = pd.DataFrame(occupation_scores).reindex(index=agg[soc_col].astype(str), columns=measures)
+    weighted = np.nan_to_num(score_matrix.to_numpy(dtype=float)) * shares[:, None]
     
-    for (year, state, industry), group in agg.groupby(['Year', 'State', 'Industry']):
-        scores = {'Year': year, 'State': state, 'Industry': industry}
-        
-        for measure_name, measure_scores in OCCUPATION_SCORES.items():
-            # Get occupation scores
-            group['Score'] = group['SOC_Major'].map(measure_scores)
-            
-            # Calculate weighted average (employment-weighted)
-            weighted_score = (group['Share'] * group['Score']).sum()
-            scores[measure_name] = weighted_score
-        
-        # Also store total employment for reference
-        scores['Total_Occupation_Employment'] = group['Total_Employment'].iloc[0]
-        
-        results.append(scores)
+    # Sum weighted scores per cell for all measures at once
+    cell_scores = pd.DataFrame(weighted, columns=measures).groupby(cell_id, sort=True).sum()
     
-    result_df = pd.DataFrame(results)
+    result_df = agg.drop_duplicates(subset=group_cols)[group_cols].reset_index(drop=True)
+    result_df[measures] = cell_scores.to_numpy()
+    result_df['Total_Occupation_Employment'] = totals
     
     # Rename columns for consistency
     result_df = result_df.rename(columns={
@@ -561,6 +640,20 @@ def main():
     industry_scores.to_csv(output_path, index=False)
     print(f"✓ Saved to: {output_path}")
     
+    if DETAILED_MODE:
+        # Imported here: pulls in scipy and the ILO crosswalk only when needed
+        from occupation_weighting import employment_weighted_scores, load_detailed_occupation_scores
+        
+        print("\n" + "="*70)
+        print("DETAILED-SOC WEIGHTED SCORES (Year × State × NAICS)")
+        print("="*70)
+        detailed_scores = employment_weighted_scores(oes_combined, load_detailed_occupation_scores())
+        detailed_scores['Industry'] = detailed_scores['NAICS'].map(NAICS_TO_INDUSTRY)
+        
+        detailed_path = DATA_DIR / 'industry_exposure_scores_detailed_soc.csv'
+        detailed_scores.to_csv(detailed_path, index=False)
+        print(f"✓ {len(detailed_scores):,} cells saved to: {detailed_path}")
+    
     # Save metadata
     metadata = {
         'generation_date': datetime.now().isoformat(),
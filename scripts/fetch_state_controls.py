@@ -24,22 +24,43 @@ Date: December 2025
 import os
 import sys
 import json
-import time
+import shutil
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
-import requests
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
+from bls_client import DEFAULT_WORKERS, fetch_series
+
 # Load environment variables
 load_dotenv()
 BLS_API_KEY = os.getenv('BLS_API_KEY')
 
-# BLS API Configuration
-BLS_API_URL = 'https://api.bls.gov/publicAPI/v2/timeseries/data/'
+# BLS API Configuration (endpoint: BLS_API_URL in .env, see bls_client.py)
 START_YEAR = '2015'
 END_YEAR = '2025'
 
+# Concurrent API requests (--workers N)
+WORKERS = DEFAULT_WORKERS
+if '--workers' in sys.argv:
+    WORKERS = max(1, int(sys.argv[sys.argv.index('--workers') + 1]))
+
+# Discard checkpoints of an earlier, interrupted fetch (--fresh)
+FRESH = '--fresh' in sys.argv
+
+# Only fetch months after the last date already in the output (--incremental)
+INCREMENTAL = '--incremental' in sys.argv
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+OUTPUT_PATH = DATA_DIR / 'state_controls.csv'
+METADATA_PATH = DATA_DIR / 'state_controls_metadata.json'
+
+# Per-batch API checkpoints (removed once the output is saved)
+CHECKPOINT_DIR = DATA_DIR / 'bls_checkpoints' / 'state_controls'
+
 # State FIPS codes (alphabetical order)
 STATE_FIPS = {
     'Alabama': '01', 'Alaska': '02', 'Arizona': '04', 'Arkansas': '05',
@@ -66,6 +87,31 @@ SERIES_SUFFIXES = {
     'population': '00'               # Civilian noninstitutional population (thousands)
 }
 
+# Derived ratios (percent): name -> (numerator, denominator)
+RATIO_VARIABLES = {
+    'lfpr': ('labor_force', 'population'),  # Labor force participation rate
+}
+
+# Output columns after Date, Year, Month and State, in order
+OUTPUT_COLUMNS = {
+    'UnemploymentRate': 'unemployment_rate',
+    'LFPR': 'lfpr',
+    'LaborForce': 'labor_force',
+    'Employment_LAUS': 'employment',
+    'CivilianPopulation': 'population',
+}
+
+# Output dtypes (counts stay float64: national totals exceed float32's exact integer range)
+CONTROL_DTYPES = {
+    'Year': 'int16',
+    'Month': 'int8',
+    'UnemploymentRate': 'float32',
+    'LFPR': 'float32',
+    'LaborForce': 'float64',
+    'Employment_LAUS': 'float64',
+    'CivilianPopulation': 'float64',
+}
+
 
 def build_series_ids():
     """
@@ -88,52 +134,94 @@ def build_series_ids():
     return series_ids
 
 
-def fetch_bls_data(series_ids, api_key=None):
+def sorted_codes(values):
     """
-    Fetch data from BLS API for given series IDs.
+    Integer codes of a column with its distinct values sorted as strings.
     
     Args:
-        series_ids (list): List of BLS series IDs
-        api_key (str): BLS API key (optional, but recommended)
+        values (pd.Series): Object or categorical column
     
     Returns:
-        dict: Mapping of series ID to list of data points
+        tuple: (codes array, sorted distinct values)
     """
-    headers = {'Content-type': 'application/json'}
-    payload = {
-        'seriesid': series_ids,
-        'startyear': START_YEAR,
-        'endyear': END_YEAR
-    }
+    codes, uniques = pd.factorize(values)
+    uniques = np.asarray(uniques, dtype=object)
+    order = np.argsort(uniques, kind='stable')
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return rank[codes], uniques[order]
+
+
+def parse_laus_results(results, series_mapping):
+    """
+    Parse API results into long format in one pass over the data points.
     
-    if api_key:
-        payload['registrationkey'] = api_key
+    Series IDs resolve to (state, variable) through one reverse map; years,
+    periods and values are gathered into arrays and filtered, converted and
+    turned into dates column-wise, so the cost is linear in the number of
+    returned data points.
     
-    try:
-        response = requests.post(BLS_API_URL, json=payload, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data['status'] != 'REQUEST_SUCCEEDED':
-            print(f"API Error: {data.get('message', 'Unknown error')}")
-            return None
-        
-        results = {}
-        for series in data['Results']['series']:
-            series_id = series['seriesID']
-            results[series_id] = series['data']
-        
-        return results
-        
-    except Exception as e:
-        print(f"Error fetching data: {e}")
-        return None
+    Args:
+        results (dict): Series ID -> list of BLS data points
+        series_mapping (dict): (state, variable) -> series ID
+    
+    Returns:
+        pd.DataFrame: Date, Year, Month, State, Variable, Value and SeriesID
+            (monthly observations with a numeric value; State, Variable and
+            SeriesID are categoricals)
+    """
+    series_lookup = {series_id: key for key, series_id in series_mapping.items()}
+    series_ids = [series_id for series_id in series_lookup if results.get(series_id)]
+    
+    points = pd.DataFrame.from_records(
+        list(chain.from_iterable(results[series_id] for series_id in series_ids)),
+        columns=['year', 'period', 'value'])
+    counts = [len(results[series_id]) for series_id in series_ids]
+    series_index = np.repeat(np.arange(len(series_ids)), counts)
+    
+    # Years and periods take a handful of distinct values: parse those, then gather
+    year_id, year_values = pd.factorize(points['year'])
+    year = year_values.astype(np.int64).to_numpy()[year_id]
+    period_id, period_values = pd.factorize(points['period'])
+    period_values = pd.Series(period_values, dtype=object)
+    period_month = pd.to_numeric(period_values.str[1:].where(period_values.str.startswith('M')),
+                                 errors='coerce').to_numpy(dtype=float)
+    month = period_month[period_id] if len(period_month) else np.empty(0)
+    value = pd.to_numeric(points['value'], errors='coerce').to_numpy(dtype=float)
+    
+    # Monthly periods only (M01-M12; skips annual averages and quarterly data)
+    keep = (month >= 1) & (month <= 12) & ~np.isnan(value)
+    
+    year, month, series_index = year[keep], month[keep].astype(np.int64), series_index[keep]
+    dates = ((year - 1970) * 12 + month - 1).astype('datetime64[M]').astype('datetime64[ns]')
+    state_code, states = sorted_codes(pd.Series([series_lookup[sid][0] for sid in series_ids], dtype=object))
+    var_code, variables = sorted_codes(pd.Series([series_lookup[sid][1] for sid in series_ids], dtype=object))
+    
+    return pd.DataFrame({
+        'Date': dates,
+        'Year': year,
+        'Month': month,
+        'State': pd.Categorical.from_codes(state_code[series_index], categories=states),
+        'Variable': pd.Categorical.from_codes(var_code[series_index], categories=variables),
+        'Value': value[keep],
+        'SeriesID': pd.Categorical.from_codes(np.arange(len(series_ids))[series_index],
+                                              categories=series_ids),
+    })
 
 
-def fetch_all_states():
+def fetch_all_states(watermarks=None, end_year=END_YEAR):
     """
     Fetch state-level control variables for all states.
-    Handles API rate limits by batching requests.
+    
+    Series are fetched concurrently by bls_client, which batches them within
+    the API limits, keeps the request rate under the API threshold and
+    checkpoints every finished batch (an interrupted run resumes from
+    CHECKPOINT_DIR; --fresh discards the checkpoints).
+    
+    Args:
+        watermarks (dict): (state, variable) -> last Date already stored
+            (optional); such series are requested from that date's year on
+        end_year (str): Last year to request
     
     Returns:
         pd.DataFrame: Panel data with state-level controls
@@ -141,80 +229,34 @@ def fetch_all_states():
     series_mapping = build_series_ids()
     all_series_ids = list(series_mapping.values())
     
+    # The API takes whole years: group series by their first missing year
+    windows = {}
+    for key, series_id in series_mapping.items():
+        start_year = str(watermarks[key].year) if watermarks and key in watermarks else START_YEAR
+        windows.setdefault(start_year, []).append(series_id)
+    
     print(f"Total series to fetch: {len(all_series_ids)}")
+    print(f"Request windows: {', '.join(f'{start}-{end_year} ({len(ids)} series)' for start, ids in sorted(windows.items()))}")
     print(f"Using API key: {'Yes' if BLS_API_KEY else 'No'}")
+    print(f"Concurrent requests: {WORKERS}")
     
-    # Batch size (BLS API limit: 50 series per request with key, 25 without)
-    batch_size = 50 if BLS_API_KEY else 25
+    if FRESH:
+        shutil.rmtree(CHECKPOINT_DIR, ignore_errors=True)
     
-    all_data = []
+    results, failures = {}, {}
+    for start_year, series_ids in sorted(windows.items()):
+        window_results, window_failures = fetch_series(
+            series_ids, start_year, end_year, api_key=BLS_API_KEY,
+            max_workers=WORKERS, checkpoint_dir=CHECKPOINT_DIR)
+        results.update(window_results)
+        failures.update(window_failures)
+    if failures:
+        print(f"\nFailed batches: {len(failures)} (rerun to retry them; finished batches are checkpointed)")
     
-    # Process in batches
-    for i in range(0, len(all_series_ids), batch_size):
-        batch = all_series_ids[i:i+batch_size]
-        batch_num = i // batch_size + 1
-        total_batches = (len(all_series_ids) + batch_size - 1) // batch_size
-        
-        print(f"\nFetching batch {batch_num}/{total_batches} ({len(batch)} series)...")
-        
-        results = fetch_bls_data(batch, BLS_API_KEY)
-        
-        if results is None:
-            print(f"Failed to fetch batch {batch_num}")
-            continue
-        
-        # Parse results
-        for (state, var_name), series_id in series_mapping.items():
-            if series_id not in results:
-                continue
-            
-            data_points = results[series_id]
-            if len(data_points) == 0:
-                continue
-            
-            for datapoint in data_points:
-                year = int(datapoint['year'])
-                period = datapoint['period']
-                
-                # Skip annual averages and quarterly data
-                if not period.startswith('M'):
-                    continue
-                
-                month = int(period[1:])
-                value = datapoint.get('value')
-                
-                if value in [None, '', '-']:
-                    continue
-                
-                try:
-                    value = float(value)
-                except:
-                    continue
-                
-                # Create date
-                date = pd.Timestamp(year=year, month=month, day=1)
-                
-                all_data.append({
-                    'Date': date,
-                    'Year': year,
-                    'Month': month,
-                    'State': state,
-                    'Variable': var_name,
-                    'Value': value,
-                    'SeriesID': series_id
-                })
-        
-        parsed_count = len([sid for (s, v), sid in series_mapping.items() if sid in results and len(results[sid]) > 0])
-        print(f"  Parsed {parsed_count} series with data from this batch")
-        
-        # Rate limiting
-        if i + batch_size < len(all_series_ids):
-            wait_time = 2 if BLS_API_KEY else 5
-            print(f"  Waiting {wait_time} seconds before next request...")
-            time.sleep(wait_time)
+    df = parse_laus_results(results, series_mapping)
     
-    # Convert to DataFrame
-    df = pd.DataFrame(all_data)
+    parsed_count = sum(1 for series_id in all_series_ids if results.get(series_id))
+    print(f"  Parsed {parsed_count} series with data")
     
     if df.empty:
         print("ERROR: No data retrieved!")
@@ -225,58 +267,121 @@ def fetch_all_states():
     return df
 
 
-def reshape_and_calculate(df):
+def to_long(df_wide):
     """
-    Reshape data from long to wide format and calculate derived variables.
+    Long format (one row per date, state and variable) of a wide output file.
     
     Args:
-        df (pd.DataFrame): Long-format data
+        df_wide (pd.DataFrame): Output of reshape_and_calculate()
     
     Returns:
-        pd.DataFrame: Wide-format with calculated variables
+        pd.DataFrame: Date, Year, Month, State, Variable and Value
     """
-    # Pivot to wide format
-    df_wide = df.pivot_table(
-        index=['Date', 'Year', 'Month', 'State'],
-        columns='Variable',
-        values='Value',
-        aggfunc='first'
-    ).reset_index()
-    
-    print(f"Available variables after pivot: {df_wide.columns.tolist()}")
-    
-    # Calculate Labor Force Participation Rate if population data is available
-    if 'population' in df_wide.columns and 'labor_force' in df_wide.columns:
-        df_wide['lfpr'] = (df_wide['labor_force'] / df_wide['population']) * 100
-        has_lfpr = True
-    else:
-        print("WARNING: Population data not available, cannot calculate LFPR")
-        has_lfpr = False
-    
-    # Rename columns for clarity
-    rename_dict = {
-        'unemployment_rate': 'UnemploymentRate',
-        'labor_force': 'LaborForce',
-        'employment': 'Employment_LAUS',  # Distinguish from CES employment
-    }
+    columns = {column: variable for column, variable in OUTPUT_COLUMNS.items()
+               if variable in SERIES_SUFFIXES and column in df_wide.columns}
+    df_long = df_wide.melt(id_vars=['Date', 'Year', 'Month', 'State'], value_vars=list(columns),
+                           var_name='Variable', value_name='Value')
+    df_long['Variable'] = df_long['Variable'].map(columns)
+    return df_long.dropna(subset=['Value']).reset_index(drop=True)
+
+
+def last_dates(df_long):
+    """
+    Last date with data per (state, variable).
     
-    if 'population' in df_wide.columns:
-        rename_dict['population'] = 'CivilianPopulation'
-    if has_lfpr:
-        rename_dict['lfpr'] = 'LFPR'
-        
-    df_wide = df_wide.rename(columns=rename_dict)
+    Args:
+        df_long (pd.DataFrame): Long-format data
+    
+    Returns:
+        dict: (state, variable) -> pd.Timestamp
+    """
+    return df_long.groupby(['State', 'Variable'], observed=True)['Date'].max().to_dict()
+
+
+def merge_incremental(existing, new):
+    """
+    Add newly fetched observations to the stored ones.
+    
+    Observations are keyed by (State, Variable, Date); where both have one
+    (the refetched part of the watermark year) the new value wins, so
+    revisions are picked up.
+    
+    Args:
+        existing (pd.DataFrame): Long format of the stored output (to_long())
+        new (pd.DataFrame): Output of fetch_all_states()
     
-    # Select final columns (only those that exist)
-    final_cols = ['Date', 'Year', 'Month', 'State']
-    for col in ['UnemploymentRate', 'LFPR', 'LaborForce', 'Employment_LAUS', 'CivilianPopulation']:
-        if col in df_wide.columns:
-            final_cols.append(col)
+    Returns:
+        pd.DataFrame: Merged long-format data
+    """
+    columns = ['Date', 'Year', 'Month', 'State', 'Variable', 'Value']
+    merged = pd.concat([existing[columns], new[columns]], ignore_index=True)
+    return merged.drop_duplicates(['State', 'Variable', 'Date'], keep='last').reset_index(drop=True)
+
+
+def reshape_and_calculate(df, area_column='State'):
+    """
+    Reshape data from long to wide format and calculate derived variables.
     
-    df_wide = df_wide[final_cols]
+    The wide frame is filled straight from the long columns: (date, area)
+    pairs become row numbers and variables column numbers of one value
+    matrix, so the cost is linear in the number of observations. Ratios are
+    computed on the matrix columns, and the output uses compact dtypes
+    (CONTROL_DTYPES).
     
-    # Sort by date and state
-    df_wide = df_wide.sort_values(['Date', 'State']).reset_index(drop=True)
+    Args:
+        df (pd.DataFrame): Long-format data
+        area_column (str): Column identifying the area (State; Area_Code
+            for sub-state data, see laus_flatfiles.py)
+    
+    Returns:
+        pd.DataFrame: Wide-format with calculated variables, sorted by date
+            and area
+    """
+    # Column of each observation (-1: unknown variable)
+    var_id, var_values = pd.factorize(df['Variable'])
+    variables = [variable for variable in SERIES_SUFFIXES if variable in set(var_values)]
+    position = [variables.index(v) if v in variables else -1 for v in var_values]
+    var_code = np.array(position + [-1], dtype=np.int64)[var_id]
+    value = df['Value'].to_numpy(dtype=float)
+    keep = (var_code >= 0) & ~np.isnan(value)
+    
+    # Row of each observation: (date, area) pairs in sorted order
+    date_code, dates = pd.factorize(df['Date'], sort=True)
+    area_code, areas = sorted_codes(df[area_column])
+    row_key = date_code[keep].astype(np.int64) * len(areas) + area_code[keep]
+    row, keys = pd.factorize(row_key, sort=True)
+    column = var_code[keep]
+    
+    # First observation per (row, variable) cell
+    cell = row.astype(np.int64) * len(variables) + column
+    values = np.full((len(keys), len(variables)), np.nan)
+    if len(cell) and np.bincount(cell).max() > 1:
+        first = ~pd.Series(cell).duplicated().to_numpy()
+        values[row[first], column[first]] = value[keep][first]
+    else:
+        values[row, column] = value[keep]
+    
+    print(f"Available variables after reshape: {['Date', 'Year', 'Month', area_column] + variables}")
+    
+    row_dates = pd.DatetimeIndex(dates[keys // len(areas)])
+    df_wide = pd.DataFrame({
+        'Date': row_dates,
+        'Year': row_dates.year.astype(CONTROL_DTYPES['Year']),
+        'Month': row_dates.month.astype(CONTROL_DTYPES['Month']),
+        area_column: pd.Categorical.from_codes(keys % len(areas), categories=areas),
+    })
+    
+    columns = {variable: values[:, i] for i, variable in enumerate(variables)}
+    for ratio, (numerator, denominator) in RATIO_VARIABLES.items():
+        if numerator in columns and denominator in columns:
+            columns[ratio] = columns[numerator] / columns[denominator] * 100
+        elif ratio == 'lfpr':
+            print("WARNING: Population data not available, cannot calculate LFPR")
+    
+    # Final columns (only those that exist)
+    for column, variable in OUTPUT_COLUMNS.items():
+        if variable in columns:
+            df_wide[column] = columns[variable].astype(CONTROL_DTYPES[column])
     
     return df_wide
 
@@ -289,10 +394,29 @@ def main():
     print(f"Start Date: {START_YEAR}-01")
     print(f"End Date: {END_YEAR}-09")
     print(f"Geographic Units: {len(STATE_FIPS)} (50 states + DC + national)")
+    print(f"Mode: {'incremental' if INCREMENTAL else 'full'}")
     print("="*70)
     
+    incremental = INCREMENTAL and OUTPUT_PATH.exists()
+    watermarks = {}
+    if incremental:
+        existing = to_long(pd.read_csv(OUTPUT_PATH, parse_dates=['Date']))
+        watermarks = last_dates(existing)
+        incremental = bool(watermarks)
+    if INCREMENTAL and not incremental:
+        print(f"No existing data in {OUTPUT_PATH.name}; fetching the full history")
+    
     # Fetch data
-    df_long = fetch_all_states()
+    if incremental:
+        print(f"Existing data through {max(watermarks.values()):%Y-%m} ({len(existing):,} observations)")
+        
+        df_new = fetch_all_states(watermarks, end_year=str(max(int(END_YEAR), datetime.now().year)))
+        new_keys = df_new[['State', 'Variable', 'Date']].merge(
+            existing[['State', 'Variable', 'Date']], how='left', indicator=True)
+        print(f"New observations: {(new_keys['_merge'] == 'left_only').sum():,}")
+        df_long = merge_incremental(existing, df_new) if not df_new.empty else existing
+    else:
+        df_long = fetch_all_states()
     
     if df_long.empty:
         print("\nNo data retrieved. Exiting.")
@@ -320,20 +444,26 @@ def main():
     print(df_wide.isnull().sum())
     
     # Save to CSV
-    output_path = Path(__file__).parent.parent / 'data' / 'state_controls.csv'
-    df_wide.to_csv(output_path, index=False)
-    print(f"\nData saved to: {output_path}")
-    print(f"File size: {output_path.stat().st_size / 1024:.1f} KB")
+    df_wide.to_csv(OUTPUT_PATH, index=False)
+    print(f"\nData saved to: {OUTPUT_PATH}")
+    print(f"File size: {OUTPUT_PATH.stat().st_size / 1024:.1f} KB")
+    
+    # Last month stored per state and variable (where --incremental resumes)
+    watermarks = {}
+    for (state, variable), date in sorted(last_dates(df_long).items()):
+        watermarks.setdefault(state, {})[variable] = f"{date:%Y-%m}"
     
     # Save metadata
     metadata = {
         'source': 'BLS Local Area Unemployment Statistics (LAUS)',
         'series_ids_sample': list(build_series_ids().values())[:5],
         'fetch_date': datetime.now().isoformat(),
-        'start_period': f"{START_YEAR}-01",
-        'end_period': f"{END_YEAR}-09",
+        'refresh': 'incremental' if incremental else 'full',
+        'start_period': f"{df_wide['Date'].min():%Y-%m}",
+        'end_period': f"{df_wide['Date'].max():%Y-%m}",
         'n_states': df_wide['State'].nunique(),
         'n_observations': len(df_wide),
+        'watermarks': watermarks,
         'variables': {
             'UnemploymentRate': 'State unemployment rate (%)',
             'LFPR': 'Labor force participation rate (%) = (Labor Force / Population) * 100',
@@ -343,10 +473,12 @@ def main():
         }
     }
     
-    metadata_path = Path(__file__).parent.parent / 'data' / 'state_controls_metadata.json'
-    with open(metadata_path, 'w') as f:
+    with open(METADATA_PATH, 'w') as f:
         json.dump(metadata, f, indent=2)
-    print(f"Metadata saved to: {metadata_path}")
+    print(f"Metadata saved to: {METADATA_PATH}")
+    
+    # The saved output supersedes the API checkpoints
+    shutil.rmtree(CHECKPOINT_DIR, ignore_errors=True)
     
     print("\n" + "="*70)
     print("FETCH COMPLETE")
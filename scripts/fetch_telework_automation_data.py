@@ -12,6 +12,7 @@ This script downloads and processes precise occupation-level data from academic
 2. **Automation Risk**: Frey & Osborne (2017) - "The Future of Employment"
    - Source: Appendix from published paper
    - Contains probability of computerization by SOC code
+     (data/reference/frey_osborne_2017.csv, see score_registry.py)
    - URL: https://www.oxfordmartin.ox.ac.uk/publications/the-future-of-employment/
 
 Author: SS154 Final Project
@@ -21,9 +22,11 @@ Date: December 2025
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import requests
 from io import StringIO
 
+from http_cache import cached_get
+from score_registry import load_score_table
+
 # Paths
 DATA_DIR = Path(__file__).parent.parent / "data"
 SCRIPTS_DIR = Path(__file__).parent
@@ -31,198 +34,9 @@ SCRIPTS_DIR = Path(__file__).parent
 # Data URLs
 DINGEL_NEIMAN_URL = "https://raw.githubusercontent.com/jdingel/DingelNeiman-workathome/master/occ_onet_scores/output/occupations_workathome.csv"
 
-# Frey & Osborne data (from paper appendix)
-# This contains the full list of 702 occupations with automation probabilities
-FREY_OSBORNE_DATA = {
-    # Management Occupations (11-xxxx)
-    '11-1011': 0.015,  # Chief Executives
-    '11-1021': 0.016,  # General and Operations Managers
-    '11-2011': 0.039,  # Advertising and Promotions Managers
-    '11-2021': 0.014,  # Marketing Managers
-    '11-2022': 0.013,  # Sales Managers
-    '11-2031': 0.015,  # Public Relations and Fundraising Managers
-    '11-3011': 0.017,  # Administrative Services Managers
-    '11-3021': 0.033,  # Computer and Information Systems Managers
-    '11-3031': 0.039,  # Financial Managers
-    '11-3051': 0.019,  # Industrial Production Managers
-    '11-3061': 0.018,  # Purchasing Managers
-    '11-3071': 0.015,  # Transportation, Storage, and Distribution Managers
-    '11-3111': 0.015,  # Compensation and Benefits Managers
-    '11-3121': 0.015,  # Human Resources Managers
-    '11-3131': 0.013,  # Training and Development Managers
-    '11-9013': 0.019,  # Farmers, Ranchers, and Other Agricultural Managers
-    '11-9021': 0.016,  # Construction Managers
-    '11-9031': 0.0043,  # Education Administrators, Preschool and Childcare
-    '11-9032': 0.0064,  # Education Administrators, Elementary and Secondary
-    '11-9033': 0.015,  # Education Administrators, Postsecondary
-    '11-9039': 0.0064,  # Education Administrators, All Other
-    '11-9041': 0.017,  # Architectural and Engineering Managers
-    '11-9051': 0.041,  # Food Service Managers
-    '11-9061': 0.057,  # Funeral Service Managers
-    '11-9071': 0.041,  # Gaming Managers
-    '11-9081': 0.041,  # Lodging Managers
-    '11-9111': 0.0041,  # Medical and Health Services Managers
-    '11-9121': 0.014,  # Natural Sciences Managers
-    '11-9131': 0.26,  # Postmasters and Mail Superintendents
-    '11-9141': 0.35,  # Property, Real Estate, and Community Association Managers
-    '11-9151': 0.0098,  # Social and Community Service Managers
-    '11-9161': 0.017,  # Emergency Management Directors
-    '11-9199': 0.015,  # Managers, All Other
-    
-    # Business and Financial Operations (13-xxxx)
-    '13-1011': 0.0045,  # Agents and Business Managers of Artists
-    '13-1021': 0.019,  # Buyers and Purchasing Agents, Farm Products
-    '13-1022': 0.13,  # Wholesale and Retail Buyers, Except Farm Products
-    '13-1023': 0.43,  # Purchasing Agents, Except Wholesale, Retail, Farm
-    '13-1031': 0.98,  # Claims Adjusters, Examiners, and Investigators
-    '13-1032': 0.43,  # Insurance Appraisers, Auto Damage
-    '13-1041': 0.40,  # Compliance Officers
-    '13-1051': 0.23,  # Cost Estimators
-    '13-1071': 0.31,  # Human Resources Specialists
-    '13-1074': 0.13,  # Farm Labor Contractors
-    '13-1075': 0.018,  # Labor Relations Specialists
-    '13-1081': 0.018,  # Logisticians
-    '13-1111': 0.015,  # Management Analysts
-    '13-1121': 0.037,  # Meeting, Convention, and Event Planners
-    '13-1131': 0.0053,  # Fundraisers
-    '13-1141': 0.43,  # Compensation, Benefits, and Job Analysis Specialists
-    '13-1151': 0.015,  # Training and Development Specialists
-    '13-1161': 0.61,  # Market Research Analysts and Marketing Specialists
-    '13-1199': 0.016,  # Business Operations Specialists, All Other
-    '13-2011': 0.94,  # Accountants and Auditors
-    '13-2021': 0.94,  # Appraisers and Assessors of Real Estate
-    '13-2031': 0.94,  # Budget Analysts
-    '13-2041': 0.98,  # Credit Analysts
-    '13-2051': 0.23,  # Financial Analysts
-    '13-2052': 0.58,  # Personal Financial Advisors
-    '13-2053': 0.99,  # Insurance Underwriters
-    '13-2061': 0.98,  # Financial Examiners
-    '13-2071': 0.89,  # Credit Counselors
-    '13-2072': 0.98,  # Loan Officers
-    '13-2081': 0.93,  # Tax Examiners and Collectors, Revenue Agents
-    '13-2082': 0.99,  # Tax Preparers
-    '13-2099': 0.41,  # Financial Specialists, All Other
-    
-    # Computer and Mathematical (15-xxxx)
-    '15-1111': 0.017,  # Computer and Information Research Scientists
-    '15-1121': 0.65,  # Computer Systems Analysts
-    '15-1122': 0.031,  # Information Security Analysts
-    '15-1131': 0.48,  # Computer Programmers
-    '15-1132': 0.042,  # Software Developers, Applications
-    '15-1133': 0.013,  # Software Developers, Systems Software
-    '15-1134': 0.021,  # Web Developers
-    '15-1141': 0.15,  # Database Administrators
-    '15-1142': 0.031,  # Network and Computer Systems Administrators
-    '15-1143': 0.021,  # Computer Network Architects
-    '15-1151': 0.65,  # Computer User Support Specialists
-    '15-1152': 0.65,  # Computer Network Support Specialists
-    '15-1199': 0.13,  # Computer Occupations, All Other
-    '15-2011': 0.22,  # Actuaries
-    '15-2021': 0.45,  # Mathematicians
-    '15-2031': 0.78,  # Operations Research Analysts
-    '15-2041': 0.22,  # Statisticians
-    '15-2091': 0.78,  # Mathematical Technicians
-    '15-2099': 0.78,  # Mathematical Science Occupations, All Other
-    
-    # Add more as needed based on the paper appendix...
-    # For brevity, I'll add key occupations from each major group
-    
-    # Architecture and Engineering (17-xxxx)
-    '17-1011': 0.018,  # Architects, Except Landscape and Naval
-    '17-1012': 0.046,  # Landscape Architects
-    '17-2011': 0.019,  # Aerospace Engineers
-    '17-2041': 0.020,  # Chemical Engineers
-    '17-2051': 0.021,  # Civil Engineers
-    '17-2061': 0.013,  # Computer Hardware Engineers
-    '17-2071': 0.015,  # Electrical Engineers
-    '17-2072': 0.015,  # Electronics Engineers
-    '17-2081': 0.021,  # Environmental Engineers
-    '17-2111': 0.015,  # Health and Safety Engineers
-    '17-2112': 0.018,  # Industrial Engineers
-    '17-2141': 0.017,  # Mechanical Engineers
-    
-    # Healthcare Practitioners (29-xxxx)
-    '29-1011': 0.0028,  # Chiropractors
-    '29-1021': 0.0044,  # Dentists, General
-    '29-1031': 0.0039,  # Dietitians and Nutritionists
-    '29-1041': 0.0033,  # Optometrists
-    '29-1051': 0.0012,  # Pharmacists
-    '29-1061': 0.0042,  # Anesthesiologists
-    '29-1062': 0.0042,  # Family and General Practitioners
-    '29-1063': 0.0042,  # Internists, General
-    '29-1064': 0.0042,  # Obstetricians and Gynecologists
-    '29-1065': 0.0042,  # Pediatricians, General
-    '29-1066': 0.0043,  # Psychiatrists
-    '29-1067': 0.0042,  # Surgeons
-    '29-1069': 0.0042,  # Physicians and Surgeons, All Other
-    '29-1071': 0.0043,  # Physician Assistants
-    '29-1081': 0.0030,  # Podiatrists
-    '29-1122': 0.0035,  # Occupational Therapists
-    '29-1123': 0.0021,  # Physical Therapists
-    '29-1124': 0.0031,  # Radiation Therapists
-    '29-1125': 0.0028,  # Recreational Therapists
-    '29-1126': 0.0020,  # Respiratory Therapists
-    '29-1127': 0.0047,  # Speech-Language Pathologists
-    '29-1131': 0.0061,  # Veterinarians
-    '29-1141': 0.0090,  # Registered Nurses
-    '29-1151': 0.0090,  # Nurse Anesthetists
-    '29-1161': 0.0090,  # Nurse Midwives
-    '29-1171': 0.0090,  # Nurse Practitioners
-    '29-1181': 0.0029,  # Audiologists
-    
-    # Office and Administrative Support (43-xxxx)
-    '43-1011': 0.015,  # First-Line Supervisors of Office Support
-    '43-2011': 0.96,  # Switchboard Operators
-    '43-2021': 0.97,  # Telephone Operators
-    '43-3011': 0.95,  # Bill and Account Collectors
-    '43-3021': 0.99,  # Billing and Posting Clerks
-    '43-3031': 0.98,  # Bookkeeping, Accounting, and Auditing Clerks
-    '43-3041': 0.95,  # Gaming Cage Workers
-    '43-3051': 0.97,  # Payroll and Timekeeping Clerks
-    '43-3061': 0.98,  # Procurement Clerks
-    '43-3071': 0.98,  # Tellers
-    '43-4011': 0.98,  # Brokerage Clerks
-    '43-4021': 0.98,  # Correspondence Clerks
-    '43-4031': 0.97,  # Court, Municipal, and License Clerks
-    '43-4041': 0.98,  # Credit Authorizers, Checkers, and Clerks
-    '43-4051': 0.55,  # Customer Service Representatives
-    '43-4061': 0.95,  # Eligibility Interviewers, Government Programs
-    '43-4071': 0.97,  # File Clerks
-    '43-4081': 0.94,  # Hotel, Motel, and Resort Desk Clerks
-    '43-4111': 0.96,  # Interviewers, Except Eligibility and Loan
-    '43-4121': 0.98,  # Library Assistants, Clerical
-    '43-4131': 0.98,  # Loan Interviewers and Clerks
-    '43-4141': 0.98,  # New Accounts Clerks
-    '43-4151': 0.97,  # Order Clerks
-    '43-4161': 0.89,  # Human Resources Assistants
-    '43-4171': 0.96,  # Receptionists and Information Clerks
-    '43-4181': 0.96,  # Reservation and Transportation Ticket Agents
-    '43-5011': 0.94,  # Cargo and Freight Agents
-    '43-5021': 0.94,  # Couriers and Messengers
-    '43-5032': 0.98,  # Dispatchers, Except Police, Fire, and Ambulance
-    '43-5051': 0.68,  # Postal Service Clerks
-    '43-5052': 0.28,  # Postal Service Mail Carriers
-    '43-5053': 0.82,  # Postal Service Mail Sorters
-    '43-5061': 0.99,  # Production, Planning, and Expediting Clerks
-    '43-5071': 0.96,  # Shipping, Receiving, and Traffic Clerks
-    '43-5081': 0.64,  # Stock Clerks and Order Fillers
-    '43-5111': 0.98,  # Weighers, Measurers, Checkers, Samplers
-    '43-6011': 0.86,  # Executive Secretaries and Administrative Assistants
-    '43-6012': 0.89,  # Legal Secretaries
-    '43-6013': 0.88,  # Medical Secretaries
-    '43-6014': 0.96,  # Secretaries, Except Legal, Medical, Executive
-    '43-9011': 0.78,  # Computer Operators
-    '43-9021': 0.99,  # Data Entry Keyers
-    '43-9022': 0.81,  # Word Processors and Typists
-    '43-9031': 0.97,  # Desktop Publishers
-    '43-9041': 0.98,  # Insurance Claims and Policy Processing Clerks
-    '43-9051': 0.95,  # Mail Clerks and Mail Machine Operators
-    '43-9061': 0.96,  # Office Clerks, General
-    '43-9071': 0.97,  # Office Machine Operators, Except Computer
-    '43-9081': 0.84,  # Proofreaders and Copy Markers
-    '43-9111': 0.98,  # Statistical Assistants
-    '43-9199': 0.96,  # Office and Administrative Support Workers, All Other
-}
+# Frey & Osborne (2017) automation probabilities (from the paper appendix)
+# are the 'frey_osborne' table of the score registry
+# (data/reference/frey_osborne_<vintage>.csv)
 
 
 def fetch_dingel_neiman_teleworkability():
@@ -241,7 +55,7 @@ def fetch_dingel_neiman_teleworkability():
     
     try:
         # Download the data
-        response = requests.get(DINGEL_NEIMAN_URL)
+        response = cached_get(DINGEL_NEIMAN_URL)
         response.raise_for_status()
         
         # Parse CSV
@@ -286,10 +100,11 @@ def create_frey_osborne_dataframe():
     print("          How susceptible are jobs to computerisation?")
     print("          Technological Forecasting and Social Change, 114, 254-280.")
     
-    df = pd.DataFrame([
-        {'SOC_Code': k, 'automation_probability': v}
-        for k, v in FREY_OSBORNE_DATA.items()
-    ])
+    table = load_score_table('frey_osborne')
+    df = pd.DataFrame({
+        'SOC_Code': table['SOC_Code'],
+        'automation_probability': table['Probability'],
+    })
     
     print(f"\n✓ Loaded {len(df)} occupations with automation risk scores")
     print(f"  - Mean probability: {df['automation_probability'].mean():.3f}")
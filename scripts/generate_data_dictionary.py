@@ -8,16 +8,19 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from panel_io import PANEL_CSV_PATH, PANEL_DATASET_DIR, read_panel
+
 # Paths
 BASE_DIR = Path(__file__).parent.parent
-DATA_FILE = BASE_DIR / "data" / "occupation_panel.csv"
+DATA_FILE = PANEL_DATASET_DIR if PANEL_DATASET_DIR.exists() else PANEL_CSV_PATH
 OUTPUT_FILE = BASE_DIR / "docs" / "DATA_DICTIONARY.md"
 
 print(f"Loading data from: {DATA_FILE}")
-print("This may take 30-60 seconds for large files...")
 
-# Read without strict dtypes (BLS uses * for suppressed values)
-df = pd.read_csv(DATA_FILE, low_memory=False)
+# Read without strict dtypes (BLS uses * for suppressed values).
+# State, Industry and Occupation load as categoricals, so groupbys below
+# use observed=True to skip unobserved category combinations.
+df = read_panel()
 
 # Convert numeric columns (handle BLS symbols like *, #, **)
 numeric_cols = ['Employment', 'Hourly_Mean_Wage', 'Annual_Mean_Wage', 'LogEmployment']
@@ -31,7 +34,7 @@ print("Generating data dictionary...")
 
 with open(OUTPUT_FILE, 'w') as f:
     f.write('# Data Dictionary: Occupation Panel\n\n')
-    f.write(f'Generated from: `data/occupation_panel.csv`\n\n')
+    f.write(f'Generated from: `{DATA_FILE.relative_to(BASE_DIR)}`\n\n')
     f.write(f'**Total Observations:** {len(df):,}\n\n')
     f.write(f'**Date Generated:** December 16, 2025\n\n')
     f.write('---\n\n')
@@ -67,7 +70,7 @@ with open(OUTPUT_FILE, 'w') as f:
     print("  Processing occupations...")
     f.write('### Occupations\n\n')
     # Get unique occupations efficiently
-    occ_counts = df.groupby(['Occupation_Code', 'Occupation']).size().reset_index(name='obs_count')
+    occ_counts = df.groupby(['Occupation_Code', 'Occupation'], observed=True).size().reset_index(name='obs_count')
     occ_counts = occ_counts.sort_values('Occupation_Code')
     
     f.write(f'**Total unique occupations:** {len(occ_counts)}\n\n')
@@ -83,7 +86,7 @@ with open(OUTPUT_FILE, 'w') as f:
     # Top 20 occupations by employment
     print("  Calculating top occupations...")
     f.write('### Top 20 Occupations by Total Employment\n\n')
-    top_occs = df.groupby(['Occupation_Code', 'Occupation'], dropna=False)['Employment'].sum().sort_values(ascending=False).head(20)
+    top_occs = df.groupby(['Occupation_Code', 'Occupation'], dropna=False, observed=True)['Employment'].sum().sort_values(ascending=False).head(20)
     f.write('| Rank | SOC Code | Occupation | Total Employment |\n')
     f.write('|------|----------|------------|------------------|\n')
     for i, ((code, title), emp) in enumerate(top_occs.items(), 1):
@@ -203,7 +206,7 @@ with open(OUTPUT_FILE, 'w') as f:
     
     # Balance check
     f.write('### Panel Balance\n\n')
-    obs_per_unit = df.groupby(['State', 'Industry', 'Occupation']).size()
+    obs_per_unit = df.groupby(['State', 'Industry', 'Occupation'], observed=True).size()
     f.write(f'**State × Industry × Occupation units:** {len(obs_per_unit):,}\n\n')
     f.write('| Years per unit | Count | Percent |\n')
     f.write('|----------------|-------|----------|\n')
@@ -0,0 +1,312 @@
+"""
+On-Disk HTTP Response Cache
+===========================
+
+Shared cache for the API fetchers (BLS timeseries API, Dingel & Neiman CSV):
+
+- Entries are keyed by method, URL and request payload (JSON payloads are
+  canonicalized; the BLS registration key is left out of the key and is
+  never written to disk)
+- Each entry is one gzip file: a JSON header line (URL, status, content
+  type, time fetched) followed by the raw response body
+- Entries older than the TTL are refetched; when the cache grows past its
+  size bound the least recently used entries are evicted (hits refresh the
+  file mtime). The size is kept as a running total per process (the
+  directory is scanned once, then only when evicting down to 90% of the
+  bound), so a store does not rescan the cache
+- Offline mode replays cached responses regardless of age and raises
+  CacheMissError (a requests.ConnectionError) instead of going to the network
+
+Configuration (environment variables, e.g. in .env or CI):
+    HTTP_CACHE_DIR       cache directory (default data/http_cache)
+    HTTP_CACHE_TTL       entry lifetime in seconds (default 86400)
+    HTTP_CACHE_MAX_MB    size bound in MB (default 512)
+    HTTP_CACHE_OFFLINE   1 = replay only, never touch the network
+    HTTP_CACHE_DISABLE   1 = bypass the cache
+
+Scripts also accept --offline and --no-http-cache.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+import requests
+
+# Paths
+CACHE_DIR = Path(os.getenv('HTTP_CACHE_DIR', Path(__file__).parent.parent / 'data' / 'http_cache'))
+
+# Entry lifetime and size bound
+DEFAULT_TTL = int(os.getenv('HTTP_CACHE_TTL', 24 * 3600))  # seconds
+MAX_CACHE_BYTES = int(float(os.getenv('HTTP_CACHE_MAX_MB', 512)) * 1024 * 1024)
+
+# Eviction frees space down to this share of the bound, so a full cache is
+# rescanned only every few stores rather than on each one
+EVICT_TO_FRACTION = 0.9
+
+# Replay only (--offline), or bypass the cache (--no-http-cache)
+OFFLINE = os.getenv('HTTP_CACHE_OFFLINE') == '1' or '--offline' in sys.argv
+DISABLED = os.getenv('HTTP_CACHE_DISABLE') == '1' or '--no-http-cache' in sys.argv
+
+# Payload fields that identify the caller rather than the request
+SECRET_FIELDS = ('registrationkey',)
+
+ENTRY_SUFFIX = '.gz'
+
+# Running size of each cache directory's entries (bytes), set by cache_size()
+_cache_bytes = {}
+_size_lock = threading.Lock()
+
+
+class CacheMissError(requests.ConnectionError):
+    """Raised in offline mode when a request has no cached response."""
+
+
+def _canonical_payload(json_payload=None, data=None):
+    """Request body as a JSON-serializable value, without secret fields."""
+    payload = json_payload
+    if payload is None and data is not None:
+        if isinstance(data, bytes):
+            data = data.decode('utf-8', errors='replace')
+        try:
+            payload = json.loads(data) if isinstance(data, str) else data
+        except ValueError:
+            payload = data
+    if isinstance(payload, dict):
+        payload = {k: v for k, v in payload.items() if k not in SECRET_FIELDS}
+    return payload
+
+
+def cache_key(method, url, json_payload=None, data=None, params=None):
+    """
+    Cache key of a request.
+
+    Args:
+        method (str): HTTP method
+        url (str): URL
+        json_payload: JSON body (optional)
+        data: Raw body (optional; JSON strings are canonicalized)
+        params (dict): Query parameters (optional)
+
+    Returns:
+        str: Hex digest
+    """
+    request = [method.upper(), url, params or {}, _canonical_payload(json_payload, data)]
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _entry_path(key, cache_dir=None):
+    return Path(cache_dir or CACHE_DIR) / f'{key}{ENTRY_SUFFIX}'
+
+
+def _to_response(header, body):
+    """requests.Response rebuilt from a cache entry."""
+    response = requests.models.Response()
+    response.status_code = header['status_code']
+    response.url = header['url']
+    response.headers['Content-Type'] = header.get('content_type') or ''
+    response.encoding = header.get('encoding')
+    response._content = body
+    response.from_cache = True
+    return response
+
+
+def load(key, ttl=None, cache_dir=None):
+    """
+    Cached response of a key.
+
+    Args:
+        key (str): Output of cache_key()
+        ttl (int): Maximum age in seconds (default DEFAULT_TTL; ignored offline)
+        cache_dir (Path): Cache directory (default CACHE_DIR)
+
+    Returns:
+        requests.Response: The cached response, or None if missing or expired
+    """
+    path = _entry_path(key, cache_dir)
+    try:
+        with gzip.open(path, 'rb') as f:
+            header = json.loads(f.readline())
+            body = f.read()
+    except (OSError, ValueError, EOFError):
+        return None
+
+    ttl = DEFAULT_TTL if ttl is None else ttl
+    if not OFFLINE and time.time() - header['fetched'] > ttl:
+        return None
+
+    try:
+        os.utime(path)  # mark as recently used
+    except OSError:
+        pass
+    return _to_response(header, body)
+
+
+def _entries(cache_dir=None):
+    """(mtime, size, path) of every cache entry."""
+    entries = []
+    for path in Path(cache_dir or CACHE_DIR).glob(f'*{ENTRY_SUFFIX}'):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def cache_size(cache_dir=None):
+    """
+    Size of the cache entries in bytes.
+
+    The directory is scanned on the first call only; store() and evict()
+    keep the total up to date afterwards.
+
+    Args:
+        cache_dir (Path): Cache directory (default CACHE_DIR)
+
+    Returns:
+        int: Total entry size
+    """
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    with _size_lock:
+        if cache_dir not in _cache_bytes:
+            _cache_bytes[cache_dir] = sum(size for _, size, _ in _entries(cache_dir))
+        return _cache_bytes[cache_dir]
+
+
+def store(key, response, cache_dir=None, max_bytes=MAX_CACHE_BYTES):
+    """
+    Write a response to the cache (atomically) and enforce the size bound.
+
+    Args:
+        key (str): Output of cache_key()
+        response (requests.Response): Response to store
+        cache_dir (Path): Cache directory (default CACHE_DIR)
+        max_bytes (int): Size bound of the cache directory
+    """
+    path = _entry_path(key, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cache_size(path.parent)  # scan before this entry is counted
+    header = {
+        'url': response.url,
+        'status_code': response.status_code,
+        'content_type': response.headers.get('Content-Type'),
+        'encoding': response.encoding,
+        'fetched': time.time(),
+    }
+
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with gzip.open(tmp_path, 'wb') as f:
+        f.write(json.dumps(header).encode() + b'\n')
+        f.write(response.content)
+    new_size = tmp_path.stat().st_size
+    try:
+        old_size = path.stat().st_size
+    except OSError:
+        old_size = 0
+    os.replace(tmp_path, path)
+
+    with _size_lock:
+        _cache_bytes[path.parent] += new_size - old_size
+        over = _cache_bytes[path.parent] > max_bytes
+    if over:
+        evict(cache_dir, int(max_bytes * EVICT_TO_FRACTION))
+
+
+def evict(cache_dir=None, max_bytes=MAX_CACHE_BYTES):
+    """
+    Delete least recently used entries until the cache fits in max_bytes.
+
+    Scans the directory, so the running total of cache_size() is also
+    corrected for entries written by other processes.
+
+    Returns:
+        int: Number of entries deleted
+    """
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    entries = _entries(cache_dir)
+
+    total = sum(size for _, size, _ in entries)
+    deleted = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        deleted += 1
+
+    with _size_lock:
+        _cache_bytes[cache_dir] = total
+    return deleted
+
+
+def clear(cache_dir=None):
+    """Delete every cache entry."""
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    for path in cache_dir.glob(f'*{ENTRY_SUFFIX}'):
+        path.unlink(missing_ok=True)
+    with _size_lock:
+        _cache_bytes[cache_dir] = 0
+
+
+def cached_request(method, url, session=None, ttl=None, cache_if=None, before_request=None,
+                   cache_dir=None, **kwargs):
+    """
+    Send a request through the cache.
+
+    Args:
+        method (str): HTTP method
+        url (str): URL
+        session (requests.Session): Session to send with (default: requests)
+        ttl (int): Maximum age of a cached response in seconds
+        cache_if (callable): Response -> bool, whether to store a fresh
+            response (default: 2xx status)
+        before_request (callable): Called right before a network request
+            (e.g. a rate limiter's acquire), not on cache hits
+        cache_dir (Path): Cache directory (default CACHE_DIR)
+        **kwargs: Passed to requests (json, data, params, headers, timeout, ...)
+
+    Returns:
+        requests.Response: Response; `from_cache` tells whether it was replayed
+
+    Raises:
+        CacheMissError: Offline and not cached
+    """
+    if DISABLED:
+        if before_request is not None:
+            before_request()
+        response = (session or requests).request(method, url, **kwargs)
+        response.from_cache = False
+        return response
+
+    key = cache_key(method, url, kwargs.get('json'), kwargs.get('data'), kwargs.get('params'))
+    cached = load(key, ttl, cache_dir)
+    if cached is not None:
+        return cached
+    if OFFLINE:
+        raise CacheMissError(f"Offline and not cached: {method.upper()} {url}")
+
+    if before_request is not None:
+        before_request()
+    response = (session or requests).request(method, url, **kwargs)
+    response.from_cache = False
+    if (cache_if or (lambda r: r.ok))(response):
+        store(key, response, cache_dir)
+    return response
+
+
+def cached_get(url, **kwargs):
+    """GET through the cache (see cached_request)."""
+    return cached_request('GET', url, **kwargs)
+
+
+def cached_post(url, **kwargs):
+    """POST through the cache (see cached_request)."""
+    return cached_request('POST', url, **kwargs)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+LAUS Controls from BLS Flat Files
+=================================
+
+Bulk ingestion of sub-state LAUS controls (counties, metropolitan areas,
+...) from the BLS time series flat files, for area levels whose series
+counts (tens of thousands) are far beyond the API quotas used by
+fetch_state_controls.py.
+
+Source:
+https://download.bls.gov/pub/time.series/la/ (la.data.* data files and
+la.area area names; tab-delimited text with a header row).
+
+Series ID layout (20 characters):
+
+    LA  U  CN0100100000000  03
+    |   |  |                +- measure (03 unemployment rate, 05 employment,
+    |   |  |                   06 labor force; see SERIES_SUFFIXES)
+    |   |  +- area code (15): area type (2) + area digits (the first two
+    |   |     are the state FIPS code for counties, metros, ...)
+    |   +- S seasonally adjusted / U not adjusted (sub-state: U only)
+    +- survey
+
+Data files are stream-parsed in chunks of CHUNK_ROWS rows. Series IDs,
+years and periods repeat heavily within a chunk, so the area type,
+seasonality and measure filters are evaluated once per distinct value and
+gathered back to the rows; only matching rows are kept, as integer codes
+and floats.
+
+Usage:
+    python scripts/laus_flatfiles.py [--area-types county,metro]
+        [--raw-dir data/laus_raw] [--no-download]
+
+--raw-dir can point at local fixture files (plain or .gz); with
+--no-download missing files are an error instead of being fetched.
+
+Output: data/laus_area_controls.parquet (Date × area, same measures and
+dtypes as data/state_controls.csv) and data/laus_area_controls_metadata.json.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from fetch_state_controls import END_YEAR, SERIES_SUFFIXES, START_YEAR, reshape_and_calculate
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+RAW_DIR = DATA_DIR / 'laus_raw'
+OUTPUT_PATH = DATA_DIR / 'laus_area_controls.parquet'
+METADATA_PATH = DATA_DIR / 'laus_area_controls_metadata.json'
+LAUS_FLATFILE_URL = 'https://download.bls.gov/pub/time.series/la/'
+
+# Area level -> area code prefix and the flat file holding its series
+AREA_TYPES = {
+    'state': {'prefix': 'ST', 'file': 'la.data.2.AllStatesU'},
+    'metro': {'prefix': 'MT', 'file': 'la.data.60.Metro'},
+    'division': {'prefix': 'DV', 'file': 'la.data.61.Division'},
+    'micro': {'prefix': 'MC', 'file': 'la.data.62.Micro'},
+    'combined': {'prefix': 'CS', 'file': 'la.data.63.Combined'},
+    'county': {'prefix': 'CN', 'file': 'la.data.64.County'},
+    'city': {'prefix': 'CT', 'file': 'la.data.65.City'},
+}
+AREA_FILE = 'la.area'
+
+# Area levels ingested by default (--area-types a,b)
+DEFAULT_AREA_TYPES = ['county', 'metro']
+AREA_TYPE_NAMES = DEFAULT_AREA_TYPES
+if '--area-types' in sys.argv:
+    AREA_TYPE_NAMES = sys.argv[sys.argv.index('--area-types') + 1].split(',')
+
+# Raw file directory (--raw-dir PATH), and whether missing files are fetched
+if '--raw-dir' in sys.argv:
+    RAW_DIR = Path(sys.argv[sys.argv.index('--raw-dir') + 1])
+DOWNLOAD = '--no-download' not in sys.argv
+
+# Rows per streamed chunk
+CHUNK_ROWS = 500_000
+
+# Data file columns (names in the header row are space-padded)
+DATA_COLUMNS = ['series_id', 'year', 'period', 'value']
+
+
+def resolve_raw_file(name, raw_dir=None):
+    """
+    Local copy of a flat file (plain or .gz).
+
+    Returns:
+        Path: Existing file, or None
+    """
+    raw_dir = Path(raw_dir or RAW_DIR)
+    for path in (raw_dir / name, raw_dir / f'{name}.gz'):
+        if path.exists():
+            return path
+    return None
+
+
+def download_flatfiles(names, raw_dir=None):
+    """
+    Download flat files missing from raw_dir (resumable, see downloader.py).
+
+    Returns:
+        dict: File name -> local path (files that could not be fetched are left out)
+    """
+    from downloader import download_many
+
+    raw_dir = Path(raw_dir or RAW_DIR)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    paths = {name: resolve_raw_file(name, raw_dir) for name in names}
+    jobs = [{'key': name, 'url': LAUS_FLATFILE_URL + name, 'path': raw_dir / name}
+            for name, path in paths.items() if path is None]
+    if jobs:
+        print(f"Downloading {len(jobs)} flat file(s) from {LAUS_FLATFILE_URL}...")
+        for name, result in download_many(jobs).items():
+            if 'path' in result:
+                paths[name] = result['path']
+    return {name: path for name, path in paths.items() if path is not None}
+
+
+def read_laus_data(path, area_prefixes, seasonal='U', measures=None, start_year=START_YEAR,
+                   end_year=END_YEAR, chunk_rows=CHUNK_ROWS):
+    """
+    Stream-parse a la.data.* file, keeping the requested series.
+
+    Args:
+        path (Path): Data file (plain or .gz)
+        area_prefixes (list): Area code prefixes to keep (AREA_TYPES prefixes)
+        seasonal (str): 'U' (not adjusted) or 'S' (seasonally adjusted)
+        measures (dict): Variable -> measure code (default SERIES_SUFFIXES)
+        start_year (int): First year kept
+        end_year (int): Last year kept
+        chunk_rows (int): Rows per chunk
+
+    Returns:
+        pd.DataFrame: Date, Year, Month, Area_Code, Variable, Value and
+            SeriesID (monthly observations with a numeric value; Area_Code,
+            Variable and SeriesID are categoricals)
+    """
+    measures = SERIES_SUFFIXES if measures is None else measures
+    measure_variables = {code: variable for variable, code in measures.items()}
+    area_prefixes = list(area_prefixes)
+    start_year, end_year = int(start_year), int(end_year)
+
+    series_number = {}  # kept series ID -> number, in order of appearance
+    parts = []
+    reader = pd.read_csv(path, sep='\t', header=0, names=DATA_COLUMNS, usecols=range(4),
+                         dtype=str, chunksize=chunk_rows)
+    for chunk in reader:
+        # Series filter, on the distinct IDs of the chunk (index -1 -> last entry, dropped)
+        series_id, series_values = pd.factorize(chunk['series_id'])
+        ids = pd.Index(series_values).str.strip()
+        wanted = (ids.str[3:5].isin(area_prefixes) & (ids.str[2:3] == seasonal)
+                  & ids.str[18:20].isin(list(measure_variables)) & (ids.str.len() == 20))
+        number = [series_number.setdefault(sid, len(series_number)) if keep else -1
+                  for sid, keep in zip(ids, wanted)]
+        row_series = np.array(number + [-1], dtype=np.int64)[series_id]
+
+        # Years and monthly periods, parsed on their distinct values
+        year_id, year_values = pd.factorize(chunk['year'])
+        years = pd.to_numeric(pd.Index(year_values).str.strip(), errors='coerce').to_numpy(dtype=float)
+        row_year = np.append(years, np.nan)[year_id]
+        period_id, period_values = pd.factorize(chunk['period'])
+        periods = pd.Index(period_values).str.strip()
+        months = pd.to_numeric(periods.str[1:].where(periods.str.startswith('M')),
+                               errors='coerce').to_numpy(dtype=float)
+        row_month = np.append(months, np.nan)[period_id]
+
+        keep = ((row_series >= 0) & (row_year >= start_year) & (row_year <= end_year)
+                & (row_month >= 1) & (row_month <= 12))
+        if not keep.any():
+            continue
+        value = pd.to_numeric(chunk['value'].to_numpy()[keep], errors='coerce')
+        value = np.asarray(value, dtype=float)
+        valid = ~np.isnan(value)
+        parts.append((row_series[keep][valid].astype(np.int32), row_year[keep][valid].astype(np.int16),
+                      row_month[keep][valid].astype(np.int8), value[valid]))
+
+    series_ids = np.array(list(series_number), dtype=object)
+    if parts:
+        row_series, year, month, value = (np.concatenate(column) for column in zip(*parts))
+    else:
+        row_series, year, month, value = (np.empty(0, dtype=dtype)
+                                          for dtype in (np.int32, np.int16, np.int8, float))
+
+    # Per-series attributes, gathered to the rows as categorical codes
+    area_codes = pd.Series([sid[3:18] for sid in series_ids], dtype=object)
+    variables = pd.Series([measure_variables[sid[18:20]] for sid in series_ids], dtype=object)
+    area_id, areas = pd.factorize(area_codes, sort=True)
+    variable_id, variable_values = pd.factorize(variables, sort=True)
+    dates = ((year.astype(np.int64) - 1970) * 12 + month - 1).astype('datetime64[M]').astype('datetime64[ns]')
+
+    return pd.DataFrame({
+        'Date': dates,
+        'Year': year.astype(np.int64),
+        'Month': month.astype(np.int64),
+        'Area_Code': pd.Categorical.from_codes(area_id[row_series], categories=areas),
+        'Variable': pd.Categorical.from_codes(variable_id[row_series], categories=variable_values),
+        'Value': value,
+        'SeriesID': pd.Categorical.from_codes(row_series, categories=series_ids),
+    })
+
+
+def load_area_names(path):
+    """
+    Area code -> area name from la.area.
+
+    Args:
+        path (Path): la.area file (or None)
+
+    Returns:
+        dict: Area code -> name (empty if the file is missing)
+    """
+    if path is None:
+        return {}
+    areas = pd.read_csv(path, sep='\t', dtype=str)
+    areas.columns = [str(col).strip() for col in areas.columns]
+    return dict(zip(areas['area_code'].str.strip(), areas['area_text'].str.strip()))
+
+
+def build_area_controls(area_type_names, raw_dir=None, seasonal='U'):
+    """
+    Wide area-level controls for the requested area levels.
+
+    Args:
+        area_type_names (list): AREA_TYPES names
+        raw_dir (Path): Directory with the flat files
+        seasonal (str): 'U' or 'S'
+
+    Returns:
+        pd.DataFrame: Date, Year, Month, Area_Code, Area, Area_Type,
+            State_FIPS and the control columns of reshape_and_calculate()
+    """
+    unknown = [name for name in area_type_names if name not in AREA_TYPES]
+    if unknown:
+        raise KeyError(f"Unknown area type(s) {', '.join(unknown)} (choose from {', '.join(AREA_TYPES)})")
+
+    frames = []
+    for name in area_type_names:
+        path = resolve_raw_file(AREA_TYPES[name]['file'], raw_dir)
+        if path is None:
+            raise FileNotFoundError(f"{AREA_TYPES[name]['file']} not found in {raw_dir or RAW_DIR}")
+        print(f"Reading {path.name} ({name})...")
+        df = read_laus_data(path, [AREA_TYPES[name]['prefix']], seasonal=seasonal)
+        print(f"  ✓ {len(df):,} observations, {df['Area_Code'].nunique():,} areas")
+        frames.append(df)
+
+    long = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    wide = reshape_and_calculate(long, area_column='Area_Code')
+
+    # Area attributes, computed per area code and gathered to the rows
+    area_codes = wide['Area_Code'].cat.categories
+    area_names = load_area_names(resolve_raw_file(AREA_FILE, raw_dir))
+    prefix_types = {spec['prefix']: name for name, spec in AREA_TYPES.items()}
+    attributes = {
+        'Area': [area_names.get(code, code) for code in area_codes],
+        'Area_Type': [prefix_types.get(code[:2], code[:2]) for code in area_codes],
+        'State_FIPS': [code[2:4] for code in area_codes],
+    }
+    rows = wide['Area_Code'].cat.codes.to_numpy()
+    position = wide.columns.get_loc('Area_Code') + 1
+    for offset, (column, values) in enumerate(attributes.items()):
+        value_id, value_uniques = pd.factorize(pd.Series(values, dtype=object), sort=True)
+        wide.insert(position + offset, column,
+                    pd.Categorical.from_codes(value_id[rows], categories=value_uniques))
+    return wide
+
+
+def main():
+    """Main execution function."""
+    print("=" * 80)
+    print("LAUS AREA CONTROLS FROM FLAT FILES")
+    print("=" * 80)
+    print(f"Area types: {', '.join(AREA_TYPE_NAMES)}")
+    print(f"Years: {START_YEAR}-{END_YEAR}")
+    print(f"Raw files: {RAW_DIR}")
+
+    if DOWNLOAD:
+        download_flatfiles([AREA_TYPES[name]['file'] for name in AREA_TYPE_NAMES if name in AREA_TYPES]
+                           + [AREA_FILE])
+
+    wide = build_area_controls(AREA_TYPE_NAMES)
+
+    wide.to_parquet(OUTPUT_PATH, index=False)
+    print(f"\n✓ {len(wide):,} rows, {wide['Area_Code'].nunique():,} areas, "
+          f"{wide['Date'].min():%Y-%m} to {wide['Date'].max():%Y-%m}")
+    print(f"✓ Saved to: {OUTPUT_PATH}")
+
+    metadata = {
+        'source': 'BLS LAUS flat files (' + LAUS_FLATFILE_URL + ')',
+        'files': [AREA_TYPES[name]['file'] for name in AREA_TYPE_NAMES],
+        'fetch_date': datetime.now().isoformat(),
+        'area_types': AREA_TYPE_NAMES,
+        'start_period': f"{wide['Date'].min():%Y-%m}",
+        'end_period': f"{wide['Date'].max():%Y-%m}",
+        'n_areas': int(wide['Area_Code'].nunique()),
+        'n_observations': len(wide),
+        'areas_by_type': {str(k): int(v) for k, v in
+                          wide.drop_duplicates('Area_Code')['Area_Type'].value_counts().items()},
+    }
+    with open(METADATA_PATH, 'w') as f:
+        json.dump(metadata, f, indent=2)
+    print(f"✓ Metadata saved to: {METADATA_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""
+Occupation Dimension Table
+==========================
+
+Attaches occupation-level scores to the panel through a small dimension
+table instead of scanning the full panel once per score source:
+
+1. Extract the distinct (Occupation_Code, Occupation, Year) keys
+   (a few thousand rows against 7.1M panel rows)
+2. Attach every score source to that table
+3. Join the scores back to the panel once, by key index
+
+Before any source is attached, keys are linked to 2010 SOC codes through the
+SOC 2010 -> 2018 crosswalk (see soc_crosswalk.py): 2015-2017 keys keep their
+code, 2018-2024 keys link to employment-weighted 2010 codes, and the
+highest-weight one becomes Occupation_Code_2010. All 2010-keyed sources are
+then translated by code for every year. If the crosswalk has not been
+downloaded, 2018-2024 keys fall back to occupation-name matching.
+
+Score sources (SCORE_SOURCES):
+- ilo: AI_Exposure_Score - ILO ISCO-08 scores crosswalked to 2010 SOC
+  (see update_ai_exposure_scores.py); without the SOC crosswalk: SOC code
+  match, then occupation name for rows without a matching code
+- telework_automation: Teleworkable (Dingel & Neiman 2020) and
+  AutomationRisk_PreAI (Frey & Osborne 2017); without the SOC crosswalk:
+  SOC codes for 2015-2017, occupation names for 2018-2024 (see
+  merge_occupation_scores.py), including accepted fuzzy title matches
+  (see title_matcher.py)
+- soc_major_group: RoutineTaskIndex (Autor & Dorn 2013) and SkillIntensity
+  (O*NET education requirements) by 2-digit SOC major group
+  (see fetch_occupation_data.py)
+- exposure_vintages (opt-in): one AI_Exposure_<VINTAGE> column per AI
+  exposure vintage, e.g. ILO WP140 by ISCO code and WP96 by SOC major group
+  (see update_ai_exposure_scores.py)
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import numpy as np
+import pandas as pd
+
+# Dimension key
+KEY_COLUMNS = ['Occupation_Code', 'Occupation', 'Year']
+
+# Last year matched on SOC codes by the telework/automation source
+# (without the SOC crosswalk)
+LAST_SOC_CODE_YEAR = 2017
+
+# Harmonized (2010 SOC) occupation code column
+HARMONIZED_COLUMN = 'Occupation_Code_2010'
+
+
+def build_occupation_dimension(panel):
+    """
+    Extract the distinct occupation keys of a panel.
+
+    Args:
+        panel (pd.DataFrame): Panel rows with KEY_COLUMNS
+
+    Returns:
+        tuple: (dimension table with KEY_COLUMNS, the panel row count of
+            each key in Rows and, if the panel has it, total Employment;
+            key index of every panel row)
+    """
+    grouped = panel.groupby(KEY_COLUMNS, observed=True, dropna=False, sort=True)
+    key_id = grouped.ngroup().to_numpy()
+    sizes = grouped.size()
+    dim = sizes.index.to_frame(index=False)
+    dim['Rows'] = sizes.to_numpy()
+    if 'Employment' in panel.columns:
+        dim['Employment'] = grouped['Employment'].sum().to_numpy()
+    return dim, key_id
+
+
+def soc_prefix(codes, length):
+    """First `length` characters of occupation codes (NaN stays NaN)."""
+    return codes.astype(object).str[:length]
+
+
+def harmonize_dimension(dim, context):
+    """
+    Link keys to 2010 SOC codes and add HARMONIZED_COLUMN.
+
+    Stores the key -> 2010 code links (see soc_crosswalk.harmonize) in
+    context['soc_links'], or None when the crosswalk is not available.
+    Employment of 2010 codes (pre-2018 keys) is accumulated in context, so
+    a chunked build that sees 2015-2017 first uses the same split weights
+    as a full build.
+
+    Args:
+        dim (pd.DataFrame): Occupation dimension (modified in place)
+        context (dict): Shared reference data and state
+    """
+    from soc_crosswalk import (CROSSWALK_PATH, FIRST_SOC_2018_YEAR, harmonize, harmonized_codes,
+                               load_soc_crosswalk, split_weights)
+
+    if 'soc_crosswalk' not in context:
+        context['soc_crosswalk'] = load_soc_crosswalk()
+        if context['soc_crosswalk'] is None:
+            print(f"WARNING: SOC 2010 -> 2018 crosswalk not found ({CROSSWALK_PATH}); 2018+ "
+                  "occupations fall back to name matching. Download it with "
+                  "`python scripts/soc_crosswalk.py` and rebuild.", flush=True)
+    links = context['soc_crosswalk']
+
+    pre_2018 = (dim['Year'] < FIRST_SOC_2018_YEAR).to_numpy()
+    if links is None:
+        context['soc_links'] = None
+        dim[HARMONIZED_COLUMN] = soc_prefix(dim['Occupation_Code'], 7).where(pre_2018)
+        return
+
+    if 'Employment' in dim.columns:
+        employment = dim[pre_2018].groupby(soc_prefix(dim.loc[pre_2018, 'Occupation_Code'], 7))['Employment'].sum()
+        previous = context.get('soc_2010_employment')
+        context['soc_2010_employment'] = employment if previous is None else previous.add(employment, fill_value=0)
+    employment = context.get('soc_2010_employment')
+
+    weights = split_weights(links, employment if employment is not None and len(employment) else None)
+    context['soc_links'] = harmonize(dim['Occupation_Code'], dim['Year'], weights)
+    dim[HARMONIZED_COLUMN] = harmonized_codes(context['soc_links'], len(dim))
+
+
+def attach_soc_scores(dim, context, table):
+    """
+    Add the columns of a 2010 SOC-keyed score table.
+
+    With the SOC 2010 -> 2018 crosswalk, every key gets the weighted score
+    of its linked 2010 codes. Without it, keys whose 7-character SOC code
+    is in the table get its score and the remaining keys are matched on
+    occupation names that matched by code; context['ilo_name_scores'] keeps
+    that name -> score table (one column per score column), so it carries
+    over between calls (e.g. one call per year in a chunked build).
+
+    Args:
+        dim (pd.DataFrame): Occupation dimension (modified in place)
+        context (dict): Shared reference data and state
+        table (pd.DataFrame): Scores indexed by 7-character 2010 SOC code
+    """
+    if context.get('soc_links') is not None:
+        from soc_crosswalk import translate_scores
+        translated = translate_scores(context['soc_links'], len(dim), table)
+        for col in table.columns:
+            dim[col] = translated[col].to_numpy()
+        return
+
+    # Key × score column matrix by SOC code (extra all-NaN row for codes not in the table)
+    table = table[~table.index.duplicated(keep='last')]
+    values = np.vstack([table.to_numpy(dtype=float), np.full((1, table.shape[1]), np.nan)])
+    scores = values[table.index.get_indexer(soc_prefix(dim['Occupation_Code'], 7))]
+
+    # Occupation name -> scores from keys matched by SOC code (latest year
+    # with a score wins, per column)
+    names = dim['Occupation'].astype(object)
+    order = dim['Year'].to_numpy().argsort(kind='stable')
+    order = order[names.notna().to_numpy()[order]]
+    matched = pd.DataFrame(scores[order], index=names.to_numpy()[order], columns=table.columns)
+    name_scores = matched.groupby(level=0, sort=False).last()
+    if context.get('ilo_name_scores') is not None:
+        name_scores = name_scores.combine_first(context['ilo_name_scores'])
+    context['ilo_name_scores'] = name_scores
+
+    by_name = name_scores.reindex(index=names.to_numpy(), columns=table.columns).to_numpy(dtype=float)
+    scores = np.where(np.isnan(scores), by_name, scores)
+    for j, col in enumerate(table.columns):
+        dim[col] = scores[:, j]
+
+
+def attach_ilo_scores(dim, context):
+    """
+    Add AI_Exposure_Score from the ILO crosswalk (see attach_soc_scores).
+
+    Args:
+        dim (pd.DataFrame): Occupation dimension (modified in place)
+        context (dict): Shared reference data and state
+    """
+    from update_ai_exposure_scores import create_soc_exposure_mapping, load_crosswalk
+
+    if 'soc_exposure' not in context:
+        context['soc_exposure'] = create_soc_exposure_mapping(load_crosswalk())
+
+    table = context['soc_exposure'].set_index('SOC_Code')[['AI_Exposure_Score']]
+    attach_soc_scores(dim, context, table)
+
+
+def attach_exposure_vintages(dim, context):
+    """
+    Add one float32 AI_Exposure_<VINTAGE> column per exposure vintage.
+
+    ISCO-keyed vintages are attached like AI_Exposure_Score (see
+    attach_soc_scores), all in one pass; major-group vintages by 2-digit
+    SOC major group. context['exposure_vintage_tables'] holds the tables
+    (update_ai_exposure_scores.exposure_vintage_tables); by default every
+    available vintage, or the names in context['exposure_vintages'].
+
+    Args:
+        dim (pd.DataFrame): Occupation dimension (modified in place)
+        context (dict): Shared reference data and state
+
+    Returns:
+        list: Columns added
+    """
+    from update_ai_exposure_scores import exposure_vintage_tables, exposure_vintages, load_crosswalk
+
+    if 'exposure_vintage_tables' not in context:
+        names = context.get('exposure_vintages') or sorted(exposure_vintages())
+        context['exposure_vintage_tables'] = exposure_vintage_tables(names, load_crosswalk())
+    soc_scores, group_scores = context['exposure_vintage_tables']
+
+    attach_soc_scores(dim, context, soc_scores)
+    group_values = np.vstack([group_scores.to_numpy(dtype=float), np.full((1, group_scores.shape[1]), np.nan)])
+    by_group = group_values[group_scores.index.get_indexer(soc_prefix(dim['Occupation_Code'], 2))]
+    for j, col in enumerate(group_scores.columns):
+        dim[col] = by_group[:, j]
+
+    columns = list(soc_scores.columns) + list(group_scores.columns)
+    dim[columns] = dim[columns].astype('float32')
+    return columns
+
+
+def attach_telework_automation(dim, context):
+    """
+    Add Teleworkable and AutomationRisk_PreAI.
+
+    By harmonized 2010 SOC code for every year when the SOC crosswalk is
+    available; otherwise SOC codes up to LAST_SOC_CODE_YEAR and occupation
+    names (with accepted fuzzy matches) after it.
+
+    Args:
+        dim (pd.DataFrame): Occupation dimension (modified in place)
+        context (dict): Shared reference data and state
+    """
+    from merge_occupation_scores import (SCORES_PATH, SCORE_COLUMNS, create_reverse_mapping,
+                                         match_on_occupation_name, match_on_soc_code)
+    from score_registry import occupation_name_mappings
+    from title_matcher import load_accepted_matches
+
+    if 'telework_automation' not in context:
+        context['telework_automation'] = pd.read_csv(SCORES_PATH)
+    if 'title_matches' not in context:
+        context['title_matches'] = load_accepted_matches()
+    scores_df = context['telework_automation']
+
+    if context.get('soc_links') is not None:
+        from soc_crosswalk import translate_scores
+        table = scores_df.set_index('SOC_Code')[SCORE_COLUMNS]
+        translated = translate_scores(context['soc_links'], len(dim), table)
+        for col in SCORE_COLUMNS:
+            dim[col] = translated[col].to_numpy()
+        return
+
+    by_code = (dim['Year'] <= LAST_SOC_CODE_YEAR).to_numpy()
+    code_matches = match_on_soc_code(dim[by_code], scores_df)
+    name_matches = match_on_occupation_name(dim[~by_code].copy(), scores_df,
+                                            create_reverse_mapping(occupation_name_mappings()),
+                                            context['title_matches'])
+
+    for col in SCORE_COLUMNS:
+        values = np.full(len(dim), np.nan)
+        values[by_code] = code_matches[col].to_numpy(dtype=float)
+        values[~by_code] = name_matches[col].to_numpy(dtype=float)
+        dim[col] = values
+
+
+def attach_major_group_scores(dim, context):
+    """
+    Add RoutineTaskIndex and SkillIntensity by SOC major group.
+
+    Args:
+        dim (pd.DataFrame): Occupation dimension (modified in place)
+        context (dict): Shared reference data and state
+    """
+    import fetch_occupation_data
+
+    if 'major_group_scores' not in context:
+        fetch_occupation_data.load_occupation_scores()
+        context['major_group_scores'] = fetch_occupation_data.OCCUPATION_SCORES
+    scores = context['major_group_scores']
+
+    major_group = soc_prefix(dim['Occupation_Code'], 2)
+    dim['RoutineTaskIndex'] = major_group.map(scores['routine_task_index']).astype(float)
+    dim['SkillIntensity'] = major_group.map(scores['skill_intensity']).astype(float)
+
+
+# Source name -> (attach function, columns it adds; None: the columns the
+# attach function returns)
+SCORE_SOURCES = {
+    'ilo': (attach_ilo_scores, ['AI_Exposure_Score']),
+    'telework_automation': (attach_telework_automation, ['Teleworkable', 'AutomationRisk_PreAI']),
+    'soc_major_group': (attach_major_group_scores, ['RoutineTaskIndex', 'SkillIntensity']),
+    'exposure_vintages': (attach_exposure_vintages, None),
+}
+
+# Sources attached when none are named (exposure vintages are opt-in)
+DEFAULT_SOURCES = ['ilo', 'telework_automation', 'soc_major_group']
+
+
+def join_dimension(panel, dim, key_id, columns):
+    """
+    Copy dimension columns onto panel rows by key index.
+
+    Args:
+        panel (pd.DataFrame): Panel rows (modified in place)
+        dim (pd.DataFrame): Occupation dimension
+        key_id (np.ndarray): Key index of every panel row
+        columns (list): Dimension columns to copy
+
+    Returns:
+        pd.DataFrame: panel with the columns set
+    """
+    for col in columns:
+        panel[col] = dim[col].to_numpy()[key_id]
+    return panel
+
+
+def score_dimension(dim, sources=None, context=None):
+    """
+    Attach score sources to an occupation dimension table.
+
+    Args:
+        dim (pd.DataFrame): Occupation dimension (modified in place)
+        sources (list): SCORE_SOURCES names (default: DEFAULT_SOURCES)
+        context (dict): Reference data/state shared across calls (optional)
+
+    Returns:
+        list: Columns added (HARMONIZED_COLUMN and the score columns)
+    """
+    sources = DEFAULT_SOURCES if sources is None else sources
+    context = {} if context is None else context
+
+    harmonize_dimension(dim, context)
+    columns = [HARMONIZED_COLUMN]
+    for name in sources:
+        attach, source_columns = SCORE_SOURCES[name]
+        added = attach(dim, context)
+        columns += added if source_columns is None else source_columns
+    return columns
+
+
+def attach_occupation_scores(panel, sources=None, context=None):
+    """
+    Attach score sources to a panel through the occupation dimension.
+
+    Args:
+        panel (pd.DataFrame): Panel rows (modified in place)
+        sources (list): SCORE_SOURCES names (default: DEFAULT_SOURCES)
+        context (dict): Reference data/state shared across calls (optional)
+
+    Returns:
+        tuple: (panel with score columns, dimension table with scores)
+    """
+    dim, key_id = build_occupation_dimension(panel)
+    print(f"Occupation dimension: {len(dim):,} keys for {len(panel):,} rows")
+
+    columns = score_dimension(dim, sources, context)
+    return join_dimension(panel, dim, key_id, columns), dim
@@ -0,0 +1,172 @@
+"""
+Detailed-SOC Employment-Weighted Industry Scores
+=================================================
+
+Aggregates detailed (6-digit SOC) occupation scores to industry cells using
+detailed OES employment as weights, instead of collapsing occupations to the
+22 SOC major groups first.
+
+Occupation scores:
+- Teleworkability: Dingel & Neiman (2020), data/occupation_telework_automation.csv
+- AutomationRisk_PreAI: Frey & Osborne (2017), same file
+- AI_Exposure_Score: ILO WP140 ISCO-08 scores crosswalked to 2010 SOC
+  (see update_ai_exposure_scores.py)
+
+Method:
+Employment is loaded into a sparse cell × occupation matrix W (one row per
+Year × State × NAICS cell, one column per SOC code). With S the occupation ×
+measure score matrix and M its non-missing mask, each measure is
+
+    Score = (W @ S) / (W @ M)
+
+i.e. the employment-weighted mean over occupations that have a score, and
+Coverage = (W @ M) / W.sum(axis=1) is the employment share those occupations
+cover. Only detailed occupations enter W: OES files also carry the
+'00-0000' total and major/minor/broad group rows, which would count the
+same employment several times. Both are sparse matrix products, so the cost is linear in the number
+of OES rows regardless of how many states, years and NAICS codes are present.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from update_ai_exposure_scores import create_soc_exposure_mapping, load_crosswalk
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+TELEWORK_AUTOMATION_FILE = DATA_DIR / 'occupation_telework_automation.csv'
+
+# Detailed score measures (output column names)
+DETAILED_MEASURES = ['AI_Exposure_Score', 'Teleworkability', 'AutomationRisk_PreAI']
+
+# Detailed SOC codes end in 1-9; 'XX-0000' majors and minor/broad groups end in 0
+DETAILED_SOC_PATTERN = r'^\d{2}-\d{3}[1-9]$'
+
+
+def normalize_soc_code(codes):
+    """
+    Normalize SOC codes to the 7-character 'XX-XXXX' form.
+
+    Args:
+        codes (pd.Series): Raw SOC / O*NET-SOC codes
+
+    Returns:
+        pd.Series: Stripped codes truncated to 7 characters
+    """
+    return codes.astype(str).str.strip().str[:7]
+
+
+def detailed_occupation_mask(oes_data, soc_col='SOC', group_col='O_GROUP'):
+    """
+    Rows of OES data that are detailed occupations (not totals or groups).
+
+    Uses the OES occupation group column where a file has it, otherwise the
+    SOC code structure.
+
+    Args:
+        oes_data (pd.DataFrame): OES rows
+        soc_col (str): SOC code column
+        group_col (str): OES occupation group column ('total', 'major',
+            'minor', 'broad', 'detailed'), if present
+
+    Returns:
+        pd.Series: Boolean mask aligned to oes_data
+    """
+    by_code = normalize_soc_code(oes_data[soc_col]).str.match(DETAILED_SOC_PATTERN)
+    if group_col not in oes_data.columns:
+        return by_code
+    groups = oes_data[group_col]
+    by_group = groups.astype(str).str.strip().str.lower() == 'detailed'
+    return by_group.where(groups.notna(), by_code).astype(bool)
+
+
+def load_detailed_occupation_scores():
+    """
+    Build the detailed SOC × measure score table.
+
+    Returns:
+        pd.DataFrame: Indexed by 7-character SOC code, one column per
+            DETAILED_MEASURES entry (NaN where a source has no score)
+    """
+    print("Loading detailed (6-digit SOC) occupation scores...")
+
+    telework = pd.read_csv(TELEWORK_AUTOMATION_FILE)
+    telework['SOC_Code'] = normalize_soc_code(telework['SOC_Code'])
+    telework = (telework.rename(columns={'Teleworkable': 'Teleworkability'})
+                .drop_duplicates(subset='SOC_Code', keep='last')
+                .set_index('SOC_Code')[['Teleworkability', 'AutomationRisk_PreAI']])
+
+    ilo = create_soc_exposure_mapping(load_crosswalk())
+    ilo['SOC_Code'] = normalize_soc_code(ilo['SOC_Code'])
+    ilo = ilo.groupby('SOC_Code')['AI_Exposure_Score'].mean()
+
+    scores = telework.join(ilo, how='outer')[DETAILED_MEASURES]
+
+    print(f"  ✓ {len(scores):,} SOC codes")
+    for measure in DETAILED_MEASURES:
+        print(f"    - {measure}: {scores[measure].notna().sum():,} with scores")
+
+    return scores
+
+
+def employment_weighted_scores(oes_data, score_table, group_cols=('Year', 'State', 'NAICS'),
+                               soc_col='SOC', weight_col='Employment'):
+    """
+    Employment-weighted occupation scores per cell via sparse matrix products.
+
+    Args:
+        oes_data (pd.DataFrame): OES rows (cells, SOC code, employment);
+            total and group rows are dropped (see detailed_occupation_mask)
+        score_table (pd.DataFrame): Occupation × measure scores indexed by
+            normalized SOC code (see load_detailed_occupation_scores)
+        group_cols (tuple): Columns defining a cell
+        soc_col (str): Detailed SOC code column in oes_data
+        weight_col (str): Employment column in oes_data
+
+    Returns:
+        pd.DataFrame: One row per cell with group_cols, one score and one
+            Coverage_<measure> column per measure, and Total_Occupation_Employment
+    """
+    group_cols = list(group_cols)
+    data = oes_data.dropna(subset=group_cols + [soc_col, weight_col])
+    data = data[detailed_occupation_mask(data, soc_col)]
+    weights = pd.to_numeric(data[weight_col], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+    # Row (cell) indices for the sparse matrix
+    grouped = data.groupby(group_cols, sort=True)
+    cell_id = grouped.ngroup().to_numpy()
+    cells = grouped.size().index.to_frame(index=False)
+
+    # Column (occupation) indices; codes are normalized once per distinct value
+    raw_id, raw_codes = pd.factorize(data[soc_col])
+    soc_id, soc_codes = pd.factorize(normalize_soc_code(pd.Series(raw_codes)), sort=True)
+    soc_id = soc_id[raw_id]
+
+    # Cell × occupation employment (duplicate entries are summed)
+    W = sparse.csr_matrix((weights, (cell_id, soc_id)), shape=(len(cells), len(soc_codes)))
+
+    # Occupation × measure scores aligned to the matrix columns
+    S = score_table.reindex(soc_codes).to_numpy(dtype=float)
+    M = ~np.isnan(S)
+
+    totals = np.asarray(W.sum(axis=1)).ravel()
+    weighted_sum = W @ np.nan_to_num(S)
+    covered = W @ M.astype(float)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cell_scores = np.where(covered > 0, weighted_sum / covered, np.nan)
+        coverage = np.where(totals[:, None] > 0, covered / totals[:, None], np.nan)
+
+    result = cells
+    measures = list(score_table.columns)
+    for j, measure in enumerate(measures):
+        result[measure] = cell_scores[:, j]
+        result[f'Coverage_{measure}'] = coverage[:, j]
+    result['Total_Occupation_Employment'] = totals
+
+    return result
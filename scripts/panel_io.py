@@ -0,0 +1,519 @@
+"""
+Occupation Panel Storage
+========================
+
+Read/write helpers shared by every script that touches the occupation panel.
+
+The panel is stored as a Parquet dataset partitioned by Year:
+
+    data/occupation_panel/Year=2015/part-0.parquet
+    ...
+    data/occupation_panel/Year=2024/part-0.parquet
+
+Columns follow the dtype contract in panel_schema.py on disk and in memory:
+State, Industry and Occupation (and their codes) are dictionary-encoded
+categoricals, Year/Post are small integers and scores are float32.
+A CSV export (data/occupation_panel.csv) is still available on request;
+read_panel() falls back to it when no Parquet dataset exists yet.
+
+Occupation scores updated after the build (merge_occupation_scores.py,
+update_ai_exposure_scores.py) are stored in a small sidecar,
+data/occupation_scores.parquet, with one row per (Occupation_Code,
+Occupation, Year) key. read_panel() joins it onto the rows it loads, so
+updating a score source never rewrites the employment data.
+
+Annual state controls (LAUS, May reference month; state_controls_join.py)
+are stored the same way, as a small dataset partitioned by Year next to
+the panel (data/state_controls_annual/Year=YYYY/), keyed by an integer
+State_Key (state FIPS code, 0 = national). read_panel() maps each State /
+State_Code category to its key once and gathers the control values by
+integer position, without a string merge over the rows.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from occupation_dimension import KEY_COLUMNS, build_occupation_dimension, join_dimension
+from panel_schema import CATEGORICAL_COLUMNS, apply_panel_schema, csv_read_dtypes
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+PANEL_DATASET_DIR = DATA_DIR / 'occupation_panel'
+PANEL_CSV_PATH = DATA_DIR / 'occupation_panel.csv'
+METADATA_PATH = DATA_DIR / 'occupation_panel_metadata.json'
+SCORES_SIDECAR_PATH = DATA_DIR / 'occupation_scores.parquet'
+CONTROLS_DATASET_DIR = DATA_DIR / 'state_controls_annual'
+
+# Key columns of the state controls dataset
+CONTROL_KEY_COLUMNS = ['State_Key', 'State', 'Year']
+
+# State key of national rows, and the panel's names/codes for them
+NATIONAL_STATE_KEY = 0
+NATIONAL_AREA_NAMES = ('total', 'u.s.', 'united states', 'national')
+NATIONAL_AREA_CODES = ('99',)
+
+
+def stringify_object_columns(df):
+    """
+    Make object columns storable as Parquet.
+
+    Object columns in OES data mix numbers with BLS suppression symbols
+    ('*', '**', '#'), which Parquet cannot store in one column. Non-null
+    values in object columns are converted to str; CSV exports are
+    unchanged because values are written as text either way.
+
+    Args:
+        df (pd.DataFrame): Panel or panel chunk (modified in place)
+
+    Returns:
+        pd.DataFrame: Same frame with object columns as strings
+    """
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+def prepare_for_parquet(df):
+    """
+    Convert a panel frame to the on-disk Parquet layout.
+
+    Args:
+        df (pd.DataFrame): Panel or panel chunk
+
+    Returns:
+        pd.DataFrame: Copy cast to the panel schema, with any remaining
+            mixed object columns as str
+    """
+    return stringify_object_columns(apply_panel_schema(df.copy()))
+
+
+def write_panel_partition(df, year, dataset_dir=PANEL_DATASET_DIR):
+    """
+    Write one year of the panel as a Parquet partition.
+
+    Args:
+        df (pd.DataFrame): Rows for a single year
+        year (int): Partition year
+        dataset_dir (Path): Dataset root
+
+    Returns:
+        Path: Written partition file
+    """
+    partition_dir = Path(dataset_dir) / f'Year={int(year)}'
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    path = partition_dir / 'part-0.parquet'
+    prepare_for_parquet(df.drop(columns=['Year'], errors='ignore')).to_parquet(path, index=False)
+    return path
+
+
+def begin_dataset_write(dataset_dir=PANEL_DATASET_DIR):
+    """
+    Start writing a fresh panel dataset next to the current one.
+
+    Args:
+        dataset_dir (Path): Dataset root being replaced
+
+    Returns:
+        Path: Temporary dataset directory; pass it to write_panel_partition()
+            and then to finish_dataset_write()
+    """
+    dataset_dir = Path(dataset_dir)
+    tmp_dir = dataset_dir.with_name(dataset_dir.name + '.tmp')
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+    return tmp_dir
+
+
+def finish_dataset_write(tmp_dir, dataset_dir=PANEL_DATASET_DIR):
+    """
+    Replace the current panel dataset with a completed temporary one.
+
+    Args:
+        tmp_dir (Path): Directory returned by begin_dataset_write()
+        dataset_dir (Path): Dataset root being replaced
+    """
+    dataset_dir = Path(dataset_dir)
+    old_dir = dataset_dir.with_name(dataset_dir.name + '.old')
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
+    if dataset_dir.exists():
+        os.replace(dataset_dir, old_dir)
+    os.replace(tmp_dir, dataset_dir)
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
+
+
+def describe_dataset(dataset_dir=PANEL_DATASET_DIR):
+    """
+    Describe the stored Parquet dataset for the metadata JSON.
+
+    Args:
+        dataset_dir (Path): Dataset root
+
+    Returns:
+        dict: Format, path, partitioning, Arrow schema and row counts per year
+    """
+    import pyarrow.parquet as pq
+
+    row_counts = {}
+    schema = None
+    for partition_dir in sorted(Path(dataset_dir).glob('Year=*')):
+        year = partition_dir.name.split('=', 1)[1]
+        row_counts[year] = 0
+        for path in sorted(partition_dir.glob('*.parquet')):
+            parquet_file = pq.ParquetFile(path)
+            row_counts[year] += parquet_file.metadata.num_rows
+            if schema is None:
+                schema = parquet_file.schema_arrow
+
+    return {
+        'format': 'parquet',
+        'path': os.path.relpath(dataset_dir, DATA_DIR.parent),
+        'partitioning': ['Year'],
+        'dictionary_columns': [col for col in CATEGORICAL_COLUMNS
+                               if schema is not None and col in schema.names],
+        'schema': {field.name: str(field.type) for field in schema} if schema is not None else {},
+        'row_counts': row_counts,
+        'n_observations': sum(row_counts.values()),
+    }
+
+
+def write_panel(panel, csv=False):
+    """
+    Write the full panel as a Year-partitioned Parquet dataset.
+
+    Args:
+        panel (pd.DataFrame): Full panel (must contain Year)
+        csv (bool): Also export data/occupation_panel.csv
+
+    Returns:
+        dict: Storage description (see describe_dataset)
+    """
+    tmp_dir = begin_dataset_write()
+    for year, year_df in panel.groupby('Year', sort=True):
+        write_panel_partition(year_df, year, tmp_dir)
+    finish_dataset_write(tmp_dir)
+
+    if csv:
+        panel.to_csv(PANEL_CSV_PATH, index=False)
+
+    return describe_dataset()
+
+
+def read_score_sidecar(years=None):
+    """
+    Load the occupation score sidecar.
+
+    Args:
+        years (list): Years to load (default: all)
+
+    Returns:
+        pd.DataFrame: KEY_COLUMNS plus score columns, or None if no sidecar
+            has been written
+    """
+    if not SCORES_SIDECAR_PATH.exists():
+        return None
+    filters = [('Year', 'in', [int(y) for y in years])] if years is not None else None
+    return pd.read_parquet(SCORES_SIDECAR_PATH, filters=filters)
+
+
+def write_score_sidecar(dim, columns):
+    """
+    Store score columns of an occupation dimension in the sidecar.
+
+    Columns already in the sidecar from other sources are kept; the given
+    columns are replaced.
+
+    Args:
+        dim (pd.DataFrame): Occupation dimension with KEY_COLUMNS and scores
+        columns (list): Score columns to store
+
+    Returns:
+        dict: Sidecar description (see describe_score_sidecar)
+    """
+    sidecar = dim[KEY_COLUMNS + list(columns)]
+    existing = read_score_sidecar()
+    if existing is not None:
+        existing = existing.drop(columns=[col for col in columns if col in existing.columns])
+        sidecar = existing.merge(sidecar, on=KEY_COLUMNS, how='outer')
+
+    tmp_path = SCORES_SIDECAR_PATH.with_name(SCORES_SIDECAR_PATH.name + '.tmp')
+    apply_panel_schema(sidecar.copy()).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, SCORES_SIDECAR_PATH)
+    return describe_score_sidecar()
+
+
+def describe_score_sidecar():
+    """
+    Describe the score sidecar for the metadata JSON.
+
+    Returns:
+        dict: Path, key columns, score columns and number of keys
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(SCORES_SIDECAR_PATH)
+    return {
+        'format': 'parquet',
+        'path': os.path.relpath(SCORES_SIDECAR_PATH, DATA_DIR.parent),
+        'key_columns': KEY_COLUMNS,
+        'score_columns': [name for name in parquet_file.schema_arrow.names if name not in KEY_COLUMNS],
+        'n_keys': parquet_file.metadata.num_rows,
+    }
+
+
+def discard_score_sidecar():
+    """Remove the score sidecar (a freshly built panel carries its own scores)."""
+    if SCORES_SIDECAR_PATH.exists():
+        SCORES_SIDECAR_PATH.unlink()
+
+
+def join_score_sidecar(df, sidecar, columns):
+    """
+    Overlay sidecar score columns onto panel rows.
+
+    Rows whose key is not in the sidecar keep their stored values.
+
+    Args:
+        df (pd.DataFrame): Panel rows with KEY_COLUMNS (modified in place)
+        sidecar (pd.DataFrame): Output of read_score_sidecar()
+        columns (list): Sidecar score columns to join
+
+    Returns:
+        pd.DataFrame: df with the score columns set
+    """
+    dim, key_id = build_occupation_dimension(df)
+    dim = dim.merge(sidecar[KEY_COLUMNS + list(columns)], on=KEY_COLUMNS, how='left',
+                    indicator=True)
+    in_sidecar = (dim['_merge'] == 'both').to_numpy()[key_id]
+
+    stored = {col: df[col].to_numpy(dtype=float) for col in columns if col in df.columns}
+    join_dimension(df, dim, key_id, columns)
+    for col, values in stored.items():
+        df[col] = np.where(in_sidecar, df[col].to_numpy(dtype=float), values)
+    return df
+
+
+def read_state_controls(years=None):
+    """
+    Load the annual state controls dataset.
+
+    Args:
+        years (list): Years to load (default: all)
+
+    Returns:
+        pd.DataFrame: CONTROL_KEY_COLUMNS plus control columns, or None if
+            state_controls_join.py has not been run
+    """
+    if not CONTROLS_DATASET_DIR.exists():
+        return None
+    filters = [('Year', 'in', [int(y) for y in years])] if years is not None else None
+    controls = pd.read_parquet(CONTROLS_DATASET_DIR, filters=filters)
+    controls['Year'] = controls['Year'].astype(str).astype(int)
+    return apply_panel_schema(controls)
+
+
+def panel_state_keys(df, controls):
+    """
+    Integer state key of every panel row.
+
+    Keys are resolved once per category: a numeric State_Code is the FIPS
+    key; otherwise the State name is looked up among the controls' names
+    (national rows map to NATIONAL_STATE_KEY). Rows are then gathered by
+    category code.
+
+    Args:
+        df (pd.DataFrame): Panel rows with State and/or State_Code (categoricals)
+        controls (pd.DataFrame): Output of read_state_controls()
+
+    Returns:
+        np.ndarray: int64 key per row (-1 where the state is unknown)
+    """
+    known = set(controls['State_Key'].astype(int).tolist())
+    name_keys = {str(name).strip().casefold(): int(key)
+                 for name, key in zip(controls['State'], controls['State_Key'])}
+    for name in NATIONAL_AREA_NAMES:
+        name_keys.setdefault(name, NATIONAL_STATE_KEY)
+
+    keys = np.full(len(df), -1, dtype=np.int64)
+    if 'State' in df.columns:
+        names = df['State'].astype('category')
+        per_name = [name_keys.get(str(name).strip().casefold(), -1) for name in names.cat.categories]
+        keys = np.array(per_name + [-1], dtype=np.int64)[names.cat.codes.to_numpy()]
+
+    if 'State_Code' in df.columns:
+        codes = df['State_Code'].astype('category')
+        per_code = []
+        for code in codes.cat.categories:
+            code = str(code).strip()
+            key = NATIONAL_STATE_KEY if code in NATIONAL_AREA_CODES else int(code) if code.isdigit() else -1
+            per_code.append(key if key in known else -1)
+        code_keys = np.array(per_code + [-1], dtype=np.int64)[codes.cat.codes.to_numpy()]
+        keys = np.where(code_keys >= 0, code_keys, keys)
+
+    return keys
+
+
+def join_state_controls(df, controls, columns):
+    """
+    Attach annual state controls to panel rows by integer gather.
+
+    The controls become one (state key × year) matrix; each row's position
+    in it is computed from its state key and year, and every column is
+    filled with a single take. Rows without a matching state or year get
+    NaN.
+
+    Args:
+        df (pd.DataFrame): Panel rows with Year and State/State_Code (modified in place)
+        controls (pd.DataFrame): Output of read_state_controls()
+        columns (list): Control columns to attach
+
+    Returns:
+        pd.DataFrame: df with the control columns set
+    """
+    keys = panel_state_keys(df, controls)
+    state_keys = np.unique(controls['State_Key'].to_numpy(dtype=np.int64))
+    control_years = controls['Year'].to_numpy(dtype=np.int64)
+    first_year = control_years.min()
+    n_years = int(control_years.max() - first_year + 1)
+
+    key_index = np.full(int(max(state_keys.max(), keys.max())) + 1, -1, dtype=np.int64)
+    key_index[state_keys] = np.arange(len(state_keys))
+
+    # Last row of the matrix stays NaN for unmatched panel rows
+    cell = (key_index[controls['State_Key'].to_numpy(dtype=np.int64)] * n_years
+            + control_years - first_year)
+    matrix = np.full((len(state_keys) * n_years + 1, len(columns)), np.nan)
+    matrix[cell] = controls[list(columns)].to_numpy(dtype=float)
+
+    row_year = df['Year'].to_numpy(dtype=np.int64) - first_year
+    row_key = key_index[np.maximum(keys, 0)]
+    valid = (keys >= 0) & (row_key >= 0) & (row_year >= 0) & (row_year < n_years)
+    row = np.where(valid, row_key * n_years + row_year, -1)
+
+    for i, col in enumerate(columns):
+        df[col] = matrix[row, i]
+    return df
+
+
+def describe_state_controls():
+    """
+    Describe the state controls dataset for the metadata JSON.
+
+    Returns:
+        dict: Storage description (see describe_dataset) plus key and
+            control columns
+    """
+    storage = describe_dataset(CONTROLS_DATASET_DIR)
+    storage['key_columns'] = CONTROL_KEY_COLUMNS
+    storage['control_columns'] = [name for name in storage['schema'] if name not in CONTROL_KEY_COLUMNS]
+    return storage
+
+
+def read_panel(columns=None, years=None, scores=True, controls=True):
+    """
+    Load the occupation panel with the shared schema (see panel_schema.py).
+
+    Reads the Parquet dataset if present (only the requested columns and
+    Year partitions are read), otherwise the CSV export. Score columns in
+    the score sidecar are joined on by occupation key, and annual state
+    controls (if built) by state and year.
+
+    Args:
+        columns (list): Columns to load (default: all)
+        years (list): Years to load (default: all)
+        scores (bool): Join the score sidecar (False: stored values only)
+        controls (bool): Join the state controls dataset
+
+    Returns:
+        pd.DataFrame: Panel with categorical names/codes and compact numerics
+    """
+    sidecar = read_score_sidecar(years) if scores else None
+    score_columns = []
+    if sidecar is not None:
+        score_columns = [col for col in sidecar.columns if col not in KEY_COLUMNS
+                         and (columns is None or col in columns)]
+
+    state_controls = read_state_controls(years) if controls else None
+    control_columns = []
+    if state_controls is not None and len(state_controls):
+        control_columns = [col for col in state_controls.columns if col not in CONTROL_KEY_COLUMNS
+                           and (columns is None or col in columns)]
+
+    read_columns = None
+    if columns is not None:
+        read_columns = list(columns)
+        if score_columns:
+            read_columns = list(dict.fromkeys(read_columns + KEY_COLUMNS))
+        if control_columns:
+            read_columns = list(dict.fromkeys(read_columns + ['State', 'State_Code', 'Year']))
+        # Score and control columns may exist only in their sidecars
+        available = panel_columns()
+        read_columns = [col for col in read_columns if col in available]
+
+    if PANEL_DATASET_DIR.exists():
+        filters = [('Year', 'in', [int(y) for y in years])] if years is not None else None
+        if read_columns is not None:
+            read_columns = list(dict.fromkeys(read_columns + ['Year']))
+        df = pd.read_parquet(PANEL_DATASET_DIR, columns=read_columns, filters=filters)
+        # Hive partition keys come back as categoricals
+        df['Year'] = df['Year'].astype(str).astype(int)
+    else:
+        df = pd.read_csv(PANEL_CSV_PATH, usecols=read_columns, dtype=csv_read_dtypes(), low_memory=False)
+        if years is not None:
+            df = df[df['Year'].isin(years)].reset_index(drop=True)
+
+    df = apply_panel_schema(df)
+    if score_columns:
+        df = apply_panel_schema(join_score_sidecar(df, apply_panel_schema(sidecar), score_columns))
+    if control_columns:
+        df = apply_panel_schema(join_state_controls(df, state_controls, control_columns))
+    if columns is not None:
+        df = df[list(columns)]
+
+    return df
+
+
+def panel_columns():
+    """
+    Column names of the stored panel (Parquet dataset or CSV export).
+
+    Returns:
+        list: Column names, including the Year partition key
+    """
+    if PANEL_DATASET_DIR.exists():
+        import pyarrow.dataset as ds
+        return ds.dataset(PANEL_DATASET_DIR, partitioning='hive').schema.names
+    return pd.read_csv(PANEL_CSV_PATH, nrows=0).columns.tolist()
+
+
+def record_storage_metadata(storage, key='storage'):
+    """
+    Store a storage description in the panel metadata JSON.
+
+    Args:
+        storage (dict): Output of describe_dataset() / write_panel(), of
+            describe_score_sidecar() / write_score_sidecar(), or of
+            describe_state_controls()
+        key (str): Metadata key ('storage' for the panel, 'score_sidecar',
+            'state_controls')
+    """
+    if METADATA_PATH.exists():
+        with open(METADATA_PATH, 'r') as f:
+            metadata = json.load(f)
+    else:
+        metadata = {}
+
+    metadata[key] = storage
+
+    with open(METADATA_PATH, 'w') as f:
+        json.dump(metadata, f, indent=2)
@@ -0,0 +1,139 @@
+"""
+Occupation Panel Schema
+=======================
+
+Single dtype contract for the occupation panel. Every script loads the panel
+through panel_io.read_panel(), which applies this schema, so the same compact
+types are used everywhere:
+
+- State, State_Code, Industry, Industry_Code, Occupation, Occupation_Code,
+  Occupation_Code_2010 (harmonized 2010 SOC code): categoricals with string categories (codes ordered naturally, so FIPS and
+  NAICS codes sort numerically)
+- Year: int16, Post: int8
+- LogEmployment, wages and occupation scores: float32, including exposure
+  vintage columns (AI_Exposure_<VINTAGE>, see update_ai_exposure_scores.py)
+- Employment: float64 (national totals exceed float32's exact integer range)
+- State controls (state_controls_join.py): rates float32, LAUS counts
+  float64, State_Key int16
+
+BLS suppression symbols in wage columns ('*', '#') become NaN.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import pandas as pd
+
+# Code and title columns stored as categoricals
+CATEGORICAL_COLUMNS = ['State_Code', 'State', 'Industry_Code', 'Industry',
+                       'Occupation_Code', 'Occupation', 'Occupation_Code_2010']
+
+# Code columns (sorted naturally: numeric codes by value, then text codes)
+CODE_COLUMNS = ['State_Code', 'Industry_Code', 'Occupation_Code', 'Occupation_Code_2010']
+
+# Integer columns
+INTEGER_DTYPES = {
+    'Year': 'int16',
+    'Post': 'int8',
+    'State_Key': 'int16',
+}
+
+# Occupation-level exposure scores
+SCORE_COLUMNS = ['AI_Exposure_Score', 'Teleworkability', 'RoutineTaskIndex',
+                 'SkillIntensity', 'AutomationRisk_PreAI']
+
+# Prefix of exposure vintage columns (AI_Exposure_WP140, AI_Exposure_WP96, ...)
+EXPOSURE_VINTAGE_PREFIX = 'AI_Exposure_'
+
+# Annual (May) LAUS state controls joined by state and year
+STATE_CONTROL_DTYPES = {
+    'UnemploymentRate': 'float32',
+    'LFPR': 'float32',
+    'LaborForce': 'float64',
+    'Employment_LAUS': 'float64',
+    'CivilianPopulation': 'float64',
+}
+
+# Floating-point columns
+FLOAT_DTYPES = {
+    'Employment': 'float64',
+    'LogEmployment': 'float32',
+    'Hourly_Mean_Wage': 'float32',
+    'Annual_Mean_Wage': 'float32',
+    'Teleworkable': 'float32',
+    **{col: 'float32' for col in SCORE_COLUMNS},
+    **STATE_CONTROL_DTYPES,
+}
+
+
+def natural_sort_key(value):
+    """Sort key putting all-digit codes first, by numeric value."""
+    text = str(value)
+    if text.isdigit():
+        return (0, int(text), text)
+    return (1, 0, text)
+
+
+def to_categorical(series, natural=False):
+    """
+    Convert a column to a categorical with sorted string categories.
+
+    Args:
+        series (pd.Series): Raw or already-categorical column
+        natural (bool): Order categories with natural_sort_key (for codes)
+
+    Returns:
+        pd.Series: Categorical column
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.where(series.isna(), series.astype(str)).astype('category')
+    elif not all(isinstance(cat, str) for cat in series.cat.categories):
+        series = series.astype(object)
+        series = series.where(series.isna(), series.astype(str)).astype('category')
+
+    categories = sorted(series.cat.categories, key=natural_sort_key if natural else None)
+    return series.cat.reorder_categories(categories)
+
+
+def apply_panel_schema(df):
+    """
+    Cast panel columns to the shared schema (columns not present are skipped).
+
+    Args:
+        df (pd.DataFrame): Panel or panel chunk (modified in place)
+
+    Returns:
+        pd.DataFrame: Same frame with schema dtypes
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = to_categorical(df[col], natural=col in CODE_COLUMNS)
+
+    for col, dtype in INTEGER_DTYPES.items():
+        if col in df.columns:
+            df[col] = df[col].astype(dtype)
+
+    for col, dtype in FLOAT_DTYPES.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
+
+    for col in df.columns:
+        if str(col).startswith(EXPOSURE_VINTAGE_PREFIX) and col not in FLOAT_DTYPES:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+
+    return df
+
+
+def csv_read_dtypes():
+    """
+    dtype argument for pd.read_csv that parses categoricals directly.
+
+    Returns:
+        dict: Column name -> 'category' for CATEGORICAL_COLUMNS
+    """
+    return {col: 'category' for col in CATEGORICAL_COLUMNS}
+
+
+def memory_usage_mb(df):
+    """Deep in-memory size of a frame in MB."""
+    return df.memory_usage(deep=True).sum() / 1024 / 1024
@@ -0,0 +1,189 @@
+"""
+Occupation Score Registry
+=========================
+
+Reference score tables loaded from versioned files under data/reference/
+instead of module-level literals:
+
+- ilo_exposure: ILO generative AI exposure by 4-digit ISCO-08 code
+  (ilo_exposure_<vintage>.csv; wp140 = ILO Working Paper 140, 2025)
+- ilo_exposure_major_group: ILO generative AI exposure by 2-digit SOC major
+  group (ilo_exposure_major_group_<vintage>.csv; wp96 = ILO Working Paper
+  96, Gmyrek et al. 2023, mapped to SOC major groups)
+- frey_osborne: Frey & Osborne (2017) probability of computerization by
+  2010 SOC code (frey_osborne_<vintage>.csv)
+- occupation_name_mappings.csv: panel occupation name -> SOC title(s),
+  used to match 2018-2024 names to SOC-titled scores
+
+A table file is named '<table>_<vintage>.csv' (or .parquet), so a new
+vintage is added by dropping a file next to the existing ones and
+selecting it by name; SCORE_TABLES gives the default vintage of each table.
+
+Tables are read on first use and cached for the life of the process. For
+lookups each table is also kept as a sorted code array with a matching
+value array, so a vector of codes resolves with one np.searchsorted.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# Paths
+REFERENCE_DIR = Path(__file__).parent.parent / 'data' / 'reference'
+NAME_MAPPINGS_PATH = REFERENCE_DIR / 'occupation_name_mappings.csv'
+
+# Table name -> code column, score column and default vintage
+SCORE_TABLES = {
+    'ilo_exposure': {'key': 'ISCO_Code', 'value': 'Score', 'default': 'wp140'},
+    'ilo_exposure_major_group': {'key': 'SOC_Major_Group', 'value': 'Score', 'default': 'wp96'},
+    'frey_osborne': {'key': 'SOC_Code', 'value': 'Probability', 'default': '2017'},
+}
+
+# Supported reference file formats, in order of preference
+REFERENCE_SUFFIXES = ('.parquet', '.csv')
+
+
+def available_vintages(name):
+    """
+    Vintages of a score table present under REFERENCE_DIR.
+
+    Args:
+        name (str): SCORE_TABLES name
+
+    Returns:
+        list: Sorted vintage names
+    """
+    # Files of tables whose name extends this one (ilo_exposure_major_group_*)
+    longer = [other for other in SCORE_TABLES if other != name and other.startswith(f'{name}_')]
+    return sorted({path.stem[len(name) + 1:] for path in REFERENCE_DIR.glob(f'{name}_*')
+                   if path.suffix in REFERENCE_SUFFIXES
+                   and not any(path.stem.startswith(f'{other}_') for other in longer)})
+
+
+def reference_path(name, vintage=None):
+    """
+    File holding a vintage of a score table.
+
+    Args:
+        name (str): SCORE_TABLES name
+        vintage (str): Vintage (default: the table's default vintage)
+
+    Returns:
+        Path: Reference file
+
+    Raises:
+        KeyError: Unknown table
+        FileNotFoundError: No file for the vintage
+    """
+    if name not in SCORE_TABLES:
+        raise KeyError(f"Unknown score table '{name}' (choose from {', '.join(SCORE_TABLES)})")
+    vintage = vintage or SCORE_TABLES[name]['default']
+
+    for suffix in REFERENCE_SUFFIXES:
+        path = REFERENCE_DIR / f'{name}_{vintage}{suffix}'
+        if path.exists():
+            return path
+    raise FileNotFoundError(f"No '{vintage}' vintage of {name} in {REFERENCE_DIR} "
+                            f"(available: {', '.join(available_vintages(name)) or 'none'})")
+
+
+def _read_reference(path, code_column):
+    """Read a CSV or Parquet reference file, keeping codes as strings."""
+    if path.suffix == '.parquet':
+        df = pd.read_parquet(path)
+        df[code_column] = df[code_column].astype(str)
+        return df
+    return pd.read_csv(path, dtype={code_column: str})
+
+
+def load_score_table(name, vintage=None):
+    """
+    Load a vintage of a score table (cached; do not modify the result).
+
+    Args:
+        name (str): SCORE_TABLES name
+        vintage (str): Vintage (default: the table's default vintage)
+
+    Returns:
+        pd.DataFrame: The reference file in file order
+    """
+    return _load_score_table(name, vintage or SCORE_TABLES[name]['default'])
+
+
+@lru_cache(maxsize=None)
+def _load_score_table(name, vintage):
+    return _read_reference(reference_path(name, vintage), SCORE_TABLES[name]['key'])
+
+
+@lru_cache(maxsize=None)
+def _score_index(name, vintage):
+    """Sorted code array and the matching score array of a table."""
+    spec = SCORE_TABLES[name]
+    table = _load_score_table(name, vintage)
+    table = table.drop_duplicates(spec['key'], keep='last').sort_values(spec['key'])
+    return (table[spec['key']].to_numpy(dtype=str),
+            table[spec['value']].to_numpy(dtype=float))
+
+
+def lookup_scores(name, codes, vintage=None):
+    """
+    Scores of a vector of codes.
+
+    Args:
+        name (str): SCORE_TABLES name
+        codes (array-like): Codes to look up (missing values give NaN)
+        vintage (str): Vintage (default: the table's default vintage)
+
+    Returns:
+        np.ndarray: Score per code (NaN where the code is not in the table)
+    """
+    keys, values = _score_index(name, vintage or SCORE_TABLES[name]['default'])
+    query = pd.Series(codes, dtype=object).fillna('').astype(str).to_numpy(dtype=str)
+    if not len(keys):
+        return np.full(len(query), np.nan)
+
+    position = np.searchsorted(keys, query).clip(max=len(keys) - 1)
+    return np.where(keys[position] == query, values[position], np.nan)
+
+
+def score_dict(name, vintage=None):
+    """
+    Code -> score dict of a score table.
+
+    Args:
+        name (str): SCORE_TABLES name
+        vintage (str): Vintage (default: the table's default vintage)
+
+    Returns:
+        dict: Code -> score
+    """
+    keys, values = _score_index(name, vintage or SCORE_TABLES[name]['default'])
+    return dict(zip(keys.tolist(), values.tolist()))
+
+
+@lru_cache(maxsize=None)
+def _occupation_name_mappings():
+    mappings = pd.read_csv(NAME_MAPPINGS_PATH, dtype=str)
+    return {name: tuple(titles) for name, titles
+            in mappings.groupby('Occupation', sort=False)['SOC_Title']}
+
+
+def occupation_name_mappings():
+    """
+    Panel occupation name -> SOC title(s) for 2018-2024 name matching.
+
+    Returns:
+        dict: Panel name -> list of SOC titles, in file order
+    """
+    return {name: list(titles) for name, titles in _occupation_name_mappings().items()}
+
+
+def clear_cache():
+    """Drop cached tables (e.g. after editing a reference file)."""
+    _load_score_table.cache_clear()
+    _score_index.cache_clear()
+    _occupation_name_mappings.cache_clear()
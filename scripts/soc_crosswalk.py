@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+SOC 2010 <-> 2018 Crosswalk
+===========================
+
+Harmonizes occupation codes across the SOC revision in the OES data:
+2015-2017 rows carry 2010 SOC codes, 2018-2024 rows 2018 SOC codes, while
+every occupation score source (ILO crosswalk, Dingel & Neiman, Frey &
+Osborne) is keyed by 2010 SOC.
+
+Source:
+BLS 2010 to 2018 SOC crosswalk, https://www.bls.gov/soc/2018/crosswalks_used_by_agencies.htm
+(data/soc_2010_to_2018_crosswalk.xlsx; download with
+`python scripts/soc_crosswalk.py`).
+
+Method:
+Each 2018 code links to one or more 2010 codes. When a 2018 code merges
+several 2010 codes, each link is weighted by the 2010 code's employment in
+the pre-2018 panel years (uniform if no employment is known), normalized
+within the 2018 code. A 2010-keyed score then translates to a 2018 code as
+the weighted mean over linked 2010 codes that have a score; with the links
+as a sparse key × 2010 code matrix W, S the scores and M their non-missing
+mask:
+
+    Score = (W @ S) / (W @ M)
+
+2010 codes split across several 2018 codes simply appear under each of
+them. The harmonized code of a key (Occupation_Code_2010) is its
+highest-weight 2010 code.
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+CROSSWALK_PATH = DATA_DIR / 'soc_2010_to_2018_crosswalk.xlsx'
+CROSSWALK_URL = 'https://www.bls.gov/soc/2018/soc_2010_to_2018_crosswalk.xlsx'
+
+# First panel year coded in 2018 SOC
+FIRST_SOC_2018_YEAR = 2018
+
+# Rows inspected when looking for the crosswalk header row
+HEADER_SCAN_ROWS = 20
+
+
+def download_soc_crosswalk(path=CROSSWALK_PATH, url=CROSSWALK_URL):
+    """
+    Download the BLS crosswalk workbook (resumable, see downloader.py).
+
+    Returns:
+        Path: Downloaded file
+    """
+    from downloader import download_file, make_session
+
+    with make_session(pool_size=1) as session:
+        download_file(session, url, path)
+    return path
+
+
+def load_soc_crosswalk(path=CROSSWALK_PATH):
+    """
+    Load the 2010 -> 2018 SOC code links.
+
+    Args:
+        path (Path): BLS crosswalk workbook
+
+    Returns:
+        pd.DataFrame: SOC_2010 and SOC_2018 columns (one row per link), or
+            None if the workbook has not been downloaded
+    """
+    if not Path(path).exists():
+        return None
+
+    # The workbook starts with title rows; the header row names both vintages
+    preview = pd.read_excel(path, header=None, nrows=HEADER_SCAN_ROWS, dtype=str)
+    is_header = preview.apply(lambda col: col.str.contains('2010 SOC Code', case=False, na=False))
+    header_row = int(is_header.any(axis=1).to_numpy().argmax())
+
+    df = pd.read_excel(path, header=header_row, dtype=str)
+    df.columns = [str(col).strip() for col in df.columns]
+    code_2010 = next(col for col in df.columns if '2010' in col and 'CODE' in col.upper())
+    code_2018 = next(col for col in df.columns if '2018' in col and 'CODE' in col.upper())
+
+    links = pd.DataFrame({
+        'SOC_2010': df[code_2010].str.strip().str[:7],
+        'SOC_2018': df[code_2018].str.strip().str[:7],
+    }).dropna().drop_duplicates()
+    return links.reset_index(drop=True)
+
+
+def split_weights(links, employment_2010=None):
+    """
+    Weight of every 2010 code within each 2018 code.
+
+    Args:
+        links (pd.DataFrame): Output of load_soc_crosswalk()
+        employment_2010 (pd.Series): Employment by 2010 SOC code (optional)
+
+    Returns:
+        pd.DataFrame: SOC_2018, SOC_2010 and Weight (sums to 1 per SOC_2018)
+    """
+    weights = links[['SOC_2018', 'SOC_2010']].copy()
+    if employment_2010 is not None:
+        weights['Weight'] = weights['SOC_2010'].map(employment_2010).fillna(0).to_numpy(dtype=float)
+    else:
+        weights['Weight'] = 0.0
+
+    group = weights.groupby('SOC_2018')['Weight']
+    total = group.transform('sum')
+    count = group.transform('size')
+    weights['Weight'] = np.where(total > 0, weights['Weight'] / total.where(total > 0, 1), 1.0 / count)
+    return weights
+
+
+def harmonize(codes, years, weights):
+    """
+    Link occupation keys to weighted 2010 SOC codes.
+
+    Keys before FIRST_SOC_2018_YEAR keep their own (2010) code. Later keys
+    are linked through the crosswalk; 2018 codes absent from it keep their
+    own code.
+
+    Args:
+        codes (pd.Series): Occupation codes of the keys
+        years (pd.Series): Years of the keys
+        weights (pd.DataFrame): Output of split_weights()
+
+    Returns:
+        pd.DataFrame: Key (position in codes), SOC_2010 and Weight
+    """
+    keys = pd.DataFrame({
+        'Key': np.arange(len(codes)),
+        'Code': codes.astype(object).str[:7].to_numpy(),
+        'Post2018': (years >= FIRST_SOC_2018_YEAR).to_numpy(),
+    }).dropna(subset=['Code'])
+
+    linked = keys[keys['Post2018']].merge(weights, left_on='Code', right_on='SOC_2018', how='inner')
+    own = keys[~keys['Key'].isin(linked['Key'])].assign(SOC_2010=lambda d: d['Code'], Weight=1.0)
+
+    columns = ['Key', 'SOC_2010', 'Weight']
+    return pd.concat([own[columns], linked[columns]], ignore_index=True).sort_values('Key', kind='stable')
+
+
+def harmonized_codes(harmonized, n_keys):
+    """
+    Highest-weight 2010 SOC code of every key.
+
+    Args:
+        harmonized (pd.DataFrame): Output of harmonize()
+        n_keys (int): Number of keys
+
+    Returns:
+        np.ndarray: Object array of codes (None for keys without a code)
+    """
+    best = harmonized.sort_values(['Key', 'Weight'], ascending=[True, False], kind='stable')
+    best = best.drop_duplicates('Key')
+    codes = np.full(n_keys, None, dtype=object)
+    codes[best['Key'].to_numpy()] = best['SOC_2010'].to_numpy()
+    return codes
+
+
+def translate_scores(harmonized, n_keys, score_table):
+    """
+    Weighted 2010-keyed scores for every key.
+
+    Args:
+        harmonized (pd.DataFrame): Output of harmonize()
+        n_keys (int): Number of keys
+        score_table (pd.DataFrame): Scores indexed by 7-character 2010 SOC code
+
+    Returns:
+        pd.DataFrame: One row per key, one column per score_table column
+    """
+    soc_id, soc_codes = pd.factorize(harmonized['SOC_2010'])
+    W = sparse.csr_matrix((harmonized['Weight'].to_numpy(dtype=float),
+                           (harmonized['Key'].to_numpy(), soc_id)),
+                          shape=(n_keys, len(soc_codes)))
+
+    S = score_table[~score_table.index.duplicated(keep='last')].reindex(soc_codes).to_numpy(dtype=float)
+    M = ~np.isnan(S)
+    covered = W @ M.astype(float)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scores = np.where(covered > 0, (W @ np.nan_to_num(S)) / covered, np.nan)
+
+    return pd.DataFrame(scores, columns=score_table.columns)
+
+
+def main():
+    """Download the crosswalk and summarize it."""
+    print("=" * 80)
+    print("SOC 2010 -> 2018 CROSSWALK")
+    print("=" * 80)
+
+    if not CROSSWALK_PATH.exists():
+        print(f"Downloading {CROSSWALK_URL}...")
+        download_soc_crosswalk()
+
+    links = load_soc_crosswalk()
+    per_2018 = links.groupby('SOC_2018').size()
+    per_2010 = links.groupby('SOC_2010').size()
+
+    print(f"✓ {len(links):,} links ({per_2010.size:,} 2010 codes, {per_2018.size:,} 2018 codes)")
+    print(f"✓ 2018 codes merging several 2010 codes: {(per_2018 > 1).sum():,}")
+    print(f"✓ 2010 codes split across several 2018 codes: {(per_2010 > 1).sum():,}")
+    print(f"✓ Saved to: {CROSSWALK_PATH}")
+
+
+if __name__ == "__main__":
+    main()
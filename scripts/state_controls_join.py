@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Annual State Controls for the Occupation Panel
+==============================================
+
+Builds the annual state controls dataset that panel_io.read_panel() joins
+onto the occupation panel:
+
+- Monthly LAUS controls (data/state_controls.csv, from fetch_state_controls.py)
+  are annualized at the OEWS reference month (May)
+- Each state gets an integer State_Key (its FIPS code; 0 = national), so
+  the panel join is a gather by integer position instead of a string merge
+  over millions of rows
+- The result is written partitioned by Year next to the panel
+  (data/state_controls_annual/Year=YYYY/); the panel itself is not rewritten
+
+Usage:
+    python scripts/state_controls_join.py [--controls data/state_controls.csv]
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import sys
+from pathlib import Path
+import pandas as pd
+
+from fetch_state_controls import STATE_FIPS
+from panel_io import (CONTROLS_DATASET_DIR, begin_dataset_write, describe_state_controls,
+                      finish_dataset_write, read_panel, record_storage_metadata,
+                      write_panel_partition)
+from panel_schema import STATE_CONTROL_DTYPES
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+CONTROLS_PATH = DATA_DIR / 'state_controls.csv'
+if '--controls' in sys.argv:
+    CONTROLS_PATH = Path(sys.argv[sys.argv.index('--controls') + 1])
+
+# OEWS estimates refer to the May pay period
+REFERENCE_MONTH = 5
+
+
+def annualize_controls(controls, month=REFERENCE_MONTH):
+    """
+    One row of controls per state and year, taken at the reference month.
+
+    Args:
+        controls (pd.DataFrame): Monthly controls (State, Year, Month, ...)
+        month (int): Reference month
+
+    Returns:
+        pd.DataFrame: State_Key, State, Year and the control columns present
+    """
+    annual = controls[controls['Month'].astype(int) == month]
+    state_keys = {name: int(fips) for name, fips in STATE_FIPS.items()}
+    keys = annual['State'].astype(str).map(state_keys)
+
+    unknown = sorted(annual.loc[keys.isna(), 'State'].astype(str).unique())
+    if unknown:
+        print(f"  Warning: dropping {len(unknown)} unknown areas: {', '.join(unknown[:5])}")
+
+    value_columns = [col for col in STATE_CONTROL_DTYPES if col in annual.columns]
+    annual = annual.loc[keys.notna(), ['State', 'Year'] + value_columns].assign(
+        State_Key=keys[keys.notna()].astype('int16'), Year=lambda d: d['Year'].astype(int))
+    annual = annual.drop_duplicates(['State_Key', 'Year'], keep='last')
+    return annual[['State_Key', 'State', 'Year'] + value_columns].sort_values(
+        ['Year', 'State_Key']).reset_index(drop=True)
+
+
+def write_annual_controls(annual):
+    """
+    Replace the annual state controls dataset (one partition per year).
+
+    Args:
+        annual (pd.DataFrame): Output of annualize_controls()
+
+    Returns:
+        dict: Output of describe_state_controls()
+    """
+    tmp_dir = begin_dataset_write(CONTROLS_DATASET_DIR)
+    for year, rows in annual.groupby('Year', sort=True):
+        write_panel_partition(rows, year, tmp_dir)
+    finish_dataset_write(tmp_dir, CONTROLS_DATASET_DIR)
+    return describe_state_controls()
+
+
+def main():
+    """Main execution function."""
+    print("=" * 80)
+    print("ANNUAL STATE CONTROLS FOR THE OCCUPATION PANEL")
+    print("=" * 80)
+
+    if not CONTROLS_PATH.exists():
+        print(f"✗ {CONTROLS_PATH} not found (run fetch_state_controls.py first)")
+        sys.exit(1)
+
+    controls = pd.read_csv(CONTROLS_PATH)
+    print(f"✓ Monthly controls: {len(controls):,} rows from {CONTROLS_PATH}")
+
+    annual = annualize_controls(controls)
+    print(f"✓ Annual controls (month {REFERENCE_MONTH}): {len(annual):,} rows, "
+          f"{annual['State_Key'].nunique()} areas, {annual['Year'].min()}-{annual['Year'].max()}")
+
+    storage = write_annual_controls(annual)
+    record_storage_metadata(storage, key='state_controls')
+    print(f"✓ Saved to: {storage['path']}")
+
+    # Coverage of the joined controls on the panel
+    value_columns = storage['control_columns']
+    panel = read_panel(columns=['State', 'State_Code', 'Year'] + value_columns[:1], scores=False)
+    coverage = panel[value_columns[0]].notna().groupby(panel['Year']).mean() * 100
+
+    print("\n" + "=" * 80)
+    print(f"PANEL COVERAGE ({value_columns[0]} matched, % of rows)")
+    print("=" * 80)
+    for year, pct in coverage.items():
+        print(f"  {year}: {pct:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
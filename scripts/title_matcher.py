@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Fuzzy Occupation Title Matcher
+==============================
+
+Approximate matching of panel occupation titles to SOC titles for the
+2018-2024 years, where the panel is matched on names and exact lookups
+(plus the occupation name mappings, see score_registry.py) leave retitled
+occupations unmatched.
+
+Method:
+Titles are lower-cased, punctuation is dropped and each title is split
+into character 3-grams (with word-boundary padding, so "analysts" and
+"analyst" still share most n-grams). The SOC titles form a TF-IDF index:
+a sparse title × n-gram matrix with smoothed IDF weights and L2-normalized
+rows. Queries are vectorized with the same vocabulary, and one sparse
+product gives the cosine similarity to every SOC title; the best match and
+its similarity (Confidence, 0-1) are kept.
+
+Match table (data/occupation_title_matches.csv):
+One row per panel title that has no exact or mapped match, with the best
+SOC title, its SOC code and Confidence. Accepted is pre-filled with
+Confidence >= AUTO_ACCEPT_CONFIDENCE; reviewers can flip it, and their
+choices are kept when the table is regenerated. merge_occupation_scores.py
+uses the accepted rows for titles that are still unmatched.
+
+Usage:
+    python scripts/title_matcher.py
+
+Author: SS154 Final Project
+Date: December 2025
+"""
+
+import re
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+MATCH_TABLE_PATH = DATA_DIR / 'occupation_title_matches.csv'
+
+# Character n-gram length
+NGRAM = 3
+
+# Matches at or above this similarity are accepted without review
+AUTO_ACCEPT_CONFIDENCE = 0.90
+
+# First year matched on occupation names (see merge_occupation_scores.py)
+FIRST_NAME_MATCH_YEAR = 2018
+
+
+def normalize_title(title):
+    """Lower-case a title and replace punctuation runs with single spaces."""
+    return re.sub(r'[^a-z0-9]+', ' ', str(title).lower()).strip()
+
+
+def title_ngrams(title):
+    """Character n-grams of a normalized title, padded at word boundaries."""
+    text = f' {normalize_title(title)} '
+    return [text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)]
+
+
+def count_matrix(titles, vocabulary, grow=False):
+    """
+    Sparse title × n-gram count matrix.
+
+    Args:
+        titles (list): Titles (one row each)
+        vocabulary (dict): n-gram -> column (extended in place if grow)
+        grow (bool): Add unseen n-grams to the vocabulary (else drop them)
+
+    Returns:
+        sparse.csr_matrix: Counts
+    """
+    rows, cols = [], []
+    for i, title in enumerate(titles):
+        for gram in title_ngrams(title):
+            col = vocabulary.setdefault(gram, len(vocabulary)) if grow else vocabulary.get(gram)
+            if col is not None:
+                rows.append(i)
+                cols.append(col)
+
+    counts = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)),
+                               shape=(len(titles), len(vocabulary)))
+    counts.sum_duplicates()
+    return counts
+
+
+def l2_normalize(matrix):
+    """Scale the rows of a sparse matrix to unit length (empty rows stay zero)."""
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ matrix
+
+
+def build_title_index(titles):
+    """
+    Build the TF-IDF index over reference (SOC) titles.
+
+    Args:
+        titles (list): Reference titles
+
+    Returns:
+        dict: 'titles', 'vocabulary' (n-gram -> column), 'idf' weights and
+            the L2-normalized TF-IDF 'matrix'
+    """
+    titles = list(titles)
+    vocabulary = {}
+    counts = count_matrix(titles, vocabulary, grow=True)
+
+    # Smoothed IDF: log((1 + n) / (1 + df)) + 1
+    doc_freq = np.bincount(counts.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(titles)) / (1 + doc_freq)) + 1
+
+    return {
+        'titles': titles,
+        'vocabulary': vocabulary,
+        'idf': idf,
+        'matrix': l2_normalize(counts @ sparse.diags(idf)).tocsr(),
+    }
+
+
+def match_titles(queries, index):
+    """
+    Best reference title for every query title.
+
+    Args:
+        queries (list): Titles to match
+        index (dict): Output of build_title_index()
+
+    Returns:
+        pd.DataFrame: Query, Matched_Title and Confidence (cosine similarity)
+    """
+    queries = list(queries)
+    vectors = l2_normalize(count_matrix(queries, index['vocabulary']) @ sparse.diags(index['idf']))
+    similarity = (vectors @ index['matrix'].T).tocsr()
+
+    best = np.asarray(similarity.argmax(axis=1)).ravel()
+    confidence = similarity.max(axis=1).toarray().ravel()
+
+    return pd.DataFrame({
+        'Query': queries,
+        'Matched_Title': [index['titles'][i] for i in best],
+        'Confidence': confidence.round(4),
+    })
+
+
+def load_accepted_matches():
+    """
+    Accepted rows of the match table.
+
+    Returns:
+        dict: Normalized panel title (as in merge_occupation_scores) ->
+            normalized matched SOC title; empty if no table exists
+    """
+    if not MATCH_TABLE_PATH.exists():
+        return {}
+    table = pd.read_csv(MATCH_TABLE_PATH)
+    table = table[table['Accepted'].astype(bool)]
+    return dict(zip(table['Occupation'].str.lower().str.strip(),
+                    table['Matched_Title'].str.lower().str.strip()))
+
+
+def build_match_table(panel_titles, scores_df, reverse_mapping):
+    """
+    Fuzzy-match panel titles that have no exact or mapped SOC title.
+
+    Args:
+        panel_titles (list): Distinct panel occupation titles
+        scores_df (pd.DataFrame): Occupation scores with SOC_Code and Occupation_Title
+        reverse_mapping (dict): SOC title -> panel name (create_reverse_mapping)
+
+    Returns:
+        pd.DataFrame: Occupation, Matched_Title, SOC_Code, Confidence, Accepted
+    """
+    scores_df = scores_df.dropna(subset=['Occupation_Title']).drop_duplicates('Occupation_Title', keep='last')
+    known = set(scores_df['Occupation_Title'].str.lower().str.strip())
+
+    titles = pd.Series(sorted(set(panel_titles)), dtype=object)
+    normalized = titles.str.lower().str.strip()
+    lowered_mapping = {title: panel_name.lower() for title, panel_name in reverse_mapping.items()}
+    via_mapping = normalized.map(lowered_mapping).isin(known)
+    unmatched = titles[~normalized.isin(known) & ~via_mapping]
+
+    index = build_title_index(scores_df['Occupation_Title'])
+    matches = match_titles(unmatched, index).rename(columns={'Query': 'Occupation'})
+    matches['SOC_Code'] = matches['Matched_Title'].map(
+        scores_df.set_index('Occupation_Title')['SOC_Code'])
+    matches['Accepted'] = matches['Confidence'] >= AUTO_ACCEPT_CONFIDENCE
+
+    # Keep earlier review decisions for unchanged matches
+    if MATCH_TABLE_PATH.exists():
+        reviewed = pd.read_csv(MATCH_TABLE_PATH)
+        decisions = reviewed.set_index(['Occupation', 'Matched_Title'])['Accepted'].astype(bool)
+        keys = pd.MultiIndex.from_frame(matches[['Occupation', 'Matched_Title']])
+        previous = decisions.reindex(keys).to_numpy()
+        matches['Accepted'] = np.where(pd.isna(previous), matches['Accepted'], previous).astype(bool)
+
+    return matches[['Occupation', 'Matched_Title', 'SOC_Code', 'Confidence', 'Accepted']]
+
+
+def main():
+    """Main execution function."""
+    # Imported here: merge_occupation_scores imports this module
+    from merge_occupation_scores import SCORES_PATH, create_reverse_mapping
+    from score_registry import occupation_name_mappings
+    from panel_io import read_panel
+
+    print("=" * 80)
+    print("FUZZY OCCUPATION TITLE MATCHING")
+    print("=" * 80)
+
+    panel = read_panel(columns=['Occupation', 'Year'], scores=False)
+    panel_titles = panel.loc[panel['Year'] >= FIRST_NAME_MATCH_YEAR, 'Occupation'].dropna().unique()
+    scores_df = pd.read_csv(SCORES_PATH)
+    print(f"✓ {len(panel_titles):,} distinct panel titles ({FIRST_NAME_MATCH_YEAR}+)")
+    print(f"✓ {scores_df['Occupation_Title'].nunique():,} SOC titles")
+
+    start = time.time()
+    table = build_match_table(panel_titles, scores_df, create_reverse_mapping(occupation_name_mappings()))
+    elapsed_ms = (time.time() - start) * 1000
+
+    table.to_csv(MATCH_TABLE_PATH, index=False)
+    print(f"✓ {len(table):,} unmatched titles scored in {elapsed_ms:.0f} ms")
+    print(f"✓ {table['Accepted'].sum():,} accepted (Confidence >= {AUTO_ACCEPT_CONFIDENCE} or reviewed)")
+    print(f"✓ Saved to: {MATCH_TABLE_PATH}")
+
+    if len(table):
+        print("\nLowest-confidence matches (review these):")
+        print(table.nsmallest(10, 'Confidence').to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,467 +1,79 @@
 """
-Script to update AI_Exposure_Score in occupation_panel.csv using:
+Script to update AI_Exposure_Score in the occupation panel using:
 1. ILO 2025 AI Exposure Scores from ISCO-08 classifications
 2. ISCO to SOC crosswalk mapping
 
 Data sources:
 - ILO Working Paper 140: https://webapps.ilo.org/static/english/intserv/working-papers/wp140/index.html
+  (scores by ISCO-08 code in data/reference/ilo_exposure_wp140.csv, see score_registry.py)
 - ISCO-SOC Crosswalk: data/isco_soc_crosswalk (JOLTS) - ISCO-08 to 2010 SOC.csv
+
+Scores are resolved per (Occupation_Code, Occupation, Year) key of the
+panel under data/occupation_panel/ and written to the score sidecar
+data/occupation_scores.parquet, which panel_io.read_panel() joins on load
+(add --csv to also export data/occupation_panel.csv with the new scores).
+
+A SOC code linked to several ISCO codes gets their weighted mean score,
+computed for all SOC codes at once as a sparse SOC × ISCO weight matrix
+times the ISCO score vector. --weighting uniform|part|employment picks the
+weights (default uniform, an unweighted mean; see isco_soc_weight_matrix)
+and --compare-weightings prints the scores under all of them.
+
+--vintages wp140,wp96 (or all) also stores several exposure vintages side by
+side as float32 AI_Exposure_<VINTAGE> columns of the sidecar, from one read
+of the panel keys and one sidecar write: ISCO-keyed vintages (every
+data/reference/ilo_exposure_<vintage>.csv) share one sparse product, and
+WP96 (Gmyrek et al. 2023) is scored by SOC major group as in
+fetch_occupation_data.py.
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from scipy import sparse
+
+from occupation_dimension import KEY_COLUMNS, attach_occupation_scores
+from panel_io import PANEL_CSV_PATH, read_panel, record_storage_metadata, write_score_sidecar
+from panel_schema import EXPOSURE_VINTAGE_PREFIX
+from score_registry import available_vintages, lookup_scores, score_dict
+from soc_crosswalk import FIRST_SOC_2018_YEAR
 
 # Define paths
 DATA_DIR = Path(__file__).parent.parent / "data"
 CROSSWALK_FILE = DATA_DIR / "isco_soc_crosswalk (JOLTS) - ISCO-08 to 2010 SOC.csv"
-OCCUPATION_PANEL_FILE = DATA_DIR / "occupation_panel.csv"
-
-# ILO 2025 AI Exposure Scores (from Table A1 in the Annex)
-# Gradient 4 = Highest exposure, Gradient 3 = Significant, Gradient 2 = Moderate, Gradient 1 = Low
-# Format: ISCO_Code: Mean_Score
-# Source: ILO Working Paper 140 (2025) - Generative AI and Jobs
-ILO_SCORES = {
-    # Gradient 4 - Highest exposure, low task variability
-    "4132": 0.70,  # Data Entry Clerks
-    "4131": 0.65,  # Typists and Word Processing Operators
-    "4311": 0.64,  # Accounting and Bookkeeping Clerks
-    "4312": 0.64,  # Statistical, Finance and Insurance Clerks
-    "3311": 0.63,  # Securities and Finance Dealers and Brokers
-    "4419": 0.63,  # Clerical Support Workers Not Elsewhere Classified
-    "2413": 0.62,  # Financial Analysts
-    "4313": 0.61,  # Payroll Clerks
-    "5244": 0.61,  # Contact Centre Salespersons
-    "2513": 0.60,  # Web and Multimedia Developers
-    "3312": 0.60,  # Credit and Loans Officers
-    "4110": 0.60,  # General Office Clerks
-    "4416": 0.60,  # Personnel Clerks
-    
-    # Gradient 3 - Significant exposure
-    "2643": 0.59,  # Translators, Interpreters and Other Linguists
-    "4120": 0.58,  # Secretaries (general)
-    "4211": 0.58,  # Bank Tellers and Related Clerks
-    "4222": 0.58,  # Contact Centre Information Clerks
-    "4414": 0.58,  # Scribes and Related Workers
-    "2412": 0.57,  # Financial and Investment Advisers
-    "2514": 0.57,  # Applications Programmers
-    "2521": 0.57,  # Database Designers and Administrators
-    "2522": 0.57,  # Systems Administrators
-    "3314": 0.57,  # Statistical, Mathematical and Related Associate Professionals
-    "3331": 0.57,  # Clearing and Forwarding Agents
-    "4225": 0.57,  # Inquiry Clerks
-    "4226": 0.57,  # Receptionists (general)
-    "2120": 0.56,  # Mathematicians, Actuaries and Statisticians
-    "4221": 0.56,  # Travel Consultants and Clerks
-    "2431": 0.55,  # Advertising and Marketing Professionals
-    "2519": 0.55,  # Software and Applications Developers and Analysts NEC
-    "2622": 0.55,  # Librarians and Related Information Professionals
-    "2631": 0.55,  # Economists
-    "2641": 0.55,  # Authors and Related Writers
-    "3342": 0.55,  # Legal Secretaries
-    "4227": 0.55,  # Survey and Market Research Interviewers
-    "2112": 0.54,  # Meteorologists
-    "2642": 0.54,  # Journalists
-    "3343": 0.54,  # Administrative and Executive Secretaries
-    "4223": 0.54,  # Telephone Switchboard Operators
-    "2512": 0.53,  # Software Developers
-    "3321": 0.53,  # Insurance Representatives
-    "3344": 0.53,  # Medical Secretaries
-    "3514": 0.53,  # Web Technicians
-    "2523": 0.52,  # Computer Network Professionals
-    "3252": 0.52,  # Medical Records and Health Information Technicians
-    "2411": 0.51,  # Accountants
-    "2434": 0.51,  # ICT Sales Professionals
-    "4224": 0.51,  # Hotel Receptionists
-    "4413": 0.51,  # Coding, Proofreading and Related Clerks
-    "2433": 0.50,  # Technical and Medical Sales Professionals (excl ICT)
-    "4323": 0.50,  # Transport Clerks
-    
-    # Gradient 2 - Moderate exposure
-    "2166": 0.49,  # Graphic and Multimedia Designers
-    "2511": 0.49,  # Systems Analysts
-    "2529": 0.49,  # Database and Network Professionals NEC
-    "3313": 0.49,  # Accounting Associate Professionals
-    "3322": 0.49,  # Commercial Sales Representatives
-    "3352": 0.49,  # Government Tax and Excise Officials
-    "2153": 0.48,  # Telecommunications Engineers
-    "2632": 0.48,  # Sociologists, Anthropologists and Related Professionals
-    "3332": 0.48,  # Conference and Event Planners
-    "4213": 0.48,  # Pawnbrokers and Money-lenders
-    "1346": 0.47,  # Financial and Insurance Services Branch managers
-    "2356": 0.47,  # Information Technology Trainers
-    "2621": 0.47,  # Archivists and Curators
-    "2633": 0.47,  # Philosophers, Historians and Political Scientists
-    "2656": 0.47,  # Announcers on Radio, Television and Other Media
-    "3512": 0.47,  # ICT User Support Technicians
-    "2421": 0.46,  # Management and Organization Analysts
-    "4411": 0.46,  # Library Clerks
-    "5243": 0.46,  # Door-to-door Salespersons
-    "2423": 0.45,  # Personnel and Careers Professionals
-    "3315": 0.45,  # Valuers and Loss Assessors
-    "3353": 0.45,  # Government Social Benefits Officials
-    "4212": 0.45,  # Bookmakers, Croupiers and Related Gaming Workers
-    "1330": 0.44,  # ICT Service Managers
-    "1420": 0.44,  # Retail and Wholesale Trade Managers
-    "2165": 0.44,  # Cartographers and Surveyors
-    "3324": 0.44,  # Trade Brokers
-    "3339": 0.44,  # Business Services Agents NEC
-    "4322": 0.44,  # Production Clerks
-    "2432": 0.43,  # Public Relations Professionals
-    "3341": 0.43,  # Office Supervisors
-    "3354": 0.43,  # Government Licensing Officials
-    "3511": 0.43,  # ICT Operations Technicians
-    "3513": 0.43,  # Computer Network and Systems Technicians
-    "4214": 0.43,  # Debt Collectors and Related Workers
-    "5221": 0.43,  # Shopkeepers
-    "1219": 0.42,  # Business Services and Administration Managers NEC
-    "2152": 0.42,  # Electronics Engineers
-    "4229": 0.42,  # Client Information Workers NEC
-    "5242": 0.42,  # Sales Demonstrators
-    "1221": 0.41,  # Sales and Marketing Managers
-    "2424": 0.41,  # Training and Staff Development Professionals
-    "4412": 0.41,  # Mail Carriers and Sorting Clerks
-    "2131": 0.40,  # Biologists, Botanists, Zoologists and Related Professionals
-    
-    # Gradient 1 - Low exposure (but high task variability)
-    "2351": 0.39,  # Education Methods Specialists
-    "2634": 0.39,  # Psychologists
-    "3411": 0.39,  # Legal and Related Associate Professionals
-    "3431": 0.39,  # Photographers
-    "5230": 0.39,  # Cashiers and Ticket Clerks
-    "2111": 0.38,  # Physicists and Astronomers
-    "3141": 0.38,  # Life Science Technicians (excluding Medical)
-    "5223": 0.38,  # Shop Sales Assistants
-    "7321": 0.38,  # Pre-press Technicians
-    "9623": 0.38,  # Meter Readers and Vending-machine Collectors
-    "1411": 0.37,  # Hotel Managers
-    "3433": 0.37,  # Gallery, Museum and Library Technicians
-    "4415": 0.37,  # Filing and Copying Clerks
-    "9621": 0.37,  # Messengers, Package Deliverers and Luggage Porters
-    "3256": 0.35,  # Medical Assistants
-    "5211": 0.35,  # Stall and Market Salespersons
-    "8322": 0.28,  # Car, Taxi and Van Drivers
-    
-    # Minimal Exposure - Low overall exposure
-    "3522": 0.45,  # Telecommunications Engineering Technicians
-    "2422": 0.42,  # Policy Administration Professionals
-    "2164": 0.41,  # Town and Traffic Planners
-    "2265": 0.41,  # Dieticians and Nutritionists
-    "1223": 0.40,  # Research and Development Managers
-    "1222": 0.39,  # Advertising and Public Relations Managers
-    "2113": 0.39,  # Chemists
-    "3323": 0.39,  # Buyers
-    "3333": 0.39,  # Employment agents and contractors
-    "1112": 0.38,  # Senior Government Officials
-    "1120": 0.38,  # Managing Directors and Chief Executives
-    "1321": 0.38,  # Manufacturing Managers
-    "1324": 0.38,  # Supply, Distribution and Related Managers
-    "1349": 0.38,  # Professional Services Managers Not Elsewhere Classified
-    "2133": 0.38,  # Environmental Protection Professionals
-    "2143": 0.38,  # Environmental Engineers
-    "3114": 0.38,  # Electronics Engineering Technicians
-    "1114": 0.37,  # Senior Officials of Special-interest Organizations
-    "1211": 0.37,  # Finance Managers
-    "1344": 0.37,  # Social Welfare Managers
-    "2141": 0.37,  # Industrial and Production Engineers
-    "2161": 0.37,  # Building Architects
-    "2162": 0.37,  # Landscape Architects
-    "2310": 0.37,  # University and Higher Education Teachers
-    "2619": 0.37,  # Legal Professionals Not Elsewhere Classified
-    "2654": 0.37,  # Film, Stage and Related Directors and Producers
-    "3422": 0.37,  # Sports Coaches, Instructors and Officials
-    "3432": 0.37,  # Interior Designers and Decorators
-    "4321": 0.37,  # Stock Clerks
-    "1212": 0.36,  # Human Resource Managers
-    "1342": 0.36,  # Health Service Managers
-    "1345": 0.36,  # Education Managers
-    "1412": 0.36,  # Restaurant Managers
-    "2114": 0.36,  # Geologists and geophysicists
-    "2611": 0.36,  # Lawyers
-    "3359": 0.36,  # Government Regulatory Associate Professionals NEC
-    "5222": 0.36,  # Shop Supervisors
-    "1322": 0.35,  # Mining Managers
-    "2145": 0.35,  # Chemical Engineers
-    "2163": 0.35,  # Product and Garment Designers
-    "2320": 0.35,  # Vocational Education Teachers
-    "2354": 0.35,  # Other Music Teachers
-    "2355": 0.35,  # Other Arts Teachers
-    "3118": 0.35,  # Draughtspersons
-    "3122": 0.35,  # Manufacturing Supervisors
-    "3334": 0.35,  # Real Estate Agents and Property Managers
-    "3521": 0.35,  # Broadcasting and Audio-visual Technicians
-    "1323": 0.34,  # Construction Managers
-    "1343": 0.34,  # Aged Care Service Managers
-    "2353": 0.34,  # Other Language Teachers
-    "3155": 0.34,  # Air Traffic Safety Electronics Technicians
-    "2262": 0.33,  # Pharmacists
-    "2359": 0.33,  # Teaching Professionals Not Elsewhere Classified
-    "3412": 0.33,  # Social Work Associate Professionals
-    "1431": 0.32,  # Sports, Recreation and Cultural Centre Managers
-    "2230": 0.32,  # Traditional and Complementary Medicine Professionals
-    "3351": 0.32,  # Customs and Border Inspectors
-    "5113": 0.32,  # Travel Guides
-    "8219": 0.32,  # Assemblers Not Elsewhere Classified
-    "2655": 0.31,  # Actors
-    "3135": 0.31,  # Metal Production Process Controllers
-    "3154": 0.31,  # Air Traffic Controllers
-    "3212": 0.31,  # Medical and Pathology Laboratory Technicians
-    "7515": 0.31,  # Food and Beverage Tasters and Graders
-    "7543": 0.31,  # Product Graders and Testers (except Foods and Beverages)
-    "1341": 0.30,  # Child Care Service Managers
-    "2222": 0.30,  # Midwifery Professionals
-    "3213": 0.30,  # Pharmaceutical Technicians and Assistants
-    "3259": 0.30,  # Health Associate Professionals Not Elsewhere Classified
-    "5161": 0.30,  # Astrologers, Fortune-tellers and Related Workers
-    "9629": 0.29,  # Elementary Workers Not Elsewhere Classified
-    "2264": 0.28,  # Physiotherapists
-    "5131": 0.28,  # Waiters
-    "8171": 0.28,  # Pulp and Papermaking Plant Operators
-    "8212": 0.28,  # Electrical and Electronic Equipment Assemblers
-    "1311": 0.27,  # Agricultural and Forestry Production Managers
-    "5153": 0.27,  # Building Caretakers
-    "8211": 0.27,  # Mechanical Machinery Assemblers
-    "5112": 0.25,  # Transport Conductors
-    "5322": 0.25,  # Home-based Personal Care Workers
-    "8321": 0.25,  # Motorcycle Drivers
-    "5245": 0.24,  # Service Station Attendants
-    "8332": 0.24,  # Heavy Truck and Lorry Drivers
-    "3221": 0.22,  # Nursing Associate Professionals
-    
-    # Not Exposed - Very low or no exposure
-    "1213": 0.36,  # Policy and Planning Managers
-    "2144": 0.32,  # Mechanical Engineers
-    "3116": 0.32,  # Chemical Engineering Technicians
-    "1111": 0.31,  # Legislators
-    "2151": 0.31,  # Electrical Engineers
-    "2612": 0.31,  # Judges
-    "2142": 0.30,  # Civil Engineers
-    "2149": 0.30,  # Engineering Professionals Not Elsewhere Classified
-    "2330": 0.30,  # Secondary Education Teachers
-    "2132": 0.29,  # Farming, Forestry and Fisheries Advisers
-    "2146": 0.29,  # Mining Engineers, Metallurgists and Related Professionals
-    "2211": 0.29,  # Generalist Medical Practitioners
-    "3121": 0.29,  # Mining Supervisors
-    "3133": 0.29,  # Chemical Processing Plant Controllers
-    "3134": 0.29,  # Petroleum and Natural Gas Refining Plant Operators
-    "3152": 0.29,  # Ships' Deck Officers and Pilots
-    "2263": 0.28,  # Environmental and Occupational Health Professionals
-    "2352": 0.28,  # Special Needs Teachers
-    "2635": 0.28,  # Social Work and Counselling Professionals
-    "2652": 0.28,  # Musicians, Singers and Composers
-    "3112": 0.28,  # Civil Engineering Technicians
-    "3117": 0.28,  # Mining and metallurgical technicians
-    "3123": 0.28,  # Construction Supervisors
-    "3131": 0.28,  # Power Production Plant Operators
-    "2212": 0.27,  # Specialist Medical Practitioners
-    "3113": 0.27,  # Electrical Engineering Technicians
-    "3132": 0.27,  # Incinerator and Water Treatment Plant Operators
-    "3153": 0.27,  # Aircraft Pilots and Related Associate Professionals
-    "8132": 0.27,  # Photographic Products Machine Operators
-    "2341": 0.26,  # Primary School Teachers
-    "3111": 0.26,  # Chemical and Physical Science Technicians
-    "3115": 0.26,  # Mechanical Engineering Technicians
-    "3119": 0.26,  # Physical and Engineering Science Technicians NEC
-    "3142": 0.26,  # Agricultural Technicians
-    "5132": 0.26,  # Bartenders
-    "8121": 0.26,  # Metal Processing Plant Operators
-    "2221": 0.25,  # Nursing Professionals
-    "3423": 0.25,  # Fitness and Recreation Instructors and Programme Leaders
-    "3434": 0.25,  # Chefs
-    "5241": 0.25,  # Fashion and Other Models
-    "7322": 0.25,  # Printers
-    "7421": 0.25,  # Electronics Mechanics and Servicers
-    "2266": 0.24,  # Audiologists and Speech Therapists
-    "2267": 0.24,  # Optometrists and Ophthalmic Opticians
-    "3254": 0.24,  # Dispensing Opticians
-    "3257": 0.24,  # Environmental and Occupational Health Inspectors
-    "5246": 0.24,  # Food Service Counter Attendants
-    "5312": 0.24,  # Teachers' Aides
-    "7422": 0.24,  # ICT Installers and Servicers
-    "8131": 0.24,  # Chemical Products Plant and Machine Operators
-    "1113": 0.23,  # Traditional Chiefs and Heads of Villages
-    "2240": 0.23,  # Paramedical Practitioners
-    "3151": 0.23,  # Ships' Engineers
-    "3355": 0.23,  # Police Inspectors and Detectives
-    "3421": 0.23,  # Athletes and Sports Players
-    "8114": 0.23,  # Cement, Stone and Other Mineral Products Machine Operators
-    "1312": 0.22,  # Aquaculture and Fisheries Production Managers
-    "3211": 0.22,  # Medical Imaging and Therapeutic Equipment Technicians
-    "3253": 0.22,  # Community Health Workers
-    "3258": 0.22,  # Ambulance Workers
-    "5111": 0.22,  # Travel Attendants and Travel Stewards
-    "5151": 0.22,  # Cleaning and Housekeeping Supervisors
-    "5162": 0.22,  # Companions and Valets
-    "5212": 0.22,  # Street Food Salespersons
-    "6123": 0.22,  # Apiarists and Sericulturists
-    "6221": 0.22,  # Aquaculture Workers
-    "7323": 0.22,  # Print Finishing and Binding Workers
-    "7513": 0.22,  # Dairy Products Makers
-    "7521": 0.22,  # Wood Treaters
-    "7523": 0.22,  # Woodworking Machine Tool Setters and Operators
-    "8183": 0.22,  # Packing, Bottling and Labelling Machine Operators
-    "2342": 0.21,  # Early Childhood Educators
-    "2651": 0.21,  # Visual Artists
-    "3143": 0.21,  # Forestry Technicians
-    "5169": 0.21,  # Personal Services Workers Not Elsewhere Classified
-    "7127": 0.21,  # Air Conditioning and Refrigeration Mechanics
-    "7213": 0.21,  # Sheet Metal Workers
-    "7311": 0.21,  # Precision-instrument Makers and Repairers
-    "8112": 0.21,  # Mineral and Stone Processing Plant Operators
-    "8154": 0.21,  # Bleaching, Dyeing and Fabric Cleaning Machine Operators
-    "9331": 0.21,  # Hand and Pedal Vehicle Drivers
-    "2269": 0.20,  # Health Professionals Not Elsewhere Classified
-    "3222": 0.20,  # Midwifery Associate Professionals
-    "5152": 0.20,  # Domestic Housekeepers
-    "5165": 0.20,  # Driving Instructors
-    "5414": 0.20,  # Security Guards
-    "5419": 0.20,  # Protective Services Workers Not Elsewhere Classified
-    "6129": 0.20,  # Animal Producers Not Elsewhere Classified
-    "7222": 0.20,  # Toolmakers and Related Workers
-    "8122": 0.20,  # Metal Finishing, Plating and Coating Machine Operators
-    "8182": 0.20,  # Steam Engine and Boiler Operators
-    "8311": 0.20,  # Locomotive Engine Drivers
-    "8344": 0.20,  # Lifting Truck Operators
-    "9321": 0.20,  # Hand Packers
-    "9334": 0.20,  # Shelf Fillers
-    "9520": 0.20,  # Street Vendors (excluding Food)
-    "2653": 0.19,  # Dancers and Choreographers
-    "3230": 0.19,  # Traditional and Complementary Medicine Associate Professionals
-    "5311": 0.19,  # Child Care Workers
-    "6122": 0.19,  # Poultry Producers
-    "6130": 0.19,  # Mixed Crop and Animal Producers
-    "7232": 0.19,  # Aircraft Engine Mechanics and Repairers
-    "7315": 0.19,  # Glass Makers, Cutters, Grinders and Finishers
-    "7411": 0.19,  # Building and Related Electricians
-    "8113": 0.19,  # Well Drillers and Borers and Related Workers
-    "3214": 0.18,  # Medical and Dental Prosthetic Technicians
-    "5120": 0.18,  # Cooks
-    "5142": 0.18,  # Beauticians and Related Workers
-    "5411": 0.18,  # Fire Fighters
-    "6111": 0.18,  # Field Crop and Vegetable Growers
-    "6113": 0.18,  # Gardeners, Horticultural and Nursery Growers
-    "6223": 0.18,  # Deep-sea Fishery Workers
-    "7126": 0.18,  # Plumbers and Pipe Fitters
-    "7223": 0.18,  # Metal Working Machine Tool Setters and Operators
-    "7231": 0.18,  # Motor Vehicle Mechanics and Repairers
-    "7313": 0.18,  # Jewellery and Precious Metal Workers
-    "7314": 0.18,  # Potters and Related Workers
-    "7316": 0.18,  # Sign Writers, Decorative Painters, Engravers and Etchers
-    "7534": 0.18,  # Upholsterers and Related Workers
-    "8141": 0.18,  # Rubber Products Machine Operators
-    "8143": 0.18,  # Paper Products Machine Operators
-    "8331": 0.18,  # Bus and Tram Drivers
-    "8343": 0.18,  # Crane, hoist and related plant operators
-    "9411": 0.18,  # Fast Food Preparers
-    "9510": 0.18,  # Street and Related Service Workers
-    "9612": 0.18,  # Refuse Sorters
-    "2636": 0.17,  # Religious Professionals
-    "3255": 0.17,  # Physiotherapy Technicians and Assistants
-    "5141": 0.17,  # Hairdressers
-    "5163": 0.17,  # Undertakers and Embalmers
-    "6112": 0.17,  # Tree and Shrub Crop Growers
-    "6114": 0.17,  # Mixed Crop Growers
-    "6121": 0.17,  # Livestock and Dairy Producers
-    "6222": 0.17,  # Inland and Coastal Waters Fishery Workers
-    "7221": 0.17,  # Blacksmiths, Hammersmiths and Forging Press Workers
-    "7224": 0.17,  # Metal Polishers, Wheel Grinders and Tool Sharpeners
-    "7233": 0.17,  # Agricultural and Industrial Machinery Mechanics
-    "7412": 0.17,  # Electrical Mechanics and Fitters
-    "7512": 0.17,  # Bakers, Pastry-cooks and Confectionery Makers
-    "7532": 0.17,  # Garment and Related Patternmakers and Cutters
-    "7536": 0.17,  # Shoemakers and Related Workers
-    "8111": 0.17,  # Miners and Quarriers
-    "8142": 0.17,  # Plastic Products Machine Operators
-    "8181": 0.17,  # Glass and Ceramics Plant Operators
-    "8312": 0.17,  # Railway Brake, Signal and Switch Operators
-    "3251": 0.16,  # Dental Assistants and Therapists
-    "7522": 0.16,  # Cabinet-makers and Related Workers
-    "7541": 0.16,  # Underwater Divers
-    "8152": 0.16,  # Weaving and Knitting Machine Operators
-    "8156": 0.16,  # Shoemaking and Related Machine Operators
-    "8157": 0.16,  # Laundry Machine Operators
-    "8159": 0.16,  # Textile, Fur and Leather Products Machine Operators NEC
-    "2261": 0.15,  # Dentists
-    "5329": 0.15,  # Personal Care Workers in Health Services Not Elsewhere Classified
-    "7413": 0.15,  # Electrical Line Installers and Repairers
-    "7514": 0.15,  # Fruit, Vegetable and Related Preservers
-    "7531": 0.15,  # Tailors, Dressmakers, Furriers and Hatters
-    "8151": 0.15,  # Fibre Preparing, Spinning and Winding Machine Operators
-    "8153": 0.15,  # Sewing Machine Operators
-    "8155": 0.15,  # Fur and Leather Preparing Machine Operators
-    "8160": 0.15,  # Food and Related Products Machine Operators
-    "2250": 0.14,  # Veterinarians
-    "3240": 0.14,  # Veterinary Technicians and Assistants
-    "5164": 0.14,  # Pet Groomers and Animal Care Workers
-    "5321": 0.14,  # Health Care Assistants
-    "5412": 0.14,  # Police Officers
-    "5413": 0.14,  # Prison Guards
-    "7111": 0.14,  # House Builders
-    "7125": 0.14,  # Glaziers
-    "7312": 0.14,  # Musical Instrument Makers and Tuners
-    "7317": 0.14,  # Handicraft Workers in Wood, Basketry and Related Materials
-    "7516": 0.14,  # Tobacco Preparers and Tobacco Products Makers
-    "7549": 0.14,  # Craft and Related Workers not Elsewhere Classified
-    "8172": 0.14,  # Wood Processing Plant Operators
-    "8350": 0.14,  # Ships' Deck Crews and Related Workers
-    "9111": 0.14,  # Domestic Cleaners and Helpers
-    "9121": 0.14,  # Hand Launderers and Pressers
-    "9333": 0.14,  # Freight Handlers
-    "2659": 0.13,  # Creative and Performing Artists Not Elsewhere Classified
-    "6310": 0.13,  # Subsistence Crop Farmers
-    "6320": 0.13,  # Subsistence Livestock Farmers
-    "7115": 0.13,  # Carpenters and Joiners
-    "7121": 0.13,  # Roofers
-    "7124": 0.13,  # Insulation Workers
-    "7131": 0.13,  # Painters and Related Workers
-    "7211": 0.13,  # Metal Moulders and Coremakers
-    "7212": 0.13,  # Welders and Flame Cutters
-    "7215": 0.13,  # Riggers and Cable Splicers
-    "7234": 0.13,  # Bicycle and Related Repairers
-    "7318": 0.13,  # Handicraft Workers in Textile, Leather and Related Materials
-    "7511": 0.13,  # Butchers, Fishmongers and Related Food Preparers
-    "7544": 0.13,  # Fumigators and Other Pest and Weed Controllers
-    "8342": 0.13,  # Earthmoving and Related Plant Operators
-    "9332": 0.13,  # Drivers of Animal-drawn Vehicles and Machinery
-    "9412": 0.13,  # Kitchen Helpers
-    "3413": 0.12,  # Religious Associate Professionals
-    "6210": 0.12,  # Forestry and Related Workers
-    "6330": 0.12,  # Subsistence Mixed Crop and Livestock Farmers
-    "6340": 0.12,  # Subsistence Fishers, Hunters, Trappers and Gatherers
-    "7132": 0.12,  # Spray Painters and Varnishers
-    "7533": 0.12,  # Sewing, Embroidery and Related Workers
-    "7542": 0.12,  # Shotfirers and Blasters
-    "8341": 0.12,  # Mobile Farm and Forestry Plant Operators
-    "9112": 0.12,  # Cleaners and Helpers in Offices, Hotels and Other Establishments
-    "9212": 0.12,  # Livestock Farm Labourers
-    "9214": 0.12,  # Garden and Horticultural Labourers
-    "9329": 0.12,  # Manufacturing Labourers Not Elsewhere Classified
-    "7113": 0.11,  # Stonemasons, Stone Cutters, Splitters and Carvers
-    "7123": 0.11,  # Plasterers
-    "7214": 0.11,  # Structural Metal Preparers and Erectors
-    "7535": 0.11,  # Pelt Dressers, Tanners and Fellmongers
-    "9123": 0.11,  # Window Cleaners
-    "9213": 0.11,  # Mixed Crop and Livestock Farm Labourers
-    "9216": 0.11,  # Fishery and Aquaculture Labourers
-    "9311": 0.11,  # Mining and Quarrying Labourers
-    "9622": 0.11,  # Odd Job Persons
-    "7114": 0.10,  # Concrete Placers, Concrete Finishers and Related Workers
-    "7122": 0.10,  # Floor Layers and Tile Setters
-    "9129": 0.10,  # Other Cleaning Workers
-    "6224": 0.09,  # Hunters and Trappers
-    "7112": 0.09,  # Bricklayers and Related Workers
-    "7119": 0.09,  # Building Frame and Related Trades Workers NEC
-    "7133": 0.09,  # Building Structure Cleaners
-    "9122": 0.09,  # Vehicle Cleaners
-    "9211": 0.09,  # Crop Farm Labourers
-    "9215": 0.09,  # Forestry Labourers
-    "9312": 0.09,  # Civil Engineering Labourers
-    "9313": 0.09,  # Building Construction Labourers
-    "9611": 0.09,  # Garbage and Recycling Collectors
-    "9613": 0.09,  # Sweepers and Related Labourers
-    "9624": 0.09,  # Water and Firewood Collectors
+
+# Also export data/occupation_panel.csv
+EXPORT_CSV = "--csv" in sys.argv
+
+# Weighting of ISCO codes within a SOC code (see isco_soc_weight_matrix)
+WEIGHTINGS = ('uniform', 'part', 'employment')
+WEIGHTING = 'uniform'
+if "--weighting" in sys.argv:
+    WEIGHTING = sys.argv[sys.argv.index("--weighting") + 1]
+
+# Print SOC scores under every weighting before updating the panel
+COMPARE_WEIGHTINGS = "--compare-weightings" in sys.argv
+
+# ILO 2025 AI Exposure Scores by ISCO-08 code (Table A1 in the Annex of
+# ILO Working Paper 140) are the 'ilo_exposure' table of the score registry
+# (data/reference/ilo_exposure_<vintage>.csv); --ilo-vintage picks the vintage
+ILO_VINTAGE = None
+if "--ilo-vintage" in sys.argv:
+    ILO_VINTAGE = sys.argv[sys.argv.index("--ilo-vintage") + 1]
+
+# Exposure vintages: name -> (score registry table, vintage). Every vintage
+# of the ISCO-keyed 'ilo_exposure' table on disk is available as well
+EXPOSURE_VINTAGES = {
+    'wp140': ('ilo_exposure', 'wp140'),
+    'wp96': ('ilo_exposure_major_group', 'wp96'),
 }
 
+# Exposure vintages stored side by side (--vintages wp140,wp96 or --vintages all)
+VINTAGES = None
+if "--vintages" in sys.argv:
+    VINTAGES = sys.argv[sys.argv.index("--vintages") + 1].split(",")
+
 
 def load_crosswalk():
     """Load and process ISCO-SOC crosswalk"""
@@ -483,24 +95,122 @@ def load_crosswalk():
     return df
 
 
-def create_soc_exposure_mapping(crosswalk_df):
-    """Create mapping from SOC codes to AI exposure scores using ISCO crosswalk"""
-    print("\nCreating SOC to AI exposure score mapping...")
+def isco_soc_weight_matrix(crosswalk_df, weighting='uniform', soc_employment=None):
+    """
+    Build the sparse SOC × ISCO weight matrix of the crosswalk.
+
+    Weightings (WEIGHTINGS):
+    - uniform: every crosswalk row counts once (an unweighted mean)
+    - part: a full link counts 1; a link flagged '*' in the part column
+      (the ISCO occupation is split across several SOC codes) counts
+      1 / (number of SOC codes of that ISCO code)
+    - employment: part weights scaled by the ISCO occupation's employment,
+      estimated from soc_employment with every SOC code's employment split
+      evenly across its ISCO codes; SOC codes whose ISCO codes have no
+      employment keep their part weights
+
+    Args:
+        crosswalk_df (pd.DataFrame): Output of load_crosswalk()
+        weighting (str): One of WEIGHTINGS
+        soc_employment (pd.Series): Employment by 2010 SOC code
+            (required for 'employment')
+
+    Returns:
+        tuple: (W as sparse.csr_matrix, SOC codes of its rows, ISCO codes
+            of its columns)
+    """
+    if weighting not in WEIGHTINGS:
+        raise ValueError(f"Unknown weighting '{weighting}' (choose from {', '.join(WEIGHTINGS)})")
+
+    links = crosswalk_df[['SOC_Code', 'ISCO_Code', 'part']].dropna(subset=['SOC_Code', 'ISCO_Code'])
+    soc_id, soc_codes = pd.factorize(links['SOC_Code'], sort=True)
+    isco_id, isco_codes = pd.factorize(links['ISCO_Code'], sort=True)
+
+    if weighting == 'uniform':
+        weights = np.ones(len(links))
+    else:
+        n_soc = links.groupby('ISCO_Code')['SOC_Code'].transform('nunique').to_numpy()
+        is_part = (links['part'].astype(str).str.strip() == '*').to_numpy()
+        weights = np.where(is_part, 1.0 / n_soc, 1.0)
+
+    if weighting == 'employment':
+        if soc_employment is None:
+            raise ValueError("The 'employment' weighting needs soc_employment")
+        n_isco = links.groupby('SOC_Code')['ISCO_Code'].transform('nunique').to_numpy()
+        soc_share = links['SOC_Code'].map(soc_employment).fillna(0).to_numpy(dtype=float) / n_isco
+        isco_employment = np.bincount(isco_id, weights=soc_share, minlength=len(isco_codes))
+        scaled = weights * isco_employment[isco_id]
+        soc_total = np.bincount(soc_id, weights=scaled, minlength=len(soc_codes))
+        weights = np.where(soc_total[soc_id] > 0, scaled, weights)
+
+    W = sparse.csr_matrix((weights, (soc_id, isco_id)), shape=(len(soc_codes), len(isco_codes)))
+    return W, soc_codes, isco_codes
+
+
+def aggregate_isco_scores(W, isco_codes, vintage=None):
+    """
+    Weighted mean ISCO score of every SOC code: (W @ s) / (W @ m).
+
+    Args:
+        W (sparse.csr_matrix): Output of isco_soc_weight_matrix()
+        isco_codes (pd.Index): ISCO codes of the columns of W
+        vintage (str): ILO score vintage (default: the registry default);
+            ISCO codes without a score are left out of the weights
+
+    Returns:
+        np.ndarray: Score per SOC row of W (NaN if none of its ISCO codes
+            has a score)
+    """
+    return isco_weighted_mean(W, lookup_scores('ilo_exposure', isco_codes, vintage))
+
+
+def isco_weighted_mean(W, S):
+    """
+    (W @ S) / (W @ M) for an ISCO score vector or ISCO × vintage matrix S.
+
+    Args:
+        W (sparse.csr_matrix): Output of isco_soc_weight_matrix()
+        S (np.ndarray): Scores aligned to the columns of W (NaN = no score)
+
+    Returns:
+        np.ndarray: Weighted mean per SOC row of W (and column of S)
+    """
+    M = ~np.isnan(S)
+    covered = W @ M.astype(float)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(covered > 0, (W @ np.nan_to_num(S)) / covered, np.nan)
+
+
+def create_soc_exposure_mapping(crosswalk_df, weighting='uniform', soc_employment=None, vintage=None):
+    """
+    Create mapping from SOC codes to AI exposure scores using ISCO crosswalk
+
+    Args:
+        crosswalk_df (pd.DataFrame): Output of load_crosswalk()
+        weighting (str): ISCO weighting within a SOC code (see isco_soc_weight_matrix)
+        soc_employment (pd.Series): Employment by 2010 SOC code (for 'employment')
+        vintage (str): ILO score vintage (default: the registry default)
+
+    Returns:
+        pd.DataFrame: SOC_Code, AI_Exposure_Score and num_isco_mappings
+    """
+    print(f"\nCreating SOC to AI exposure score mapping ({weighting} ISCO weights)...")
     
     # Add AI scores to crosswalk
-    crosswalk_df['AI_Exposure_Score'] = crosswalk_df['ISCO_Code'].map(ILO_SCORES)
+    crosswalk_df['AI_Exposure_Score'] = lookup_scores('ilo_exposure', crosswalk_df['ISCO_Code'], vintage)
     
-    # Group by SOC code and calculate mean exposure score
+    # Weighted mean over the ISCO codes of each SOC code
     # (Some SOC codes map to multiple ISCO codes)
-    soc_exposure = crosswalk_df.groupby('SOC_Code').agg({
-        'AI_Exposure_Score': 'mean',
-        'ISCO_Code': 'count'  # Count number of ISCO mappings
-    }).reset_index()
-    
-    soc_exposure.columns = ['SOC_Code', 'AI_Exposure_Score', 'num_isco_mappings']
+    W, soc_codes, isco_codes = isco_soc_weight_matrix(crosswalk_df, weighting, soc_employment)
+    soc_exposure = pd.DataFrame({
+        'SOC_Code': soc_codes,
+        'AI_Exposure_Score': aggregate_isco_scores(W, isco_codes, vintage),
+        'num_isco_mappings': crosswalk_df.groupby('SOC_Code')['ISCO_Code'].count().reindex(soc_codes).to_numpy(),
+    })
     
     # Drop rows with no exposure score
-    soc_exposure = soc_exposure.dropna(subset=['AI_Exposure_Score'])
+    soc_exposure = soc_exposure.dropna(subset=['AI_Exposure_Score']).reset_index(drop=True)
     
     print(f"Created mappings for {len(soc_exposure)} SOC codes")
     print(f"Score range: {soc_exposure['AI_Exposure_Score'].min():.2f} - {soc_exposure['AI_Exposure_Score'].max():.2f}")
@@ -508,59 +218,139 @@ def create_soc_exposure_mapping(crosswalk_df):
     return soc_exposure
 
 
-def update_occupation_panel(soc_exposure_df):
-    """Update occupation_panel.csv with new AI exposure scores"""
+def compare_weightings(crosswalk_df, soc_employment=None, vintage=None):
+    """
+    SOC exposure scores under every weighting, side by side.
+
+    Args:
+        crosswalk_df (pd.DataFrame): Output of load_crosswalk()
+        soc_employment (pd.Series): Employment by 2010 SOC code ('employment'
+            is skipped without it)
+        vintage (str): ILO score vintage (default: the registry default)
+
+    Returns:
+        pd.DataFrame: SOC_Code and one AI_Exposure_Score column per weighting
+    """
+    comparison = None
+    for weighting in WEIGHTINGS:
+        if weighting == 'employment' and soc_employment is None:
+            continue
+        W, soc_codes, isco_codes = isco_soc_weight_matrix(crosswalk_df, weighting, soc_employment)
+        if comparison is None:
+            comparison = pd.DataFrame({'SOC_Code': soc_codes})
+        comparison[weighting] = aggregate_isco_scores(W, isco_codes, vintage)
+    return comparison.dropna(subset=list(comparison.columns[1:]), how='all').reset_index(drop=True)
+
+
+def exposure_vintages():
+    """
+    Exposure vintages that can be attached.
+
+    Returns:
+        dict: Vintage name -> (score registry table, vintage)
+    """
+    vintages = {vintage: ('ilo_exposure', vintage) for vintage in available_vintages('ilo_exposure')}
+    vintages.update(EXPOSURE_VINTAGES)
+    return vintages
+
+
+def vintage_column(name):
+    """Panel column of an exposure vintage (e.g. AI_Exposure_WP140)."""
+    return f"{EXPOSURE_VINTAGE_PREFIX}{name.upper()}"
+
+
+def exposure_vintage_tables(names, crosswalk_df, weighting='uniform', soc_employment=None):
+    """
+    Score tables of several exposure vintages.
+
+    All ISCO-keyed vintages are aggregated to SOC codes in one product of
+    the SOC × ISCO weight matrix with an ISCO × vintage score matrix, so
+    adding a vintage adds a column, not a pass.
+
+    Args:
+        names (list): exposure_vintages() names
+        crosswalk_df (pd.DataFrame): Output of load_crosswalk()
+        weighting (str): ISCO weighting within a SOC code (see isco_soc_weight_matrix)
+        soc_employment (pd.Series): Employment by 2010 SOC code (for 'employment')
+
+    Returns:
+        tuple: (scores of ISCO-keyed vintages indexed by 2010 SOC code,
+            scores of major-group vintages indexed by SOC major group),
+            one vintage_column() per vintage
+    """
+    vintages = exposure_vintages()
+    unknown = [name for name in names if name not in vintages]
+    if unknown:
+        raise ValueError(f"Unknown exposure vintage(s) {', '.join(unknown)} "
+                         f"(choose from {', '.join(sorted(vintages))})")
+
+    isco_names = [name for name in names if vintages[name][0] == 'ilo_exposure']
+    group_names = [name for name in names if vintages[name][0] != 'ilo_exposure']
+
+    W, soc_codes, isco_codes = isco_soc_weight_matrix(crosswalk_df, weighting, soc_employment)
+    S = np.column_stack([lookup_scores('ilo_exposure', isco_codes, vintages[name][1])
+                         for name in isco_names] or [np.empty((len(isco_codes), 0))])
+    soc_scores = pd.DataFrame(isco_weighted_mean(W, S), columns=[vintage_column(name) for name in isco_names],
+                              index=pd.Index(soc_codes, name='SOC_Code'))
+
+    group_scores = pd.DataFrame({vintage_column(name): pd.Series(score_dict(*vintages[name]))
+                                 for name in group_names})
+    return soc_scores, group_scores
+
+
+def soc_employment_from_panel():
+    """
+    Employment by 2010 SOC code from the panel years coded in 2010 SOC.
+
+    Returns:
+        pd.Series: Total employment indexed by 7-character SOC code
+    """
+    panel = read_panel(columns=['Occupation_Code', 'Year', 'Employment'], scores=False)
+    panel = panel[panel['Year'] < FIRST_SOC_2018_YEAR]
+    codes = panel['Occupation_Code'].astype(object).str[:7]
+    return panel['Employment'].groupby(codes).sum()
+
+
+def update_occupation_panel(soc_exposure_df, vintage_tables=None):
+    """
+    Update the occupation panel with new AI exposure scores
+
+    Args:
+        soc_exposure_df (pd.DataFrame): Output of create_soc_exposure_mapping()
+        vintage_tables (tuple): Output of exposure_vintage_tables(), to also
+            store those vintages (optional)
+    """
     print("\nLoading occupation panel...")
     
-    # Load the panel data
-    df = pd.read_csv(OCCUPATION_PANEL_FILE)
+    # Only the occupation keys (and employment, for crosswalk split weights)
+    # are needed; scores go to the score sidecar
+    df = read_panel(columns=KEY_COLUMNS + ['Employment'], scores=False)
     
     print(f"Loaded panel with {len(df)} rows")
     print(f"Unique occupations: {df['Occupation_Code'].nunique()}")
     print(f"Years: {sorted(df['Year'].unique())}")
     
-    # STEP 1: Update 2015-2017 data using SOC codes
+    # Scores are resolved once per distinct (Occupation_Code, Occupation, Year)
+    # key: 2018-2024 codes through the SOC 2010 -> 2018 crosswalk, or, without
+    # it, SOC code first and then occupation names matched by code
     print("\n" + "="*80)
-    print("STEP 1: Updating 2015-2017 data using SOC codes")
+    print("Matching on harmonized SOC codes")
     print("="*80)
     
-    # Extract base SOC code (first 7 characters, e.g., '11-1021' from '11-1021.00')
-    df['SOC_Base'] = df['Occupation_Code'].str[:7]
-    
-    # Create mapping dictionary from SOC codes to scores
-    score_dict = soc_exposure_df.set_index('SOC_Code')['AI_Exposure_Score'].to_dict()
-    
-    # Update AI_Exposure_Score for rows with valid SOC codes
-    df['AI_Exposure_Score'] = df['SOC_Base'].map(score_dict)
-    
-    matched_soc = df['AI_Exposure_Score'].notna().sum()
-    print(f"Matched {matched_soc:,} rows using SOC codes")
-    
-    # STEP 2: Create occupation name to score mapping from 2015-2017 data
-    print("\n" + "="*80)
-    print("STEP 2: Creating occupation name → score mapping from 2015-2017")
-    print("="*80)
-    
-    # Get unique occupation name to score mappings from years with SOC codes
-    occ_name_mapping = df[df['AI_Exposure_Score'].notna()][['Occupation', 'AI_Exposure_Score']].drop_duplicates()
-    occ_name_dict = occ_name_mapping.set_index('Occupation')['AI_Exposure_Score'].to_dict()
-    
-    print(f"Created {len(occ_name_dict)} occupation name mappings")
-    
-    # STEP 3: Apply occupation name mapping to 2018-2024 data (rows still missing scores)
-    print("\n" + "="*80)
-    print("STEP 3: Applying occupation name mapping to 2018-2024")
-    print("="*80)
-    
-    # Fill missing scores using occupation name mapping
-    missing_mask = df['AI_Exposure_Score'].isna()
-    df.loc[missing_mask, 'AI_Exposure_Score'] = df.loc[missing_mask, 'Occupation'].map(occ_name_dict)
-    
-    matched_by_name = df['AI_Exposure_Score'].notna().sum() - matched_soc
-    print(f"Additional {matched_by_name:,} rows matched using occupation names")
-    
-    # Drop temporary column
-    df = df.drop('SOC_Base', axis=1)
+    context = {'soc_exposure': soc_exposure_df}
+    sources = ['ilo']
+    vintage_columns = []
+    if vintage_tables is not None:
+        context['exposure_vintage_tables'] = vintage_tables
+        sources.append('exposure_vintages')
+        vintage_columns = [col for table in vintage_tables for col in table.columns]
+    df, dim = attach_occupation_scores(df, sources=sources, context=context)
+    
+    if context['soc_links'] is None:
+        print(f"Created {context['ilo_name_scores']['AI_Exposure_Score'].notna().sum()} occupation name mappings")
+    print(f"Matched {dim['AI_Exposure_Score'].notna().sum():,} of {len(dim):,} occupation keys")
+    for col in vintage_columns:
+        print(f"  {col}: {df[col].notna().mean()*100:.1f}% of rows, mean {df[col].mean():.3f}")
     
     # FINAL REPORT
     print("\n" + "="*80)
@@ -596,10 +386,15 @@ def update_occupation_panel(soc_exposure_df):
         for occ in unmatched_occs:
             print(f"  - {occ}")
     
-    # Save updated file
-    output_file = OCCUPATION_PANEL_FILE
-    print(f"\nSaving updated file to: {output_file}")
-    df.to_csv(output_file, index=False)
+    # Save scores to the sidecar (the panel itself is not rewritten)
+    print(f"\nSaving AI exposure scores...")
+    sidecar = write_score_sidecar(dim, ['AI_Exposure_Score'] + vintage_columns)
+    record_storage_metadata(sidecar, key='score_sidecar')
+    print(f"Saved to: {sidecar['path']} ({sidecar['n_keys']:,} occupation keys)")
+    
+    if EXPORT_CSV:
+        read_panel().to_csv(PANEL_CSV_PATH, index=False)
+        print(f"Exported panel with scores to: {PANEL_CSV_PATH}")
     
     return df
 
@@ -613,11 +408,31 @@ def main():
     # Load crosswalk
     crosswalk_df = load_crosswalk()
     
+    # Employment by SOC code, for employment-weighted ISCO aggregation
+    soc_employment = None
+    if WEIGHTING == 'employment' or COMPARE_WEIGHTINGS:
+        soc_employment = soc_employment_from_panel()
+    
+    if COMPARE_WEIGHTINGS:
+        comparison = compare_weightings(crosswalk_df, soc_employment, ILO_VINTAGE)
+        print("\nSOC AI exposure by ISCO weighting:")
+        print(comparison.describe().round(3).to_string())
+        scores = comparison.drop(columns='SOC_Code')
+        spread = scores.max(axis=1) - scores.min(axis=1)
+        print(f"SOC codes whose score changes by more than 0.05: {(spread > 0.05).sum()}")
+    
     # Create SOC exposure mapping
-    soc_exposure_df = create_soc_exposure_mapping(crosswalk_df)
+    soc_exposure_df = create_soc_exposure_mapping(crosswalk_df, WEIGHTING, soc_employment, ILO_VINTAGE)
+    
+    # Exposure vintages stored side by side
+    vintage_tables = None
+    if VINTAGES is not None:
+        names = sorted(exposure_vintages()) if VINTAGES == ['all'] else VINTAGES
+        print(f"\nExposure vintages: {', '.join(names)}")
+        vintage_tables = exposure_vintage_tables(names, crosswalk_df, WEIGHTING, soc_employment)
     
     # Update occupation panel
-    updated_df = update_occupation_panel(soc_exposure_df)
+    updated_df = update_occupation_panel(soc_exposure_df, vintage_tables)
     
     print("\n" + "=" * 80)
     print("Update completed successfully!")
@@ -0,0 +1,118 @@
+"""Tests for scripts/bls_client.py against a mocked local BLS endpoint."""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+import bls_client  # noqa: E402
+import http_cache  # noqa: E402
+from bls_client import PUBLIC_LIMITS, fetch_series, plan_batches  # noqa: E402
+
+SERIES_IDS = [f'LASST{i:02d}0000000000003' for i in range(60)]
+
+
+class MockBLSHandler(BaseHTTPRequestHandler):
+    """
+    Answers timeseries POSTs like the BLS API: one M01 point per series and
+    year, unless server.refusals still holds a refusal message to send.
+    """
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with self.server.lock:
+            self.server.requests.append(payload)
+            refusal = self.server.refusals.pop(0) if self.server.refusals else None
+
+        if refusal is not None:
+            body = {'status': 'REQUEST_NOT_PROCESSED', 'message': [refusal], 'Results': {}}
+        else:
+            years = range(int(payload['startyear']), int(payload['endyear']) + 1)
+            body = {'status': 'REQUEST_SUCCEEDED', 'message': [], 'Results': {'series': [
+                {'seriesID': series_id,
+                 'data': [{'year': str(year), 'period': 'M01', 'value': '1.0'} for year in years]}
+                for series_id in payload['seriesid']]}}
+
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_api(monkeypatch, tmp_path):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), MockBLSHandler)
+    httpd.lock = threading.Lock()
+    httpd.requests, httpd.refusals = [], []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv('BLS_API_URL', f'http://127.0.0.1:{httpd.server_address[1]}/')
+    monkeypatch.setattr(bls_client, 'BACKOFF_SECONDS', 0.0)
+    monkeypatch.setattr(http_cache, 'CACHE_DIR', tmp_path / 'http_cache')
+    monkeypatch.setattr(http_cache, 'OFFLINE', False)
+    monkeypatch.setattr(http_cache, 'DISABLED', False)
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_plan_batches_within_public_limits():
+    batches = plan_batches(SERIES_IDS, 2005, 2025, PUBLIC_LIMITS)
+
+    assert len(batches) == 9
+    assert all(len(batch['series']) <= 25 for batch in batches)
+    assert all(batch['end_year'] - batch['start_year'] < 10 for batch in batches)
+    covered = sorted((series_id, year) for batch in batches for series_id in batch['series']
+                     for year in range(batch['start_year'], batch['end_year'] + 1))
+    assert covered == sorted((series_id, year) for series_id in SERIES_IDS for year in range(2005, 2026))
+    assert len({batch['key'] for batch in batches}) == 9
+
+
+def test_retries_request_not_processed(mock_api):
+    mock_api.refusals = ['Server busy, please try again']
+
+    data, failures = fetch_series(SERIES_IDS[:3], 2020, 2021, max_workers=1)
+
+    assert failures == {}
+    assert len(mock_api.requests) == 2
+    assert sorted(data) == SERIES_IDS[:3]
+    assert [point['year'] for point in data[SERIES_IDS[0]]] == ['2020', '2021']
+
+
+def test_daily_threshold_is_not_retried(mock_api):
+    mock_api.refusals = ['daily threshold for total number of requests allocated has been reached']
+
+    data, failures = fetch_series(SERIES_IDS[:3], 2020, 2021, max_workers=1)
+
+    assert data == {}
+    assert len(failures) == 1
+    assert 'daily threshold' in next(iter(failures.values()))
+    assert len(mock_api.requests) == 1
+
+
+def test_resumes_from_checkpoints_without_requests(mock_api, tmp_path, monkeypatch):
+    checkpoint_dir = tmp_path / 'checkpoints'
+    first, failures = fetch_series(SERIES_IDS, 2005, 2025, checkpoint_dir=checkpoint_dir)
+    assert failures == {}
+    assert len(mock_api.requests) == 9
+    assert len(list(checkpoint_dir.glob('*.json'))) == 9
+
+    # Fresh HTTP cache, so only the checkpoints can answer
+    monkeypatch.setattr(http_cache, 'CACHE_DIR', tmp_path / 'empty_http_cache')
+    second, failures = fetch_series(SERIES_IDS, 2005, 2025, checkpoint_dir=checkpoint_dir)
+
+    assert failures == {}
+    assert len(mock_api.requests) == 9
+    assert second == first
+    assert all(len(points) == 21 for points in second.values())
@@ -0,0 +1,103 @@
+"""Tests for scripts/downloader.py against a local HTTP server."""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from downloader import DownloadError, download_file, download_many, make_session  # noqa: E402
+
+PAYLOAD = os.urandom(200_000)
+PAYLOAD_SHA256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves PAYLOAD at any path, honouring 'Range: bytes=N-' requests."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.ranges.append(self.headers.get('Range'))
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            range_header = self.headers.get('Range')
+            start = int(range_header.split('=')[1].split('-')[0]) if range_header else 0
+            if start >= len(PAYLOAD):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(PAYLOAD)}')
+                self.end_headers()
+                return
+            body = PAYLOAD[start:]
+            self.send_response(206 if range_header else 200)
+            if range_header:
+                self.send_header('Content-Range', f'bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), RangeHandler)
+    httpd.lock = threading.Lock()
+    httpd.ranges, httpd.active, httpd.max_active, httpd.delay = [], 0, 0, 0.0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f'http://127.0.0.1:{httpd.server_address[1]}'
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_resumes_partial_download_with_range(server, tmp_path):
+    output = tmp_path / 'file.bin'
+    (tmp_path / 'file.bin.part').write_bytes(PAYLOAD[:50_000])
+
+    with make_session(pool_size=1) as session:
+        path, digest, transferred = download_file(session, f'{server.url}/file.bin', output,
+                                                  expected_sha256=PAYLOAD_SHA256)
+
+    assert server.ranges == ['bytes=50000-']
+    assert transferred == len(PAYLOAD) - 50_000
+    assert path.read_bytes() == PAYLOAD
+    assert digest == PAYLOAD_SHA256
+    assert not (tmp_path / 'file.bin.part').exists()
+
+
+def test_rejects_sha256_mismatch(server, tmp_path):
+    output = tmp_path / 'file.bin'
+
+    with make_session(pool_size=1) as session, pytest.raises(DownloadError, match='SHA-256'):
+        download_file(session, f'{server.url}/file.bin', output, expected_sha256='0' * 64)
+
+    assert not output.exists()
+    assert not (tmp_path / 'file.bin.part').exists()
+
+
+def test_download_many_in_parallel(server, tmp_path):
+    server.delay = 0.2
+    jobs = [{'key': i, 'url': f'{server.url}/file_{i}.bin', 'path': tmp_path / f'file_{i}.bin',
+             'sha256': PAYLOAD_SHA256} for i in range(4)]
+
+    results = download_many(jobs, max_workers=4)
+
+    assert sorted(results) == [0, 1, 2, 3]
+    for job in jobs:
+        assert results[job['key']]['sha256'] == PAYLOAD_SHA256
+        assert job['path'].read_bytes() == PAYLOAD
+    assert server.max_active > 1
@@ -0,0 +1,62 @@
+"""Tests for scripts/laus_flatfiles.py on the fixture files in fixtures/laus."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from fetch_state_controls import CONTROL_DTYPES  # noqa: E402
+from laus_flatfiles import build_area_controls, read_laus_data, resolve_raw_file  # noqa: E402
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'laus'
+STATE_CONTROLS_PATH = Path(__file__).parent.parent / 'data' / 'state_controls.csv'
+
+
+@pytest.mark.parametrize('chunk_rows', [3, 1000])
+def test_drops_annual_and_seasonally_adjusted_rows(chunk_rows):
+    path = resolve_raw_file('la.data.64.County', FIXTURE_DIR)
+    assert path.suffix == '.gz'
+
+    df = read_laus_data(path, ['CN'], chunk_rows=chunk_rows)
+
+    assert set(df['Month']) == {1, 2}
+    assert df['SeriesID'].str[2].eq('U').all()
+    assert 9.9 not in df['Value'].tolist()  # seasonally adjusted
+    assert 3.3 not in df['Value'].tolist()  # M13 annual average
+    assert df['Year'].eq(2020).all()
+    assert len(df) == 8  # '-' value and unemployment counts (04) dropped
+
+
+def test_prefix_filter_keeps_requested_area_type():
+    metro = read_laus_data(FIXTURE_DIR / 'la.data.60.Metro', ['MT'])
+    assert list(metro['Area_Code'].cat.categories) == ['MT0112220000000']
+
+    wide = build_area_controls(['metro'], raw_dir=FIXTURE_DIR)
+    assert wide['Area_Code'].tolist() == ['MT0112220000000']
+    assert wide['Area_Type'].tolist() == ['metro']
+    assert wide['Area'].tolist() == ['Auburn-Opelika, AL Metropolitan Statistical Area']
+
+
+def test_measures_map_to_control_columns():
+    wide = build_area_controls(['county'], raw_dir=FIXTURE_DIR)
+    autauga = wide[(wide['Area_Code'] == 'CN0100100000000') & (wide['Month'] == 1)].iloc[0]
+
+    assert autauga['UnemploymentRate'] == pytest.approx(2.7)  # 03
+    assert autauga['Employment_LAUS'] == 25000                # 05
+    assert autauga['LaborForce'] == 25700                     # 06
+    assert autauga['State_FIPS'] == '01'
+    assert len(wide) == 3
+
+
+def test_dtypes_match_state_controls():
+    wide = build_area_controls(['county', 'metro'], raw_dir=FIXTURE_DIR)
+    state_columns = pd.read_csv(STATE_CONTROLS_PATH, nrows=0).columns.drop('State').tolist()
+
+    assert [col for col in wide.columns if col in state_columns] == state_columns
+    for col in state_columns:
+        if col in CONTROL_DTYPES:
+            assert wide[col].dtype == CONTROL_DTYPES[col], col
+    assert str(wide['Date'].dtype) == 'datetime64[ns]'
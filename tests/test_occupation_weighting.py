@@ -0,0 +1,48 @@
+"""Tests for scripts/occupation_weighting.py."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from occupation_weighting import detailed_occupation_mask, employment_weighted_scores  # noqa: E402
+
+SCORES = pd.DataFrame({'Teleworkability': [0.5]}, index=pd.Index(['11-1011'], name='SOC_Code'))
+
+
+def oes_cell(codes, groups=None):
+    """One Year × State × NAICS cell with 100 employment per occupation row."""
+    df = pd.DataFrame({'Year': 2019, 'State': 'California', 'NAICS': '511',
+                       'SOC': codes, 'Employment': 100.0})
+    if groups is not None:
+        df['O_GROUP'] = groups
+    return df
+
+
+def test_aggregate_rows_dropped_by_code():
+    oes = oes_cell(['00-0000', '11-0000', '11-1000', '11-1010', '11-1011'])
+    result = employment_weighted_scores(oes, SCORES)
+    assert len(result) == 1
+    assert result.loc[0, 'Total_Occupation_Employment'] == 100
+    assert result.loc[0, 'Coverage_Teleworkability'] == 1.0
+    assert result.loc[0, 'Teleworkability'] == 0.5
+
+
+def test_aggregate_rows_dropped_by_group_column():
+    oes = oes_cell(['00-0000', '11-0000', '11-1011', '11-2021'],
+                   ['total', 'major', 'detailed', 'detailed'])
+    result = employment_weighted_scores(oes, SCORES)
+    assert result.loc[0, 'Total_Occupation_Employment'] == 200
+    assert result.loc[0, 'Coverage_Teleworkability'] == 0.5
+
+
+def test_group_column_missing_for_some_years_falls_back_to_code():
+    oes = pd.concat([oes_cell(['00-0000', '11-1011'], ['total', 'detailed']),
+                     oes_cell(['00-0000', '11-1011']).assign(Year=2015)], ignore_index=True)
+    mask = detailed_occupation_mask(oes)
+    assert mask.tolist() == [False, True, False, True]
+    result = employment_weighted_scores(oes, SCORES)
+    np.testing.assert_array_equal(result['Total_Occupation_Employment'], [100, 100])